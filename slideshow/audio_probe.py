@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Audio Probe
+Reads audio duration, codec, sample rate and channels from container headers,
+with an ffmpeg-based fallback as a last resort, and remembers the results in
+a small sidecar index keyed by path, size and mtime.
+"""
+
+import os
+import re
+import json
+import subprocess
+import threading
+from typing import NamedTuple, Optional
+
+try:
+    from mutagen import File as AudioFile
+except ImportError:
+    AudioFile = None
+
+# Codec names for mutagen file types whose info has no codec attribute
+CODEC_NAMES = {
+    'MP3': 'mp3',
+    'AAC': 'aac',
+    'FLAC': 'flac',
+    'OggVorbis': 'vorbis',
+    'OggOpus': 'opus',
+    'WAVE': 'pcm',
+    'AIFF': 'pcm',
+}
+
+
+class AudioInfo(NamedTuple):
+    """Basic stream properties of an audio file."""
+    duration: float
+    codec: str
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+
+def probe_headers(audio_path: str) -> Optional[AudioInfo]:
+    """Read stream properties from the container headers with mutagen."""
+    if AudioFile is None:
+        return None
+    try:
+        audio_file = AudioFile(audio_path)
+    except Exception:
+        return None
+    if audio_file is None or not getattr(audio_file.info, 'length', None):
+        return None
+    info = audio_file.info
+    type_name = type(audio_file).__name__
+    codec = getattr(info, 'codec', None) or CODEC_NAMES.get(type_name, type_name.lower())
+    return AudioInfo(float(info.length), str(codec),
+                     getattr(info, 'sample_rate', None), getattr(info, 'channels', None))
+
+
+def probe_with_ffmpeg(audio_path: str) -> AudioInfo:
+    """Last resort: parse the stream summary that ffmpeg prints for an input."""
+    from ffmpeg_renderer import get_ffmpeg_exe
+
+    result = subprocess.run([get_ffmpeg_exe(), "-hide_banner", "-i", audio_path],
+                            capture_output=True, stdin=subprocess.DEVNULL)
+    output = result.stderr.decode("utf-8", "replace")
+
+    duration_match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", output)
+    if not duration_match:
+        raise ValueError(f"Could not read audio stream information from {audio_path}")
+    hours, minutes, seconds = duration_match.groups()
+    duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    codec, sample_rate, channels = "unknown", None, None
+    stream_match = re.search(r"Audio:\s*([\w.-]+)[^,]*,\s*(\d+)\s*Hz,\s*([^,\n]+)", output)
+    if stream_match:
+        codec = stream_match.group(1)
+        sample_rate = int(stream_match.group(2))
+        layout = stream_match.group(3).strip()
+        channels_match = re.match(r"(\d+) channels", layout)
+        if channels_match:
+            channels = int(channels_match.group(1))
+        else:
+            channels = {'mono': 1, 'stereo': 2}.get(layout)
+    return AudioInfo(duration, codec, sample_rate, channels)
+
+
+def probe_audio(audio_path: str) -> AudioInfo:
+    """Probe an audio file, reading headers first and running ffmpeg only if needed."""
+    return probe_headers(audio_path) or probe_with_ffmpeg(audio_path)
+
+
+class AudioProbeIndex:
+    """Cache of probe results keyed by absolute path, file size and mtime.
+
+    With an index_path the results persist in a JSON sidecar file, so batch
+    runs and repeated GUI validations never probe the same file twice.
+    """
+
+    def __init__(self, index_path: str = None):
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def get(self, audio_path: str) -> AudioInfo:
+        """Return the (possibly cached) AudioInfo for audio_path."""
+        key = os.path.abspath(audio_path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+            return AudioInfo(*entry["info"])
+
+        info = probe_audio(audio_path)
+        with self._lock:
+            self._entries[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "info": list(info)}
+            self._save()
+        return info
+
+    def __getstate__(self):
+        # Locks can't be pickled (generators are sent to worker processes)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if not self.index_path or not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}  # A damaged index is simply rebuilt
+
+    def _save(self):
+        if not self.index_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            pass  # The index is only an optimization
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Batch Renderer
+Renders many episode folders through the render scheduler, which runs as
+many episodes at once as the CPU and RAM budget allow, with a log file and
+an isolated temp directory per job, and prints a summary table at the end.
+One failing episode never aborts the others.
+
+Usage:
+    python batch_render.py episodes/ --output-dir output/
+    python batch_render.py manifest.json --concurrency 3 --memory-mb 6000
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from typing import List
+
+from audio_probe import probe_audio
+from chapters import SLIDES_SOURCE, find_script_files
+from encoder_profiles import DEFAULT_PROFILE, get_profile
+from frame_store import DEFAULT_MEMORY_BUDGET_MB
+from render_scheduler import JobCost, RenderScheduler, estimate_job_cost
+from slideshow_generator import SlideshowGenerator
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
+AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac'}
+# Manifest keys that configure an episode's SlideshowGenerator rather than its render
+GENERATOR_KEYS = ("decode_quality", "fill_mode")
+
+
+def _files_with(directory: Path, extensions) -> List[Path]:
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.iterdir() if p.is_file() and p.suffix.lower() in extensions)
+
+
+def discover_jobs(root: str, output_dir: str = "output") -> List[dict]:
+    """Find one job per subfolder of root that holds images and an audio file.
+
+    Images are taken from the folder itself or its images/ subfolder, the
+    audio file from the folder itself or its audio/ subfolder. A folder
+    with numbered script files (01_title.txt, ...) is noted as script_dir.
+    """
+    # Jobs render in worker processes that use other working directories
+    output_dir = os.path.abspath(output_dir)
+    jobs = []
+    for folder in sorted(p for p in Path(root).iterdir() if p.is_dir()):
+        image_dir = folder if _files_with(folder, IMAGE_EXTENSIONS) else folder / "images"
+        audio_files = _files_with(folder, AUDIO_EXTENSIONS) or _files_with(folder / "audio", AUDIO_EXTENSIONS)
+        if not _files_with(image_dir, IMAGE_EXTENSIONS):
+            print(f"Skipping {folder.name}: no images found")
+            continue
+        if not audio_files:
+            print(f"Skipping {folder.name}: no audio file found")
+            continue
+        job = {
+            "name": folder.name,
+            "image_dir": str(image_dir),
+            "audio_path": str(audio_files[0]),
+            "output_path": os.path.join(output_dir, f"{folder.name}.mp4"),
+        }
+        try:
+            find_script_files(str(folder))
+            job["script_dir"] = str(folder)
+        except ValueError:
+            pass
+        jobs.append(job)
+    return jobs
+
+
+def load_manifest(manifest_path: str, output_dir: str = "output") -> List[dict]:
+    """Load jobs from a JSON manifest: a list of objects with image_dir, audio_path
+    and optionally name, output_path, resolution, decode_quality, fill_mode and
+    create_slideshow_video options."""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    output_dir = os.path.abspath(output_dir)
+    jobs = []
+    for i, entry in enumerate(entries):
+        job = dict(entry)
+        if "image_dir" not in job:
+            raise ValueError(f"Manifest entry {i + 1} has no image_dir")
+        job["image_dir"] = os.path.join(base_dir, job["image_dir"])
+        if job.get("audio_path"):
+            job["audio_path"] = os.path.join(base_dir, job["audio_path"])
+        for key in ("chapters", "script_dir"):
+            if job.get(key) and job[key] != SLIDES_SOURCE:
+                job[key] = os.path.join(base_dir, job[key])
+        job.setdefault("name", Path(job["image_dir"]).name or f"job_{i + 1:03d}")
+        job["output_path"] = os.path.abspath(job.get("output_path") or os.path.join(output_dir, f"{job['name']}.mp4"))
+        jobs.append(job)
+    return jobs
+
+
+def _job_resolution(job: dict, generator_options: dict) -> tuple:
+    resolution = job.get("resolution", generator_options.get("output_resolution", (1920, 1080)))
+    if isinstance(resolution, str):
+        resolution = tuple(map(int, resolution.split('x')))
+    return tuple(resolution)
+
+
+def estimate_batch_job(job: dict, generator_options: dict, render_options: dict) -> JobCost:
+    """Estimate a job's cost from its image count, resolution and audio duration."""
+    options = dict(render_options, **job)
+    num_images = len(_files_with(Path(job["image_dir"]), IMAGE_EXTENSIONS))
+    duration = num_images * options.get("image_duration", 3.0)
+    if job.get("audio_path"):
+        try:
+            duration = probe_audio(job["audio_path"]).duration
+        except Exception:
+            pass  # The job itself reports unreadable audio
+    return estimate_job_cost(num_images, _job_resolution(job, generator_options), duration,
+                             options.get("memory_budget_mb", DEFAULT_MEMORY_BUDGET_MB),
+                             pipeline=options.get("pipeline", True))
+
+
+def _run_job(job: dict, log_dir: str, generator_options: dict, render_options: dict) -> dict:
+    """Render one job (runs in a worker process); never raises."""
+    result = {"name": job["name"], "output_path": job["output_path"], "status": "failed",
+              "profile": job.get("profile", render_options.get("profile", DEFAULT_PROFILE)),
+              "video_duration": None, "render_time": None, "file_size": None, "error": None}
+    log_path = os.path.join(log_dir, f"{job['name']}.log")
+    result["log_path"] = log_path
+
+    # Each job gets its own temp root so concurrent jobs never share scratch files
+    job_temp_dir = tempfile.mkdtemp(prefix="slideshow_job_")
+    previous_temp_dir = tempfile.tempdir
+    start = time.time()
+    with open(log_path, "w", encoding="utf-8") as log, redirect_stdout(log), redirect_stderr(log):
+        tempfile.tempdir = job_temp_dir
+        try:
+            options = dict(render_options)
+            options.update({k: v for k, v in job.items()
+                            if k not in ("name", "image_dir", "audio_path", "output_path", "resolution",
+                                         "script_dir") + GENERATOR_KEYS})
+            generator_settings = dict(generator_options, output_resolution=_job_resolution(job, generator_options))
+            generator_settings.update({k: job[k] for k in GENERATOR_KEYS if k in job})
+            generator = SlideshowGenerator(**generator_settings)
+
+            output_dir = os.path.dirname(job["output_path"])
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            summary = generator.create_slideshow_video(
+                image_dir=job["image_dir"],
+                audio_path=job.get("audio_path"),
+                output_path=job["output_path"],
+                silent_mode=options.pop("silent_mode", not job.get("audio_path")),
+                **options
+            )
+            result.update(status="done", profile=summary["profile"],
+                          video_duration=summary["video_duration"], file_size=summary["file_size"])
+        except BaseException as e:
+            traceback.print_exc()
+            result["error"] = str(e) or type(e).__name__
+        finally:
+            tempfile.tempdir = previous_temp_dir
+            shutil.rmtree(job_temp_dir, ignore_errors=True)
+    result["render_time"] = time.time() - start
+    return result
+
+
+def render_batch(jobs: List[dict], concurrency: int = None, log_dir: str = "logs",
+                 generator_options: dict = None, render_options: dict = None,
+                 cpu_threads: int = None, memory_mb: float = None) -> List[dict]:
+    """Render jobs through a RenderScheduler.
+
+    Jobs run while their estimated costs fit cpu_threads and memory_mb
+    (default: all cores and 75% of RAM), at most concurrency at a time. Each
+    job's preprocessing workers and encoder threads are pinned to its estimate.
+    generator_options are passed to SlideshowGenerator, render_options to
+    create_slideshow_video; per-job manifest keys override render_options.
+    Returns one result dict per job, in job order.
+    """
+    generator_options = dict(generator_options or {})
+    render_options = dict(render_options or {})
+    os.makedirs(log_dir, exist_ok=True)
+
+    names = set()
+    for job in jobs:
+        if job["name"] in names:
+            raise ValueError(f"Duplicate job name: {job['name']}")
+        names.add(job["name"])
+
+    results = []
+    start = time.time()
+    max_jobs = max(1, min(concurrency or len(jobs), len(jobs) or 1))
+    with RenderScheduler(cpu_threads, memory_mb, max_jobs) as scheduler:
+        print(f"Rendering {len(jobs)} episodes within {scheduler.cpu_threads} threads and "
+              f"{scheduler.memory_mb:.0f} MB RAM, at most {max_jobs} at a time")
+        futures = []
+        for job in jobs:
+            cost = estimate_batch_job(job, generator_options, render_options)
+            threads = scheduler.pinned_threads(cost)
+            options = dict(render_options)
+            options.setdefault("max_workers", threads)
+            options.setdefault("encoder_threads", threads)
+            futures.append(scheduler.submit(job["name"], cost, _run_job,
+                                            job, log_dir, generator_options, options))
+        for job, future in zip(jobs, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died (e.g. out of memory)
+                result = {"name": job["name"], "output_path": job["output_path"], "status": "failed",
+                          "profile": job.get("profile", render_options.get("profile", DEFAULT_PROFILE)),
+                          "video_duration": None, "render_time": None, "file_size": None,
+                          "error": f"Worker crashed: {e}"}
+            status = "✅" if result["status"] == "done" else "❌"
+            print(f"{status} {result['name']}" + (f": {result['error']}" if result["error"] else "") +
+                  f"  (running: {len(scheduler.running_jobs)}, queued: {scheduler.queue_depth})")
+            results.append(result)
+
+    print_summary(results, time.time() - start)
+    return results
+
+
+def print_summary(results: List[dict], wall_time: float):
+    """Print a table of profiles, durations, throughput and failures."""
+    def fmt_time(seconds):
+        if seconds is None:
+            return "-"
+        return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
+
+    print("\n" + "=" * 100)
+    print(f"{'Episode':<30}{'Status':<8}{'Profile':<14}{'Video':>8}{'Render':>9}{'Speed':>9}{'Size (MB)':>11}  Error")
+    print("-" * 100)
+    for r in results:
+        speed = (f"{r['video_duration'] / r['render_time']:.1f}x"
+                 if r["video_duration"] and r["render_time"] else "-")
+        size = f"{r['file_size'] / (1024 * 1024):.1f}" if r["file_size"] else "-"
+        error = (r["error"] or "")[:40]
+        print(f"{r['name'][:29]:<30}{r['status']:<8}{(r.get('profile') or '-')[:13]:<14}{fmt_time(r['video_duration']):>8}"
+              f"{fmt_time(r['render_time']):>9}{speed:>9}{size:>11}  {error}")
+    print("-" * 100)
+
+    done = [r for r in results if r["status"] == "done"]
+    total_video = sum(r["video_duration"] for r in done)
+    throughput = total_video / wall_time if wall_time else 0
+    print(f"Completed: {len(done)}/{len(results)}   Failed: {len(results) - len(done)}   "
+          f"Wall time: {fmt_time(wall_time)}   Throughput: {throughput:.1f}x realtime")
+    print("=" * 100)
+
+
+def main():
+    """Command line entry point for batch rendering."""
+    parser = argparse.ArgumentParser(description="Render many podcast episodes in one run")
+    parser.add_argument('source', help='Folder with one subfolder per episode, or a JSON manifest')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='Maximum episodes rendered at the same time (default: as the budget allows)')
+    parser.add_argument('--cpu-threads', type=int, default=None,
+                        help='CPU threads shared by all running episodes (default: CPU count)')
+    parser.add_argument('--memory-mb', type=float, default=None,
+                        help='RAM in MB shared by all running episodes (default: 75%% of RAM)')
+    parser.add_argument('--output-dir', default='output', help='Output folder (default: output)')
+    parser.add_argument('--log-dir', default='logs', help='Folder for per-episode logs (default: logs)')
+    parser.add_argument('--resolution', default='1920x1080', help='Output resolution (default: 1920x1080)')
+    parser.add_argument('--transition', type=float, default=0.5,
+                        help='Transition duration in seconds (default: 0.5)')
+    parser.add_argument('--engine', choices=('moviepy', 'ffmpeg', 'yuv'), default='moviepy',
+                        help='Render engine (default: moviepy)')
+    parser.add_argument('--vfr', action='store_true',
+                        help='Variable frame rate output (ffmpeg and yuv engines)')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE,
+                        help=f'Encoder profile for all episodes (default: {DEFAULT_PROFILE})')
+    parser.add_argument('--profile-config', default=None,
+                        help='JSON file overriding or adding encoder profiles')
+    parser.add_argument('--chapters', choices=('slides', 'scripts'), default=None,
+                        help='Add MP4 chapters from the slide filenames, or from the numbered '
+                             'script files (01_title.txt, ...) in each episode folder')
+    parser.add_argument('--force', action='store_true',
+                        help='Render episodes even if their outputs are up to date')
+    args = parser.parse_args()
+
+    if args.vfr and args.engine == 'moviepy':
+        print("Error: --vfr requires --engine ffmpeg or --engine yuv")
+        sys.exit(1)
+
+    try:
+        get_profile(args.profile, args.profile_config)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if os.path.isdir(args.source):
+        jobs = discover_jobs(args.source, args.output_dir)
+    else:
+        jobs = load_manifest(args.source, args.output_dir)
+    if not jobs:
+        print("Error: No episodes to render")
+        sys.exit(1)
+    for job in jobs:
+        if args.chapters == 'slides':
+            job.setdefault("chapters", SLIDES_SOURCE)
+        elif args.chapters == 'scripts':
+            if job.get("script_dir"):
+                job.setdefault("chapters", job["script_dir"])
+            else:
+                print(f"No numbered script files for {job['name']}; rendering without chapters")
+
+    results = render_batch(
+        jobs,
+        concurrency=args.concurrency,
+        log_dir=args.log_dir,
+        cpu_threads=args.cpu_threads,
+        memory_mb=args.memory_mb,
+        generator_options={"output_resolution": tuple(map(int, args.resolution.split('x')))},
+        render_options={"transition_duration": args.transition, "engine": args.engine,
+                        "force": args.force, "vfr": args.vfr, "profile": args.profile,
+                        "profile_config": args.profile_config},
+    )
+    if any(r["status"] != "done" for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
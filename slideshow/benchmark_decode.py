@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for image decode quality modes.
+Compares decode+resize time and peak memory of the "best" and "fast"
+decode paths of SlideshowGenerator.resize_image_to_fit on large JPEGs.
+
+Usage:
+    python benchmark_decode.py [--size 6000x4000] [--count 5] [--resolution 1280x720]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+
+from PIL import Image
+
+from slideshow_generator import SlideshowGenerator, DECODE_QUALITIES
+
+
+def create_large_jpeg(path: str, size):
+    """Create a detailed test photo so the JPEG decoder has real work to do."""
+    noise = Image.effect_noise(size, 64).convert('RGB')
+    gradient = Image.linear_gradient('L').resize(size).convert('RGB')
+    Image.blend(noise, gradient, 0.5).save(path, "JPEG", quality=92)
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB (None if unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return None  # Not available on Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_mode(mode, image_paths, resolution, results):
+    """Decode and resize every image in a fresh process for clean memory numbers."""
+    generator = SlideshowGenerator(output_resolution=resolution, use_cache=False,
+                                   decode_quality=mode)
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    for path in image_paths:
+        generator.resize_image_to_fit(path, resolution)
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_mb()
+    results[mode] = (elapsed, None if peak is None else peak - baseline)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark image decode quality modes")
+    parser.add_argument('--size', default='6000x4000', help='Source image size (default: 6000x4000)')
+    parser.add_argument('--count', type=int, default=5, help='Number of source images (default: 5)')
+    parser.add_argument('--resolution', default='1280x720', help='Output resolution (default: 1280x720)')
+    args = parser.parse_args()
+
+    source_size = tuple(map(int, args.size.split('x')))
+    resolution = tuple(map(int, args.resolution.split('x')))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"Creating {args.count} test images at {args.size}...")
+        template = os.path.join(temp_dir, "source_000.jpg")
+        create_large_jpeg(template, source_size)
+        image_paths = [template]
+        for i in range(1, args.count):
+            path = os.path.join(temp_dir, f"source_{i:03d}.jpg")
+            with open(template, 'rb') as src, open(path, 'wb') as dst:
+                dst.write(src.read())
+            image_paths.append(path)
+
+        manager = multiprocessing.Manager()
+        results = manager.dict()
+        for mode in DECODE_QUALITIES:
+            process = multiprocessing.Process(target=_run_mode,
+                                              args=(mode, image_paths, resolution, results))
+            process.start()
+            process.join()
+
+        print(f"\nDecode + resize of {args.count} x {args.size} JPEGs to {args.resolution}")
+        print("=" * 60)
+        print(f"{'Mode':<8}{'Total (s)':>12}{'Per image (ms)':>18}{'Peak memory (MB)':>20}")
+        for mode in DECODE_QUALITIES:
+            elapsed, peak = results[mode]
+            peak_str = f"{peak:.0f}" if peak is not None else "n/a"
+            print(f"{mode:<8}{elapsed:>12.2f}{elapsed / args.count * 1000:>18.0f}{peak_str:>20}")
+
+        best, fast = results["best"][0], results["fast"][0]
+        print("=" * 60)
+        print(f"fast mode speedup: {best / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the frame pipe into ffmpeg.
+Compares RGB24 frames (as moviepy writes them: a copy per frame, converted
+to yuv420p by ffmpeg) with the YUV420 path (slides converted once, still
+frames written as-is, crossfades blended in YUV).
+
+Usage:
+    python benchmark_pipe.py [--resolution 1920x1080] [--seconds 20] [--encode]
+"""
+
+import os
+import time
+import argparse
+import subprocess
+
+import numpy as np
+
+from ffmpeg_renderer import FFmpegRenderer
+from timeline import SlideTimeline
+from yuv_pipe import YUVPipeEncoder, YUVTimeline, yuv420_frame_size
+
+FPS = 24
+TIME_PER_SLIDE = 5.0
+TRANSITION = 0.5
+
+
+def make_frames(count, width, height):
+    rng = np.random.default_rng(42)
+    return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def output_args(encode):
+    """Encode with x264 (ultrafast) or just decode the pipe into the null muxer."""
+    if encode:
+        return ["-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p", "-f", "null", "-"]
+    return ["-pix_fmt", "yuv420p", "-f", "null", "-"]
+
+
+def pipe_frames(cmd, frames_iter):
+    """Write every frame to ffmpeg's stdin; returns (seconds, bytes written)."""
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+    written = 0
+    start = time.perf_counter()
+    for data in frames_iter:
+        process.stdin.write(data)
+        written += data.nbytes if isinstance(data, np.ndarray) else len(data)
+    process.stdin.close()
+    process.wait()
+    return time.perf_counter() - start, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RGB24 versus YUV420 frame pipes into ffmpeg")
+    parser.add_argument('--resolution', default='1920x1080', help='Frame size WxH (default: 1920x1080)')
+    parser.add_argument('--seconds', type=float, default=20.0, help='Video length to pipe (default: 20)')
+    parser.add_argument('--encode', action='store_true', help='Encode with x264 ultrafast instead of discarding frames')
+    args = parser.parse_args()
+
+    width, height = map(int, args.resolution.lower().split('x'))
+    count = max(2, int(args.seconds / TIME_PER_SLIDE))
+    frames = make_frames(count, width, height)
+    durations = [TIME_PER_SLIDE] * count
+    num_frames = int(round(sum(durations) * FPS))
+    renderer = FFmpegRenderer(fps=FPS)
+    size = f"{width}x{height}"
+
+    rgb_timeline = SlideTimeline(frames, durations, TRANSITION, fps=FPS)
+    rgb_cmd = [renderer.ffmpeg, "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24",
+               "-s", size, "-r", str(FPS), "-i", "pipe:0"] + output_args(args.encode)
+    rgb_time, rgb_bytes = pipe_frames(
+        rgb_cmd, (rgb_timeline.get_frame(k / FPS).tobytes() for k in range(num_frames)))
+
+    yuv_timeline = YUVTimeline(frames, durations, TRANSITION, fps=FPS)
+    yuv_cmd = YUVPipeEncoder(renderer, (width, height)).build_command(os.devnull)
+    yuv_cmd = yuv_cmd[:yuv_cmd.index("pipe:0") + 1] + output_args(args.encode)
+    yuv_time, yuv_bytes = pipe_frames(
+        yuv_cmd, (yuv_timeline.get_frame(k / FPS) for k in range(num_frames)))
+
+    print(f"{num_frames} frames at {size}, {count} slides, "
+          f"{'x264 ultrafast' if args.encode else 'no encoding'}")
+    print(f"{'Pipe':>8}{'bytes/frame':>14}{'frames/s':>12}{'MB/s':>10}{'total (s)':>12}")
+    print("=" * 56)
+    for name, seconds, written, frame_bytes in (
+            ("rgb24", rgb_time, rgb_bytes, width * height * 3),
+            ("yuv420p", yuv_time, yuv_bytes, yuv420_frame_size(width, height))):
+        print(f"{name:>8}{frame_bytes:>14}{num_frames / seconds:>12.1f}"
+              f"{written / seconds / 1024 / 1024:>10.1f}{seconds:>12.2f}")
+    print(f"Speedup: {rgb_time / yuv_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
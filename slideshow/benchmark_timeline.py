@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark for per-frame lookup cost versus slide count.
+Compares moviepy's compose-mode concatenation with SlideTimeline.
+
+Usage:
+    python benchmark_timeline.py [--counts 10,100,500] [--frames 200]
+"""
+
+import time
+import random
+import argparse
+
+import numpy as np
+
+from slideshow_generator import mp
+from timeline import SlideTimeline
+
+# Tiny slides so the measurement is dominated by lookup, not pixel copies
+SLIDE_SIZE = (32, 18)
+TIME_PER_SLIDE = 3.0
+TRANSITION = 0.5
+
+
+def make_frames(count):
+    return [np.full((SLIDE_SIZE[1], SLIDE_SIZE[0], 3), i % 256, dtype=np.uint8)
+            for i in range(count)]
+
+
+def time_per_frame(get_frame, duration, num_frames):
+    """Average seconds per get_frame call over random timestamps."""
+    rng = random.Random(42)
+    times = [rng.uniform(0, duration) for _ in range(num_frames)]
+    start = time.perf_counter()
+    for t in times:
+        get_frame(t)
+    return (time.perf_counter() - start) / num_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-frame cost versus slide count")
+    parser.add_argument('--counts', default='10,100,500', help='Slide counts (default: 10,100,500)')
+    parser.add_argument('--frames', type=int, default=200, help='Frames sampled per run (default: 200)')
+    args = parser.parse_args()
+
+    print(f"{'Slides':>8}{'compose (ms/frame)':>22}{'timeline (ms/frame)':>22}{'speedup':>10}")
+    print("=" * 62)
+    for count in map(int, args.counts.split(',')):
+        frames = make_frames(count)
+
+        clips = []
+        for i, frame in enumerate(frames):
+            clip = mp.ImageClip(frame, duration=TIME_PER_SLIDE)
+            if i > 0:
+                clip = clip.crossfadein(TRANSITION)
+            clips.append(clip)
+        video = mp.concatenate_videoclips(clips, method="compose")
+        compose = time_per_frame(video.get_frame, video.duration, args.frames)
+
+        timeline = SlideTimeline(frames, [TIME_PER_SLIDE] * count, TRANSITION)
+        fast = time_per_frame(timeline.get_frame, timeline.duration, args.frames)
+
+        print(f"{count:>8}{compose * 1000:>22.3f}{fast * 1000:>22.3f}{compose / fast:>9.0f}x")
+        video.close()
+
+
+if __name__ == "__main__":
+    main()
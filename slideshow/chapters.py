@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Chapters
+Builds MP4 chapter markers for an episode, either one per slide (titled
+from the image filenames) or one per numbered script file (e.g.
+01_บทนำ_....txt, 02_....txt), and writes them as an ffmpeg metadata file.
+"""
+
+import os
+import re
+from typing import List, NamedTuple, Sequence
+
+# Chapter source that titles chapters from the slide filenames
+SLIDES_SOURCE = "slides"
+# Leading section number and separators of a file name, e.g. "01_" or "02 - "
+NUMBERED_NAME = re.compile(r"^(\d+)[\s._-]*(.*)$")
+
+
+class Chapter(NamedTuple):
+    """A chapter from start to end (seconds)."""
+    start: float
+    end: float
+    title: str
+
+
+def chapter_title(path: str, fallback: str) -> str:
+    """Title from a file name without its number and extension: "01_บทนำ_x.txt" -> "บทนำ x"."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    match = NUMBERED_NAME.match(stem)
+    if match:
+        stem = match.group(2)
+    title = " ".join(re.split(r"[_\s]+", stem)).strip(" -.")
+    return title or fallback
+
+
+def slide_chapters(image_files: Sequence[str], starts: Sequence[float], duration: float) -> List[Chapter]:
+    """One chapter per slide starting at starts[i]; consecutive slides with the same title are merged."""
+    chapters = []
+    for i, (path, start) in enumerate(zip(image_files, starts)):
+        if start >= duration:
+            break
+        title = chapter_title(path, f"Slide {i + 1}")
+        if chapters and chapters[-1].title == title:
+            continue
+        if chapters:
+            chapters[-1] = chapters[-1]._replace(end=start)
+        chapters.append(Chapter(start, duration, title))
+    return chapters
+
+
+def find_script_files(script_dir: str) -> List[str]:
+    """Numbered .txt files of script_dir in section order."""
+    if not os.path.isdir(script_dir):
+        raise FileNotFoundError(f"Script directory not found: {script_dir}")
+    numbered = []
+    for name in os.listdir(script_dir):
+        match = NUMBERED_NAME.match(name)
+        if match and name.lower().endswith(".txt"):
+            numbered.append((int(match.group(1)), name))
+    if not numbered:
+        raise ValueError(f"No numbered script files (e.g. 01_title.txt) found in {script_dir}")
+    return [os.path.join(script_dir, name) for _, name in sorted(numbered)]
+
+
+def script_chapters(script_dir: str, duration: float, slide_starts: Sequence[float] = None) -> List[Chapter]:
+    """One chapter per numbered script file of script_dir.
+
+    The narration is one audio file, so each section's start is estimated
+    from the length of the scripts before it (speech time follows the text).
+    With slide_starts, every start moves to the nearest slide change after
+    the previous chapter, so chapters begin on a keyframe and a new slide.
+    """
+    paths = find_script_files(script_dir)
+    lengths = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lengths.append(max(1, len("".join(f.read().split()))))
+    total = sum(lengths)
+
+    starts = []
+    position = 0
+    for length in lengths:
+        starts.append(duration * position / total)
+        position += length
+    if slide_starts is not None and len(slide_starts) >= len(starts):
+        snapped = []
+        for start in starts:
+            candidates = [s for s in slide_starts if s < duration and (not snapped or s > snapped[-1])]
+            if not candidates:
+                break
+            snapped.append(min(candidates, key=lambda s: abs(s - start)))
+        if len(snapped) == len(starts):
+            starts = snapped
+
+    ends = starts[1:] + [duration]
+    return [Chapter(start, end, chapter_title(path, f"Chapter {i + 1}"))
+            for i, (path, start, end) in enumerate(zip(paths, starts, ends))]
+
+
+def _escape(value: str) -> str:
+    # ffmetadata escapes '=', ';', '#', '\' and newlines with a backslash
+    return re.sub(r"([=;#\\\n])", r"\\\1", value)
+
+
+def write_ffmetadata(chapters: Sequence[Chapter], path: str):
+    """Write chapters as an ffmpeg metadata file (millisecond timebase)."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(";FFMETADATA1\n")
+        for chapter in chapters:
+            f.write("[CHAPTER]\nTIMEBASE=1/1000\n")
+            f.write(f"START={int(round(chapter.start * 1000))}\nEND={int(round(chapter.end * 1000))}\n")
+            f.write(f"title={_escape(chapter.title)}\n")
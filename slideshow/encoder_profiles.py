@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Encoder Profiles
+Named speed/size trade-offs for the video encoder: x264 preset, CRF or
+bitrate, tuning, keyframe interval, frame rate and encoder threads. The
+built-in profiles can be changed, and new ones added, in a JSON config file.
+"""
+
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional
+
+# Profile used when none is selected
+DEFAULT_PROFILE = "standard"
+# Config file looked up next to the scripts when no other is given
+PROFILE_CONFIG_NAME = "encoder_profiles.json"
+
+
+class EncoderProfile(NamedTuple):
+    """Encoder settings of one profile.
+
+    With crf, bitrate caps the rate (constrained quality); without crf it
+    is the target bitrate. gop_seconds is the keyframe interval and
+    threads None lets the encoder decide.
+    """
+    name: str
+    preset: str = "medium"
+    crf: Optional[int] = 23
+    bitrate: Optional[str] = None  # e.g. "800k" or "2M"
+    tune: Optional[str] = "stillimage"
+    gop_seconds: Optional[float] = 10.0
+    fps: int = 24
+    threads: Optional[int] = None
+
+    def codec_args(self, fps: float = None, preset: bool = True, vfr: bool = False) -> List[str]:
+        """x264 options for this profile (without the preset if preset is False).
+
+        For variable frame rate output (vfr), x264's rate control treats
+        every frame as 1/fps long, as it would at a constant frame rate,
+        instead of spending more bits on frames that are held longer; the
+        renderer forces the keyframes every gop_seconds of video time.
+        """
+        args = ["-preset", self.preset] if preset else []
+        if self.crf is not None:
+            args += ["-crf", str(self.crf)]
+            if self.bitrate:
+                args += ["-maxrate", self.bitrate, "-bufsize", str(2 * parse_bitrate(self.bitrate))]
+        elif self.bitrate:
+            args += ["-b:v", self.bitrate]
+        if self.tune:
+            args += ["-tune", self.tune]
+        if self.gop_seconds:
+            args += ["-g", str(max(1, int(round(self.gop_seconds * (fps or self.fps)))))]
+        if vfr:
+            args += ["-x264-params", "force-cfr=1"]
+        return args
+
+
+BUILTIN_PROFILES = {
+    # Fastest encode for checking a render; also used by previews
+    "draft": EncoderProfile("draft", preset="ultrafast", crf=30, fps=12),
+    "standard": EncoderProfile("standard"),
+    # High quality master copy
+    "archive": EncoderProfile("archive", preset="slow", crf=18, gop_seconds=5.0),
+    # Small files for slow connections and upload limits
+    "small-upload": EncoderProfile("small-upload", preset="slow", crf=28, bitrate="1M"),
+}
+
+
+def parse_bitrate(bitrate: str) -> int:
+    """Bits per second of an ffmpeg rate such as "800k", "1.5M" or "96000"."""
+    text = str(bitrate).strip().lower()
+    scale = {"k": 1000, "m": 1000 ** 2}.get(text[-1:], 1)
+    if scale > 1:
+        text = text[:-1]
+    try:
+        return int(float(text) * scale)
+    except ValueError:
+        raise ValueError(f"Invalid bitrate: {bitrate}") from None
+
+
+def default_config_path() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), PROFILE_CONFIG_NAME)
+
+
+def load_profiles(config_path: str = None) -> Dict[str, EncoderProfile]:
+    """Built-in profiles updated from a JSON config file.
+
+    The file maps profile names to the fields to change, e.g.
+    {"standard": {"crf": 21}, "podcast": {"base": "small-upload", "fps": 15}}.
+    A new profile starts from "base" (default: standard). Without
+    config_path, encoder_profiles.json next to the scripts is used if present.
+    """
+    profiles = dict(BUILTIN_PROFILES)
+    if config_path is None:
+        config_path = default_config_path()
+        if not os.path.exists(config_path):
+            return profiles
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"{config_path}: expected an object mapping profile names to settings")
+
+    fields = set(EncoderProfile._fields) - {"name"}
+    for name, settings in config.items():
+        settings = dict(settings)
+        base = profiles.get(name) or profiles.get(settings.get("base", DEFAULT_PROFILE))
+        if base is None:
+            raise ValueError(f"{config_path}: profile '{name}' has unknown base '{settings['base']}'")
+        settings.pop("base", None)
+        unknown = set(settings) - fields
+        if unknown:
+            raise ValueError(f"{config_path}: unknown settings for profile '{name}': {', '.join(sorted(unknown))}")
+        profile = base._replace(name=name, **settings)
+        if profile.bitrate:
+            parse_bitrate(profile.bitrate)
+        profiles[name] = profile
+    return profiles
+
+
+def get_profile(name: str = None, config_path: str = None) -> EncoderProfile:
+    """Look up a profile by name (default: standard)."""
+    profiles = load_profiles(config_path)
+    name = name or DEFAULT_PROFILE
+    if name not in profiles:
+        raise ValueError(f"Unknown encoder profile '{name}'; choose from: {', '.join(profiles)}")
+    return profiles[name]
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+FFmpeg Render Engine
+Renders a slideshow by handing ffmpeg the slide list and durations directly,
+so Python never touches individual video frames.
+"""
+
+import os
+import shutil
+import subprocess
+from typing import List, Tuple
+
+from PIL import Image
+
+from audio_probe import probe_audio
+from timeline import vfr_frame_numbers
+
+# With variable frame rate output, a held slide repeats its frame this often
+# (seconds) so players and seeking stay responsive
+VFR_HOLD_SECONDS = 1.0
+
+
+def get_ffmpeg_exe() -> str:
+    """Locate ffmpeg: the binary bundled with imageio-ffmpeg first, then PATH."""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        pass
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    raise FileNotFoundError("FFmpeg not found. Install FFmpeg or run: pip install imageio-ffmpeg")
+
+
+def is_mp4_compatible_audio(audio_path: str, audio_info=None) -> bool:
+    """True if the audio is AAC and can be stream-copied into an MP4 as-is."""
+    try:
+        codec = (audio_info or probe_audio(audio_path)).codec.lower()
+    except Exception:
+        return False
+    # mp4a.* inside MP4/M4A; raw ADTS AAC gets its headers converted while muxing
+    return codec.startswith("mp4a") or codec == "aac"
+
+
+def is_complete_mp4(path: str) -> bool:
+    """Cheap integrity check: the top-level MP4 boxes span the whole file and include moov and mdat."""
+    try:
+        file_size = os.path.getsize(path)
+        boxes = set()
+        with open(path, "rb") as f:
+            position = 0
+            while position < file_size:
+                f.seek(position)
+                header = f.read(16)
+                if len(header) < 8:
+                    return False
+                size = int.from_bytes(header[:4], "big")
+                boxes.add(header[4:8])
+                if size == 1:  # 64-bit box size
+                    if len(header) < 16:
+                        return False
+                    size = int.from_bytes(header[8:16], "big")
+                elif size == 0:  # Box runs to the end of the file
+                    size = file_size - position
+                if size < 8:
+                    return False
+                position += size
+        return position == file_size and b"moov" in boxes and b"mdat" in boxes
+    except OSError:
+        return False
+
+
+def run_ffmpeg(cmd: List[str], total_duration: float, progress_callback=None,
+               progress_range: Tuple[float, float] = (85, 99), message: str = "Rendering video",
+               cwd: str = None, log_path: str = None):
+    """Run an ffmpeg command, forwarding its progress to progress_callback.
+
+    The command must not set its own -progress option. If progress_callback
+    raises (e.g. the GUI's Stop button), ffmpeg is killed and the error re-raised.
+    """
+    cmd = [cmd[0], "-hide_banner", "-nostats", "-progress", "pipe:1"] + cmd[1:]
+    log_file = open(log_path, "wb") if log_path else subprocess.DEVNULL
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=log_file,
+                                   stdin=subprocess.DEVNULL, cwd=cwd)
+        last_percent = -1
+        try:
+            for raw_line in process.stdout:
+                line = raw_line.decode("utf-8", "replace").strip()
+                if not line.startswith("out_time_us=") or not total_duration:
+                    continue
+                try:
+                    seconds = int(line.split("=", 1)[1]) / 1_000_000
+                except ValueError:
+                    continue  # "N/A" before the first frame is written
+                percent = int(max(0.0, min(1.0, seconds / total_duration)) * 100)
+                if percent != last_percent and progress_callback:
+                    last_percent = percent
+                    start, end = progress_range
+                    progress_callback(f"{message}: {percent}%", start + (end - start) * percent / 100)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        return_code = process.wait()
+    finally:
+        if log_path:
+            log_file.close()
+
+    if return_code != 0:
+        raise ffmpeg_error(return_code, log_path)
+
+
+def frame_runs(frame_numbers: List[int]) -> List[Tuple[int, int, int]]:
+    """Split sorted frame numbers into evenly spaced runs of (first, count, step)."""
+    runs = []
+    i = 0
+    while i < len(frame_numbers):
+        step = frame_numbers[i + 1] - frame_numbers[i] if i + 1 < len(frame_numbers) else 1
+        count = 1
+        while (i + count < len(frame_numbers)
+               and frame_numbers[i + count] - frame_numbers[i + count - 1] == step):
+            count += 1
+        runs.append((frame_numbers[i], count, step))
+        i += count
+    return runs
+
+
+def ffmpeg_error(return_code: int, log_path: str = None) -> RuntimeError:
+    """Error for a failed ffmpeg run, with the last lines of its log."""
+    details = ""
+    if log_path and os.path.exists(log_path):
+        with open(log_path, "rb") as f:
+            details = f.read().decode("utf-8", "replace").strip().splitlines()[-5:]
+            details = "\n" + "\n".join(details)
+    return RuntimeError(f"ffmpeg failed with exit code {return_code}{details}")
+
+
+class FFmpegRenderer:
+    """Build ffmpeg commands that render still-image slideshows.
+
+    Slides go through the concat demuxer, or through an xfade chain of looped
+    image inputs when there are transitions; SegmentEncoder keeps each such
+    command to one segment of the timeline.
+    """
+
+    def __init__(self, fps: int = 24, codec: str = "libx264", audio_codec: str = "aac",
+                 threads: int = None, audio_index=None, encoder_args: List[str] = None,
+                 vfr: bool = False, keyframe_interval: float = None):
+        self.fps = fps
+        self.codec = codec
+        self.audio_codec = audio_codec
+        self.threads = threads
+        # Extra encoder options, e.g. an encoder profile's preset and CRF
+        self.encoder_args = list(encoder_args or [])
+        # Variable frame rate: held slides only keep a frame every VFR_HOLD_SECONDS
+        self.vfr = vfr
+        self.hold_frames = max(1, int(round(VFR_HOLD_SECONDS * fps)))
+        # Longest stretch of video time (seconds) without a keyframe, for VFR output
+        self.keyframe_interval = keyframe_interval
+        self.audio_index = audio_index  # Optional AudioProbeIndex to avoid re-probing
+        self.ffmpeg = get_ffmpeg_exe()
+
+    def write_slides(self, frames, work_dir: str, indices=None) -> List[str]:
+        """Write frames as uncompressed BMPs (lossless and cheap to encode).
+
+        Returns the names of all slides; with indices only those slides are written.
+        """
+        slide_names = [f"slide_{i:04d}.bmp" for i in range(len(frames))]
+        for i in (range(len(frames)) if indices is None else sorted(indices)):
+            Image.fromarray(frames[i]).save(os.path.join(work_dir, slide_names[i]))
+        return slide_names
+
+    def build_command(self, slide_names: List[str], durations: List[float], output_path: str,
+                      work_dir: str, audio_path: str = None, transition_duration: float = 0.0,
+                      lead_in: str = None, name: str = "render") -> List[str]:
+        """Build the ffmpeg command; slide names are relative to work_dir.
+
+        Without transitions the slides go through the concat demuxer. With
+        transitions each slide becomes a looped image input and consecutive
+        slides are joined with xfade, keeping every boundary at the same time.
+        lead_in names the slide shown before the first one, so a crossfade
+        into the first slide can be rendered (used for segments). name keeps
+        helper files of concurrent commands in the same work_dir apart.
+        """
+        total_duration = sum(durations)
+        cmd = [self.ffmpeg, "-y", "-loglevel", "error"]
+
+        if lead_in and transition_duration > 0:
+            # The lead-in slide only exists for the length of the crossfade
+            slide_names = [lead_in] + list(slide_names)
+            durations = [0.0] + list(durations)
+            transition = min(transition_duration, min(durations[1:]))
+        elif len(slide_names) > 1:
+            transition = min(transition_duration, min(durations))
+        else:
+            transition = 0
+
+        # Slide changes (the lead-in slide has no duration) get a keyframe each
+        changes = []
+        position = 0.0
+        for duration in durations[:-1]:
+            position += duration
+            changes.append(int(round(position * self.fps)))
+        if self.vfr:
+            # Frames to keep
+            keep = vfr_frame_numbers(changes, int(round(total_duration * self.fps)),
+                                     int(round(transition * self.fps)), self.hold_frames)
+
+        if transition <= 0:
+            list_name = f"{name}_slides.txt"
+            with open(os.path.join(work_dir, list_name), "w", encoding="utf-8") as f:
+                f.write("ffconcat version 1.0\n")
+                for slide_name, duration in zip(slide_names, durations):
+                    f.write(f"file '{slide_name}'\nduration {duration:.6f}\n")
+                # The concat demuxer ignores the last duration unless the file is repeated
+                f.write(f"file '{slide_names[-1]}'\n")
+            cmd += ["-f", "concat", "-safe", "0", "-i", list_name]
+            video_filter = f"[0:v]fps={self.fps},format=yuv420p[vout]"
+            if self.vfr:
+                video_filter = video_filter.replace("[vout]", f",{self.vfr_select_filter(keep)}[vout]")
+            num_inputs = 1
+        else:
+            # Every slide but the last overlaps the next one by the transition
+            for i, (slide_name, duration) in enumerate(zip(slide_names, durations)):
+                if i < len(slide_names) - 1:
+                    duration += transition
+                cmd += ["-loop", "1", "-framerate", str(self.fps), "-t", f"{duration:.6f}",
+                        "-i", slide_name]
+            parts = [f"[{i}:v]format=yuv420p[s{i}]" for i in range(len(slide_names))]
+            previous = "s0"
+            offset = 0.0
+            for i in range(1, len(slide_names)):
+                offset += durations[i - 1]
+                parts.append(f"[{previous}][s{i}]xfade=transition=fade:"
+                             f"duration={transition:.6f}:offset={offset:.6f}[x{i}]")
+                previous = f"x{i}"
+            parts.append(f"[{previous}]{self.vfr_select_filter(keep) if self.vfr else 'null'}[vout]")
+            video_filter = ";\n".join(parts)
+            num_inputs = len(slide_names)
+
+        if audio_path:
+            cmd += ["-i", os.path.abspath(audio_path)]
+
+        filter_name = f"{name}_filter.txt"
+        with open(os.path.join(work_dir, filter_name), "w", encoding="utf-8") as f:
+            f.write(video_filter)
+        cmd += ["-filter_complex_script", filter_name, "-map", "[vout]"]
+        if audio_path:
+            cmd += ["-map", f"{num_inputs}:a:0"] + self.audio_codec_args(audio_path)
+        cmd += self.video_codec_args()
+        cmd += self.keyframe_args([change / self.fps for change in changes], total_duration)
+        cmd += ["-t", f"{total_duration:.6f}", "-movflags", "+faststart",
+                os.path.abspath(output_path)]
+        return cmd
+
+    def build_still_command(self, slide_path: str, seconds: float, output_path: str) -> List[str]:
+        """Encode seconds of one still slide as a single GOP (one keyframe).
+
+        x264's stillimage tuning makes every frame after the keyframe almost
+        free; the clip is meant to be repeated with build_loop_command.
+        Without B-frames, packets are in display order, so the repeated
+        clip can be cut at any frame.
+        """
+        num_frames = max(1, int(round(seconds * self.fps)))
+        return [self.ffmpeg, "-y", "-loglevel", "error",
+                "-loop", "1", "-framerate", str(self.fps), "-i", os.path.abspath(slide_path)] + \
+            self.video_codec_args() + \
+            ["-tune", "stillimage", "-g", str(num_frames), "-bf", "0", "-frames:v", str(num_frames),
+             "-an", os.path.abspath(output_path)]
+
+    def build_loop_command(self, clip_path: str, duration: float, output_path: str,
+                           audio_path: str = None) -> List[str]:
+        """Repeat an encoded clip for duration seconds by stream copy, adding audio.
+
+        Copied frames can't be shortened, so with audio the video ends on the
+        last whole frame within the audio (the player holds it to the end)
+        instead of running past it; without audio it ends on the nearest frame.
+        """
+        cmd = [self.ffmpeg, "-y", "-loglevel", "error",
+               "-stream_loop", "-1", "-i", os.path.abspath(clip_path)]
+        if audio_path:
+            cmd += ["-i", os.path.abspath(audio_path), "-map", "0:v:0", "-map", "1:a:0"]
+            cmd += self.audio_codec_args(audio_path)
+            num_frames = int(duration * self.fps + 1e-6)
+        else:
+            num_frames = int(round(duration * self.fps))
+        cmd += ["-c:v", "copy", "-frames:v", str(max(1, num_frames)),
+                "-t", f"{duration:.6f}", "-movflags", "+faststart",
+                os.path.abspath(output_path)]
+        return cmd
+
+    def chapters_command(self, video_path: str, metadata_path: str, output_path: str) -> List[str]:
+        """ffmpeg command that copies a finished video, adding the chapters of an ffmetadata file."""
+        return [self.ffmpeg, "-y", "-loglevel", "error",
+                "-i", os.path.abspath(video_path), "-f", "ffmetadata", "-i", os.path.abspath(metadata_path),
+                "-map", "0", "-map_chapters", "1", "-c", "copy",
+                "-movflags", "+faststart", os.path.abspath(output_path)]
+
+    def audio_codec_args(self, audio_path: str) -> List[str]:
+        """Copy compatible (AAC) audio as-is; transcode anything else."""
+        audio_info = self.audio_index.get(audio_path) if self.audio_index else None
+        if is_mp4_compatible_audio(audio_path, audio_info):
+            return ["-c:a", "copy"]
+        return ["-c:a", self.audio_codec]
+
+    def audio_encode_command(self, audio_path: str, output_path: str) -> List[str]:
+        """ffmpeg command that encodes an audio file to an AAC .m4a once, for muxing into several videos."""
+        return [self.ffmpeg, "-y", "-loglevel", "error", "-i", os.path.abspath(audio_path),
+                "-map", "0:a:0", "-vn", "-c:a", self.audio_codec, os.path.abspath(output_path)]
+
+    def mux_audio_command(self, video_path: str, audio_path: str, output_path: str,
+                          duration: float) -> List[str]:
+        """ffmpeg command that adds audio to a finished video without re-encoding the video."""
+        return [self.ffmpeg, "-y", "-loglevel", "error",
+                "-i", os.path.abspath(video_path), "-i", os.path.abspath(audio_path),
+                "-map", "0:v:0", "-map", "1:a:0", "-c:v", "copy"] + \
+            self.audio_codec_args(audio_path) + \
+            ["-t", f"{duration:.6f}", "-movflags", "+faststart", os.path.abspath(output_path)]
+
+    def mux_audio_windows_command(self, video_path: str, audio_path: str, output_path: str,
+                                  windows: List[Tuple[float, float]], work_dir: str) -> List[str]:
+        """ffmpeg command that adds only the given (start, end) audio windows, back to back.
+
+        Matches a video made of the same windows (e.g. a preview); the
+        selected audio is re-encoded, the video copied.
+        """
+        selection = "+".join(f"between(t,{start:.6f},{end:.6f})" for start, end in windows)
+        filter_name = "audio_windows.txt"
+        with open(os.path.join(work_dir, filter_name), "w", encoding="utf-8") as f:
+            f.write(f"[1:a]aselect='{selection}',asetpts=N/SR/TB[aout]")
+        return [self.ffmpeg, "-y", "-loglevel", "error",
+                "-i", os.path.abspath(video_path), "-i", os.path.abspath(audio_path),
+                "-filter_complex_script", os.path.join(work_dir, filter_name),
+                "-map", "0:v:0", "-map", "[aout]", "-c:v", "copy", "-c:a", self.audio_codec,
+                "-shortest", "-movflags", "+faststart", os.path.abspath(output_path)]
+
+    def vfr_select_filter(self, frame_numbers: List[int]) -> str:
+        """select filter keeping the given frames of a constant frame rate stream."""
+        terms = []
+        for first, count, step in frame_runs(frame_numbers):
+            last = first + (count - 1) * step
+            terms.append(f"between(n,{first},{last})" if step == 1 else
+                         f"between(n,{first},{last})*not(mod(n-{first},{step}))")
+        return f"select='{'+'.join(terms)}'"
+
+    def vfr_setpts_filter(self, frame_numbers: List[int]) -> str:
+        """setpts filter giving frames piped back to back the times of the given frame numbers."""
+        terms = []
+        index = 0  # Position of the run's first frame in the pipe
+        for first, count, step in frame_runs(frame_numbers):
+            terms.append(f"between(N,{index},{index + count - 1})*({first}+(N-{index})*{step})")
+            index += count
+        return f"setpts='({'+'.join(terms)})/({self.fps}*TB)'"
+
+    def video_codec_args(self) -> List[str]:
+        """Encoder arguments shared by every command, so outputs can be concatenated."""
+        args = ["-c:v", self.codec, "-pix_fmt", "yuv420p"]
+        if self.vfr:
+            # Keep the selected frames' timestamps instead of duplicating frames
+            # to a constant rate. Without B-frames packets are in display order,
+            # so the file ends exactly after its last frame (segments join on time)
+            args += ["-fps_mode", "vfr", "-bf", "0"]
+        else:
+            args += ["-r", str(self.fps)]
+        args += self.encoder_args
+        if self.threads:
+            args += ["-threads", str(self.threads)]
+        return args
+
+    def keyframe_args(self, times: List[float], duration: float = None) -> List[str]:
+        """Force keyframes at the given times (seconds, e.g. slide boundaries).
+
+        Players then seek to a slide change without decoding the frames
+        before it. With VFR output -g counts frames rather than seconds, so
+        longer gaps up to duration also get keyframes every keyframe_interval.
+        """
+        times = sorted(t for t in set(times) if t > 0 and (duration is None or t < duration))
+        if self.vfr and self.keyframe_interval and duration:
+            filled = []
+            previous = 0.0
+            for t in times + [duration]:
+                while t - previous > self.keyframe_interval:
+                    previous += self.keyframe_interval
+                    filled.append(previous)
+                filled.append(t)
+                previous = t
+            times = filled[:-1]
+        if not times:
+            return []
+        # ffmpeg forces the first frame at or after each time; half a frame
+        # earlier keeps rounding from pushing it to the next frame
+        return ["-force_key_frames", ",".join(f"{t - 0.5 / self.fps:.6f}" for t in times)]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Frame Store
+Holds preprocessed slides as RGB NumPy arrays for the renderer, keeping them
+in memory up to a budget and spilling the rest to memory-mapped .npy files.
+"""
+
+import os
+from typing import List, Optional
+
+import numpy as np
+
+# Default amount of RAM used for in-memory slides before spilling to disk
+DEFAULT_MEMORY_BUDGET_MB = 1024
+
+
+def load_frame(path: str) -> np.ndarray:
+    """Memory-map a slide stored as an .npy file (read-only, no decode)."""
+    return np.load(path, mmap_mode='r')
+
+
+def save_frame(path: str, frame: np.ndarray):
+    """Write a slide to an .npy file (lossless raw RGB)."""
+    with open(path, 'wb') as f:
+        np.save(f, frame)
+
+
+class FrameStore:
+    """Ordered collection of slide frames bounded by a memory budget."""
+
+    def __init__(self, num_frames: int, spill_dir: str,
+                 memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB):
+        self.spill_dir = spill_dir
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.in_memory_bytes = 0
+        self.spilled = 0
+        self._frames: List[Optional[np.ndarray]] = [None] * num_frames
+
+    def add(self, index: int, frame: np.ndarray, backing_path: str = None):
+        """Store a slide, keeping it in RAM if it fits the budget.
+
+        Slides over budget are memory-mapped from backing_path when one
+        already exists on disk (e.g. the slide cache), or from a spill file.
+        """
+        if isinstance(frame, np.memmap) or self.in_memory_bytes + frame.nbytes <= self.memory_budget:
+            if not isinstance(frame, np.memmap):
+                self.in_memory_bytes += frame.nbytes
+            self._frames[index] = frame
+            return
+
+        if backing_path is None:
+            backing_path = os.path.join(self.spill_dir, f"slide_{index:04d}.npy")
+            save_frame(backing_path, frame)
+        self._frames[index] = load_frame(backing_path)
+        self.spilled += 1
+
+    def release(self, index: int):
+        """Drop a slide once the renderer no longer needs it."""
+        frame = self._frames[index]
+        if frame is not None and not isinstance(frame, np.memmap):
+            self.in_memory_bytes -= frame.nbytes
+        self._frames[index] = None
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._frames[index]
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __iter__(self):
+        return iter(self._frames)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Render Manifest
+Fingerprints a render from its inputs and settings and records it in a
+sidecar file next to the output, so unchanged episodes can be skipped like
+up-to-date targets in a build system.
+"""
+
+import os
+import json
+import time
+import hashlib
+from typing import List, Optional
+
+# Bump when the fingerprint contents change so old manifests never match
+FINGERPRINT_VERSION = 1
+MANIFEST_SUFFIX = ".render.json"
+
+
+def _file_identity(path: str) -> dict:
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def compute_fingerprint(image_files: List[str], audio_path: Optional[str], settings: dict) -> str:
+    """Hash the image list, the audio file identity and the render settings.
+
+    Files are identified by absolute path, size and mtime; settings holds
+    everything else that changes the output (resolution, timing, encoder).
+    """
+    parts = {
+        "version": FINGERPRINT_VERSION,
+        "images": [_file_identity(path) for path in image_files],
+        "audio": _file_identity(audio_path) if audio_path else None,
+        "settings": settings,
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def manifest_path(output_path: str) -> str:
+    """Sidecar manifest path for an output video."""
+    return output_path + MANIFEST_SUFFIX
+
+
+def read_manifest(output_path: str) -> Optional[dict]:
+    """Return the manifest of output_path, or None if missing or unreadable."""
+    try:
+        with open(manifest_path(output_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_up_to_date(output_path: str, fingerprint: str) -> Optional[dict]:
+    """Return the manifest if output_path was rendered with fingerprint and is intact."""
+    manifest = read_manifest(output_path)
+    if not manifest or manifest.get("fingerprint") != fingerprint:
+        return None
+    try:
+        # A replaced or truncated output must be rendered again
+        if os.path.getsize(output_path) != manifest.get("file_size"):
+            return None
+    except OSError:
+        return None
+    return manifest
+
+
+def write_manifest(output_path: str, fingerprint: str, settings: dict, summary: dict):
+    """Record the fingerprint, settings and render summary next to the output."""
+    manifest = {"fingerprint": fingerprint, "rendered_at": time.time(), "settings": settings}
+    manifest.update(summary)
+    path = manifest_path(output_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, path)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Render Scheduler
+Admits render jobs under a CPU-thread and RAM budget so concurrent renders
+don't oversubscribe the machine. Each job's cost is estimated from its image
+count, resolution and video duration, and its encoder threads are pinned to
+the estimate.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import NamedTuple, Tuple
+
+from frame_store import DEFAULT_MEMORY_BUDGET_MB
+
+MB = 1024 * 1024
+
+# Python, moviepy and the ffmpeg processes before any slide is loaded
+BASE_JOB_MEMORY_MB = 200
+# Frames x264 keeps in flight (lookahead, reference and threaded frames)
+ENCODER_FRAMES_IN_FLIGHT = 40
+# Pixels one encoder thread keeps busy; 1080p gets 4 threads, 720p 2
+PIXELS_PER_THREAD = 500_000
+MAX_THREADS_PER_JOB = 8
+
+
+class JobCost(NamedTuple):
+    """Estimated resources of one render job."""
+    threads: int
+    memory_mb: float
+    work: float  # Output pixels to encode, for reporting only
+
+
+def total_memory_mb() -> float:
+    """Physical memory of the machine in MB (8 GB if it can't be determined)."""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / MB
+    except (AttributeError, ValueError, OSError):
+        pass
+    try:
+        import ctypes
+
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys / MB
+    except Exception:
+        pass
+    return 8192.0
+
+
+def estimate_job_cost(num_images: int, resolution: Tuple[int, int], video_duration: float,
+                      memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB, fps: int = 24,
+                      max_threads: int = MAX_THREADS_PER_JOB, pipeline: bool = True) -> JobCost:
+    """Estimate the threads and RAM a render needs.
+
+    Streamed slides (pipeline) only hold the slides just ahead of the encoder;
+    otherwise slides are held in memory up to memory_budget_mb (the rest is
+    memory-mapped). The encoder keeps a few dozen frames in flight, and larger
+    frames keep more encoder threads busy.
+    """
+    width, height = resolution
+    frame_mb = width * height * 3 / MB
+    threads = max(1, min(max_threads, round(width * height / PIXELS_PER_THREAD)))
+    if pipeline:
+        # Lookahead of two slides per worker, the previous slide and the timeline's copies
+        slides_mb = min(num_images, 2 * threads + 4) * frame_mb
+    else:
+        slides_mb = min(num_images * frame_mb, memory_budget_mb)
+    encoder_mb = ENCODER_FRAMES_IN_FLIGHT * frame_mb
+    work = width * height * fps * (video_duration or 0)
+    return JobCost(threads, BASE_JOB_MEMORY_MB + slides_mb + encoder_mb, work)
+
+
+class RenderScheduler:
+    """Run jobs in worker processes while their estimated costs fit the budget.
+
+    Jobs are admitted in submission order; when the job at the head of the
+    queue doesn't fit, later jobs that do are started first (backfilling).
+    A job larger than the whole budget still runs, alone. queue_depth,
+    running_jobs and status() are safe to call from any thread.
+    """
+
+    def __init__(self, cpu_threads: int = None, memory_mb: float = None, max_jobs: int = None):
+        self.cpu_threads = cpu_threads or os.cpu_count() or 1
+        # Leave a quarter of the RAM to the OS and other programs
+        self.memory_mb = memory_mb or total_memory_mb() * 0.75
+        self.max_jobs = max_jobs or self.cpu_threads
+        self._executor = ProcessPoolExecutor(max_workers=self.max_jobs)
+        self._lock = threading.Lock()
+        self._queue = OrderedDict()  # job id -> (name, cost, fn, args, future)
+        self._running = OrderedDict()  # job id -> (name, cost)
+        self._next_id = 0
+
+    def submit(self, name: str, cost: JobCost, fn, *args) -> Future:
+        """Queue fn(*args) to run in a worker process; returns its Future.
+
+        Cancelling the Future before the job starts removes it from the queue.
+        """
+        future = Future()
+        with self._lock:
+            self._queue[self._next_id] = (name, cost, fn, args, future)
+            self._next_id += 1
+        self._dispatch()
+        return future
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for resources."""
+        with self._lock:
+            return sum(1 for item in self._queue.values() if not item[4].cancelled())
+
+    @property
+    def running_jobs(self) -> list:
+        """Names of the jobs currently rendering."""
+        with self._lock:
+            return [name for name, _ in self._running.values()]
+
+    def status(self) -> dict:
+        """Snapshot of the queue and the resources in use, for monitoring."""
+        with self._lock:
+            threads_used, memory_used = self._usage()
+            return {
+                "queued": [item[0] for item in self._queue.values() if not item[4].cancelled()],
+                "running": [name for name, _ in self._running.values()],
+                "threads_in_use": threads_used,
+                "threads_total": self.cpu_threads,
+                "memory_in_use_mb": round(memory_used),
+                "memory_total_mb": round(self.memory_mb),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Cancel jobs that haven't started and stop the worker processes."""
+        with self._lock:
+            queued = list(self._queue.values())
+            self._queue.clear()
+        for item in queued:
+            item[4].cancel()
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def pinned_threads(self, cost: JobCost) -> int:
+        """Encoder threads a job gets: its estimate, capped by the budget."""
+        return max(1, min(cost.threads, self.cpu_threads))
+
+    def _usage(self) -> Tuple[int, float]:
+        threads = sum(self.pinned_threads(cost) for _, cost in self._running.values())
+        memory = sum(cost.memory_mb for _, cost in self._running.values())
+        return threads, memory
+
+    def _fits(self, cost: JobCost) -> bool:
+        if not self._running:
+            return True
+        if len(self._running) >= self.max_jobs:
+            return False
+        threads, memory = self._usage()
+        return (threads + self.pinned_threads(cost) <= self.cpu_threads and
+                memory + cost.memory_mb <= self.memory_mb)
+
+    def _dispatch(self):
+        """Start every queued job that fits into the remaining budget."""
+        with self._lock:
+            for job_id, (name, cost, fn, args, future) in list(self._queue.items()):
+                if future.cancelled():
+                    del self._queue[job_id]
+                    continue
+                if not self._fits(cost):
+                    continue
+                del self._queue[job_id]
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running[job_id] = (name, cost)
+                try:
+                    inner = self._executor.submit(fn, *args)
+                except Exception as e:
+                    del self._running[job_id]
+                    future.set_exception(e)
+                    continue
+                inner.add_done_callback(lambda done, job_id=job_id, future=future:
+                                        self._finished(job_id, future, done))
+
+    def _finished(self, job_id: int, future: Future, done: Future):
+        with self._lock:
+            self._running.pop(job_id, None)
+        exception = done.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(done.result())
+        self._dispatch()
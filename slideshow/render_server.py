@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Render Server
+Local HTTP/JSON service for submitting slideshow renders from other tools.
+Jobs take the same parameters as create_slideshow_video, run through the
+render scheduler, stream their progress as server-sent events, can be
+cancelled, and persist in a data directory so queued jobs survive restarts.
+The server only listens on localhost.
+
+Usage:
+    python render_server.py --port 8765
+
+API:
+    POST   /jobs                 Submit a job (JSON body), returns the job
+    GET    /jobs                 List jobs
+    GET    /jobs/<id>            Job state, progress and result
+    GET    /jobs/<id>/events     Progress as text/event-stream (?since=<event id>)
+    GET    /jobs/<id>/result     Download the rendered video
+    DELETE /jobs/<id>            Cancel a queued or running job
+    GET    /status               Scheduler queue and resource usage
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import inspect
+import argparse
+import threading
+import multiprocessing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from batch_render import _run_job, estimate_batch_job
+from chapters import SLIDES_SOURCE
+from encoder_profiles import get_profile
+from render_scheduler import RenderScheduler
+from slide_cache import default_cache_dir
+from slideshow_generator import SlideshowGenerator
+from variants import FILL_MODES
+
+DEFAULT_PORT = 8765
+HOST = "127.0.0.1"
+MAX_REQUEST_BYTES = 1024 * 1024
+TERMINAL_STATES = ("done", "failed", "cancelled")
+
+# Job parameters that configure the SlideshowGenerator instead of the render
+GENERATOR_PARAMS = ("resolution", "use_cache", "cache_dir", "cache_size_mb", "decode_quality", "fill_mode")
+RENDER_PARAMS = tuple(name for name in inspect.signature(SlideshowGenerator.create_slideshow_video).parameters
+                      if name not in ("self", "progress_callback"))
+
+
+def default_data_dir() -> str:
+    """Directory for the job queue, logs and outputs, next to the slide cache."""
+    return os.path.join(os.path.dirname(default_cache_dir()), "server")
+
+
+class _ProgressReporter:
+    """progress_callback sent to the worker process with a job.
+
+    Forwards progress to the server through a manager queue and raises
+    InterruptedError once the job has been cancelled.
+    """
+
+    def __init__(self, job_id: str, events, cancelled):
+        self.job_id = job_id
+        self.events = events
+        self.cancelled = cancelled
+
+    def __call__(self, message: str, percent: float):
+        if self.cancelled.get(self.job_id):
+            raise InterruptedError("Cancelled by user")
+        self.events.put((self.job_id, message, percent))
+
+
+class RenderService:
+    """Persistent job queue on top of a RenderScheduler.
+
+    Every job is a JSON file in data_dir/jobs, rewritten on each state change.
+    On start, jobs that were queued or running when the server stopped are
+    queued again in submission order.
+    """
+
+    def __init__(self, data_dir: str = None, cpu_threads: int = None, memory_mb: float = None,
+                 max_jobs: int = 1):
+        self.data_dir = data_dir or default_data_dir()
+        self.jobs_dir = os.path.join(self.data_dir, "jobs")
+        self.logs_dir = os.path.join(self.data_dir, "logs")
+        self.outputs_dir = os.path.join(self.data_dir, "outputs")
+        for directory in (self.jobs_dir, self.logs_dir, self.outputs_dir):
+            os.makedirs(directory, exist_ok=True)
+
+        self._manager = multiprocessing.Manager()
+        self._progress = self._manager.Queue()
+        self._cancelled = self._manager.dict()
+        self.scheduler = RenderScheduler(cpu_threads, memory_mb, max_jobs)
+
+        self._condition = threading.Condition()
+        self._closing = False
+        self.jobs = {}
+        self._events = {}  # job id -> list of event dicts
+        self._futures = {}
+
+        self._load()
+        threading.Thread(target=self._forward_progress, daemon=True).start()
+        for job in sorted(self.jobs.values(), key=lambda j: j["created"]):
+            if job["status"] not in TERMINAL_STATES:
+                job["status"] = "queued"
+                self._save(job)
+                self._start(job)
+
+    def submit(self, params: dict) -> dict:
+        """Validate params and queue a new job."""
+        unknown = sorted(set(params) - set(RENDER_PARAMS) - set(GENERATOR_PARAMS))
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(unknown)}")
+        if not params.get("image_dir"):
+            raise ValueError("image_dir is required")
+        if not os.path.exists(params["image_dir"]):
+            # A folder of slides, or a single image rendered as a static cover
+            raise ValueError(f"Image directory or file not found: {params['image_dir']}")
+        if not params.get("silent_mode") and not params.get("audio_path"):
+            raise ValueError("audio_path is required when not in silent mode")
+        if params.get("profile") or params.get("profile_config"):
+            try:
+                get_profile(params.get("profile"), params.get("profile_config"))
+            except OSError as e:
+                raise ValueError(f"Cannot read profile config: {e}") from None
+        if params.get("fill_mode", "fit") not in FILL_MODES:
+            raise ValueError(f"fill_mode must be one of: {', '.join(FILL_MODES)}")
+        chapters = params.get("chapters")
+        if chapters and chapters != SLIDES_SOURCE and not os.path.isdir(chapters):
+            raise ValueError(f"chapters must be \"{SLIDES_SOURCE}\" or a directory of script files: {chapters}")
+
+        job_id = uuid.uuid4().hex[:12]
+        params = dict(params)
+        params.setdefault("output_path", os.path.join(self.outputs_dir, f"{job_id}.mp4"))
+        job = {"id": job_id, "status": "queued", "params": params, "created": time.time(),
+               "started": None, "finished": None, "progress": 0, "message": "Queued",
+               "result": None, "error": None,
+               "log_path": os.path.join(self.logs_dir, f"{job_id}.log")}
+        with self._condition:
+            self.jobs[job_id] = job
+            self._save(job)
+        self._start(job)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> dict:
+        """Return a copy of a job, or raise KeyError."""
+        with self._condition:
+            return dict(self.jobs[job_id])
+
+    def list(self) -> list:
+        """All jobs, oldest first."""
+        with self._condition:
+            return [dict(job) for job in sorted(self.jobs.values(), key=lambda j: j["created"])]
+
+    def cancel(self, job_id: str) -> dict:
+        """Cancel a job: queued jobs never start, running ones stop at their next progress update."""
+        with self._condition:
+            job = self.jobs[job_id]
+            if job["status"] in TERMINAL_STATES:
+                return dict(job)
+            self._cancelled[job_id] = True
+            future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            self._finish(job_id, "cancelled", error="Cancelled by user")
+        return self.get(job_id)
+
+    def events_since(self, job_id: str, since: int = 0, timeout: float = 15.0):
+        """Return (events after event id since, finished), waiting up to timeout for new ones."""
+        with self._condition:
+            if job_id not in self.jobs:
+                raise KeyError(job_id)
+            self._condition.wait_for(
+                lambda: len(self._events[job_id]) > since or
+                self.jobs[job_id]["status"] in TERMINAL_STATES, timeout)
+            return self._events[job_id][since:], self.jobs[job_id]["status"] in TERMINAL_STATES
+
+    def status(self) -> dict:
+        """Scheduler status plus job counts per state."""
+        status = self.scheduler.status()
+        with self._condition:
+            counts = {}
+            for job in self.jobs.values():
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+        status["jobs"] = counts
+        return status
+
+    def shutdown(self):
+        """Stop accepting results; unfinished jobs stay queued on disk for the next start."""
+        with self._condition:
+            self._closing = True
+        self.scheduler.shutdown(wait=False)
+        self._manager.shutdown()
+
+    def _start(self, job: dict):
+        job_id = job["id"]
+        params = job["params"]
+        batch_job = {"name": job_id, "output_path": params["output_path"]}
+        render_options = {}
+        generator_options = {}
+        for key, value in params.items():
+            if key in ("image_dir", "audio_path", "resolution"):
+                batch_job[key] = value
+            elif key in GENERATOR_PARAMS:
+                generator_options[key] = value
+            elif key != "output_path":
+                render_options[key] = value
+        render_options.setdefault("silent_mode", not params.get("audio_path"))
+
+        cost = estimate_batch_job(batch_job, generator_options, render_options)
+        threads = self.scheduler.pinned_threads(cost)
+        render_options.setdefault("max_workers", threads)
+        render_options.setdefault("encoder_threads", threads)
+        render_options["progress_callback"] = _ProgressReporter(job_id, self._progress, self._cancelled)
+
+        with self._condition:
+            self._events.setdefault(job_id, [])
+            future = self.scheduler.submit(job_id, cost, _run_job, batch_job, self.logs_dir,
+                                           generator_options, render_options)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda done: self._on_done(job_id, done))
+
+    def _on_done(self, job_id: str, future):
+        if future.cancelled():
+            return  # Handled by cancel()
+        try:
+            result = future.result()
+        except Exception as e:
+            # The worker process itself died (e.g. out of memory)
+            result = {"status": "failed", "error": f"Worker crashed: {e}"}
+        with self._condition:
+            if self._closing:
+                return  # Interrupted by shutdown; the job is requeued on the next start
+            cancelled = self._cancelled.get(job_id)
+        if cancelled:
+            self._finish(job_id, "cancelled", error="Cancelled by user")
+        elif result["status"] == "done":
+            self._finish(job_id, "done", result={k: result.get(k) for k in
+                                                 ("output_path", "video_duration", "render_time", "file_size")})
+        else:
+            self._finish(job_id, "failed", error=result.get("error"))
+
+    def _finish(self, job_id: str, status: str, result: dict = None, error: str = None):
+        with self._condition:
+            job = self.jobs[job_id]
+            if job["status"] in TERMINAL_STATES:
+                return
+            job.update(status=status, finished=time.time(), result=result, error=error)
+            if status == "done":
+                job.update(progress=100, message="Done")
+            self._futures.pop(job_id, None)
+            self._add_event(job_id, {"type": "state", "status": status, "error": error})
+            self._save(job)
+
+    def _forward_progress(self):
+        """Turn progress messages from the workers into job updates and events."""
+        while True:
+            try:
+                job_id, message, percent = self._progress.get()
+            except (EOFError, OSError):
+                return  # The manager was shut down
+            with self._condition:
+                job = self.jobs.get(job_id)
+                if job is None or job["status"] in TERMINAL_STATES:
+                    continue
+                if job["status"] == "queued":
+                    job.update(status="running", started=time.time())
+                    self._add_event(job_id, {"type": "state", "status": "running", "error": None})
+                    self._save(job)
+                job.update(progress=percent, message=message)
+                self._add_event(job_id, {"type": "progress", "message": message, "percent": percent})
+
+    def _add_event(self, job_id: str, event: dict):
+        # Called with the condition held
+        events = self._events.setdefault(job_id, [])
+        events.append(dict(event, id=len(events) + 1, job=job_id, time=time.time()))
+        self._condition.notify_all()
+
+    def _save(self, job: dict):
+        path = os.path.join(self.jobs_dir, f"{job['id']}.json")
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, path)
+
+    def _load(self):
+        for name in os.listdir(self.jobs_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, name), "r", encoding="utf-8") as f:
+                    job = json.load(f)
+            except (OSError, ValueError):
+                print(f"Skipping unreadable job file: {name}")
+                continue
+            self.jobs[job["id"]] = job
+            self._events[job["id"]] = []
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Routes the JSON API to the RenderService of the server."""
+
+    server_version = "PodcastSlideshowRender/1.0"
+
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        try:
+            if parts == ["status"]:
+                self._send_json(200, self.service.status())
+            elif parts == ["jobs"]:
+                self._send_json(200, self.service.list())
+            elif len(parts) == 2 and parts[0] == "jobs":
+                self._send_json(200, self.service.get(parts[1]))
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+                since = int(parse_qs(url.query).get("since", ["0"])[0])
+                self._stream_events(parts[1], int(self.headers.get("Last-Event-ID") or since))
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "result":
+                self._send_result(parts[1])
+            else:
+                self._send_json(404, {"error": "Not found"})
+        except KeyError:
+            self._send_json(404, {"error": "Job not found"})
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_REQUEST_BYTES:
+                raise ValueError("Request body too large")
+            params = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(params, dict):
+                raise ValueError("Request body must be a JSON object")
+            self._send_json(201, self.service.submit(params))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+
+    def do_DELETE(self):
+        match = re.fullmatch(r"/jobs/([0-9a-f]+)/?", urlparse(self.path).path)
+        if not match:
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            self._send_json(200, self.service.cancel(match.group(1)))
+        except KeyError:
+            self._send_json(404, {"error": "Job not found"})
+
+    def _send_json(self, code: int, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream_events(self, job_id: str, since: int):
+        """Send events as they happen until the job reaches a final state."""
+        events, finished = self.service.events_since(job_id, since, timeout=0)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            while True:
+                for event in events:
+                    self.wfile.write(f"id: {event['id']}\nevent: {event['type']}\n"
+                                     f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+                    since = event["id"]
+                if finished and not events:
+                    self.wfile.write(b"event: end\ndata: {}\n\n")
+                    return
+                if not events:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+                events, finished = self.service.events_since(job_id, since)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client went away
+
+    def _send_result(self, job_id: str):
+        job = self.service.get(job_id)
+        if job["status"] != "done":
+            self._send_json(409, {"error": f"Job is {job['status']}"})
+            return
+        path = job["result"]["output_path"]
+        if not os.path.exists(path):
+            self._send_json(410, {"error": "Output file no longer exists"})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.send_header("Content-Disposition", f'attachment; filename="{job_id}.mp4"')
+        self.end_headers()
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+
+    def log_message(self, format, *args):
+        print(f"[{self.log_date_time_string()}] {format % args}")
+
+
+class RenderServer(ThreadingHTTPServer):
+    """HTTP server bound to localhost that serves one RenderService."""
+
+    daemon_threads = True
+
+    def __init__(self, service: RenderService, port: int = DEFAULT_PORT):
+        self.service = service
+        super().__init__((HOST, port), RenderRequestHandler)
+
+
+def main():
+    """Command line entry point for the render server."""
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON render service for podcast slideshows")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Port on 127.0.0.1 to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--data-dir', default=None,
+                        help='Folder for the job queue, logs and outputs (default: next to the slide cache)')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Maximum jobs rendered at the same time (default: 1)')
+    parser.add_argument('--cpu-threads', type=int, default=None,
+                        help='CPU threads shared by running jobs (default: CPU count)')
+    parser.add_argument('--memory-mb', type=float, default=None,
+                        help='RAM in MB shared by running jobs (default: 75%% of RAM)')
+    args = parser.parse_args()
+
+    service = RenderService(args.data_dir, args.cpu_threads, args.memory_mb, args.concurrency)
+    server = RenderServer(service, args.port)
+    print(f"Render server listening on http://{HOST}:{server.server_address[1]}/ "
+          f"(data: {service.data_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down; unfinished jobs resume on the next start")
+    finally:
+        server.server_close()
+        service.shutdown()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
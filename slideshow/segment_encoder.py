@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Segment-Parallel Encoder
+Splits a slide timeline into segments on slide boundaries, encodes them in
+parallel ffmpeg processes with identical encoder settings, joins them with
+the concat demuxer (stream copy) and muxes the audio once at the end.
+
+With a chunk directory, encoded segments are kept under a key of their
+slides, timing and encoder settings, and a re-render only encodes the
+segments that changed.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple
+
+from ffmpeg_renderer import FFmpegRenderer, is_complete_mp4, run_ffmpeg
+from timeline import SlideTimeline
+
+
+class Segment(NamedTuple):
+    """A run of whole slides encoded as one independent file."""
+    index: int
+    first_slide: int
+    end_slide: int  # Exclusive
+    start_frame: int
+    end_frame: int  # Exclusive
+
+    @property
+    def num_frames(self) -> int:
+        return self.end_frame - self.start_frame
+
+
+def plan_segments(timeline: SlideTimeline, count: int, fps: float) -> List[Segment]:
+    """Split the timeline into up to count segments of similar length.
+
+    Cuts land on slide boundaries snapped to the frame grid, so every segment
+    holds a whole number of frames and starts with its own keyframe.
+    """
+    boundaries = timeline.frame_boundaries(fps)
+    total_frames = boundaries[-1]
+    count = max(1, min(count, len(timeline)))
+
+    cut_slides = []
+    for k in range(1, count):
+        target = total_frames * k / count
+        # Slide boundary closest to the ideal cut
+        slide = min(range(1, len(timeline)), key=lambda i: abs(boundaries[i] - target))
+        if (not cut_slides or slide > cut_slides[-1]) and boundaries[slide] < total_frames:
+            cut_slides.append(slide)
+
+    edges = [0] + cut_slides + [len(timeline)]
+    return [Segment(i, first, end, boundaries[first], boundaries[end])
+            for i, (first, end) in enumerate(zip(edges, edges[1:]))]
+
+
+class SegmentEncoder:
+    """Encode a slideshow as parallel segments joined by stream copy.
+
+    At most max_parallel segments (default: all) are encoded at the same time.
+    """
+
+    CHUNK_SUFFIX = ".mp4"
+
+    def __init__(self, renderer: FFmpegRenderer, num_segments: int, max_parallel: int = None):
+        self.renderer = renderer
+        self.num_segments = max(1, num_segments)
+        self.max_parallel = max_parallel
+
+    def segment_key(self, segment: Segment, slide_keys: List[str], boundaries: List[int],
+                    transition_duration: float) -> str:
+        """Key of an encoded segment: its slides, their frame timing and the encoder settings."""
+        first = segment.first_slide
+        # The slide before the segment is faded out at its start
+        if first > 0 and transition_duration > 0:
+            first -= 1
+        codec_args = self.renderer.video_codec_args()
+        if "-threads" in codec_args:
+            position = codec_args.index("-threads")
+            del codec_args[position:position + 2]
+        parts = {
+            "lead_in": segment.first_slide != first,
+            "slides": slide_keys[first:segment.end_slide],
+            "frames": [boundaries[i + 1] - boundaries[i]
+                       for i in range(segment.first_slide, segment.end_slide)],
+            "transition": round(transition_duration, 6),
+            "encoder": codec_args,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def segment_command(self, segment: Segment, slide_names: List[str], boundaries: List[int],
+                        output_path: str, work_dir: str, transition_duration: float) -> List[str]:
+        """ffmpeg command that encodes one segment without audio."""
+        fps = self.renderer.fps
+        names = slide_names[segment.first_slide:segment.end_slide]
+        durations = [(boundaries[i + 1] - boundaries[i]) / fps
+                     for i in range(segment.first_slide, segment.end_slide)]
+        # A crossfade into the first slide of the segment needs the slide before it
+        lead_in = slide_names[segment.first_slide - 1] if segment.first_slide > 0 else None
+        return self.renderer.build_command(names, durations, output_path, work_dir,
+                                           transition_duration=transition_duration,
+                                           lead_in=lead_in, name=f"segment_{segment.index:03d}")
+
+    def encode_segments(self, segments: List[Segment], slide_names: List[str],
+                        boundaries: List[int], work_dir: str, transition_duration: float,
+                        progress_callback=None, progress_range=(85, 95),
+                        output_paths: List[str] = None, prepare=None) -> List[str]:
+        """Encode segments in parallel ffmpeg processes; returns their file paths.
+
+        Segments go to output_paths (default: segment_NNN.mp4 in work_dir). Each
+        file only appears once its segment is complete. prepare(segment), if
+        given, runs right before a segment is queued (e.g. to write its slides),
+        so preparing later segments overlaps with encoding earlier ones.
+        """
+        if output_paths is None:
+            output_paths = [os.path.join(work_dir, f"segment_{segment.index:03d}.mp4")
+                            for segment in segments]
+        fps = self.renderer.fps
+        total_frames = sum(segment.num_frames for segment in segments) or 1
+        done_frames = {segment.index: 0 for segment in segments}
+        lock = threading.Lock()
+        cancelled = threading.Event()
+
+        def segment_progress(segment):
+            def callback(message, percent):
+                if cancelled.is_set():
+                    raise InterruptedError("Segment encoding was cancelled")
+                with lock:
+                    done_frames[segment.index] = segment.num_frames * percent / 100
+                    overall = sum(done_frames.values()) / total_frames
+                    if progress_callback:
+                        start, end = progress_range
+                        progress_callback(f"Encoding {len(segments)} segments: {overall * 100:.0f}%",
+                                          start + (end - start) * overall)
+            return callback
+
+        def encode(segment, output_path):
+            if cancelled.is_set():
+                raise InterruptedError("Segment encoding was cancelled")
+            partial_path = os.path.splitext(output_path)[0] + ".partial.mp4"
+            cmd = self.segment_command(segment, slide_names, boundaries,
+                                       partial_path, work_dir, transition_duration)
+            try:
+                run_ffmpeg(cmd, segment.num_frames / fps, segment_progress(segment),
+                           progress_range=(0, 100), cwd=work_dir,
+                           log_path=os.path.join(work_dir, f"segment_{segment.index:03d}.log"))
+            except BaseException:
+                cancelled.set()  # Don't start any more segments
+                raise
+            os.replace(partial_path, output_path)
+            return output_path
+
+        if not segments:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(segments), self.max_parallel or len(segments))) as executor:
+            futures = []
+            try:
+                for segment, path in zip(segments, output_paths):
+                    if cancelled.is_set():
+                        break  # An encode failed; its error is raised below
+                    if prepare:
+                        prepare(segment)
+                    futures.append(executor.submit(encode, segment, path))
+                return [future.result() for future in futures]
+            except BaseException:
+                # Skip queued segments and stop the running ffmpeg processes
+                # at their next progress update
+                cancelled.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def concat_command(self, segment_names: List[str], output_path: str, work_dir: str,
+                       total_duration: float, audio_path: str = None,
+                       durations: List[float] = None) -> List[str]:
+        """ffmpeg command that joins segments by stream copy and muxes the audio once.
+
+        durations (seconds per segment) place each segment exactly; without
+        them the concat demuxer goes by the container durations.
+        """
+        with open(os.path.join(work_dir, "segments.txt"), "w", encoding="utf-8") as f:
+            f.write("ffconcat version 1.0\n")
+            for i, name in enumerate(segment_names):
+                # The list is read from work_dir, so caller-relative paths must be made absolute
+                name = os.path.abspath(name).replace("\\", "/").replace("'", "'\\''")
+                f.write(f"file '{name}'\n")
+                if durations:
+                    f.write(f"duration {durations[i]:.6f}\n")
+        cmd = [self.renderer.ffmpeg, "-y", "-loglevel", "error",
+               "-f", "concat", "-safe", "0", "-i", "segments.txt"]
+        if audio_path:
+            cmd += ["-i", os.path.abspath(audio_path), "-map", "0:v:0", "-map", "1:a:0"]
+            cmd += self.renderer.audio_codec_args(audio_path)
+        cmd += ["-c:v", "copy", "-t", f"{total_duration:.6f}", "-movflags", "+faststart",
+                os.path.abspath(output_path)]
+        return cmd
+
+    def render(self, frames, timeline: SlideTimeline, output_path: str, work_dir: str,
+               audio_path: str = None, progress_callback=None, chunk_dir: str = None,
+               slide_keys: List[str] = None):
+        """Render the timeline as parallel segments, then join and mux audio.
+
+        With chunk_dir and one slide_keys entry per slide, segments already in
+        chunk_dir are reused, only changed ones are encoded, and chunks no
+        longer used by this render are removed.
+        """
+        fps = self.renderer.fps
+        segments = plan_segments(timeline, self.num_segments, fps)
+        boundaries = timeline.frame_boundaries(fps)
+        transition = timeline.transition_duration
+
+        if chunk_dir:
+            os.makedirs(chunk_dir, exist_ok=True)
+            segment_paths = [os.path.join(chunk_dir, self.segment_key(segment, slide_keys, boundaries,
+                                                                       transition) + self.CHUNK_SUFFIX)
+                             for segment in segments]
+        else:
+            segment_paths = [os.path.join(work_dir, f"segment_{segment.index:03d}.mp4")
+                             for segment in segments]
+        # Stored segments are reused only if they are intact
+        pending = [i for i, path in enumerate(segment_paths) if not is_complete_mp4(path)]
+        if chunk_dir:
+            print(f"Reusing {len(segments) - len(pending)} of {len(segments)} encoded segments")
+        print(f"Encoding {len(pending)} segments, {min(len(pending), self.max_parallel or len(pending))} at a time")
+
+        # Only the slides of changed segments (and their lead-in slides) are
+        # written, each right before its segment is queued for encoding
+        slide_names = self.renderer.write_slides(frames, work_dir, indices=())
+        written = set()
+
+        def write_segment_slides(segment):
+            indices = set(range(max(0, segment.first_slide - 1), segment.end_slide)) - written
+            self.renderer.write_slides(frames, work_dir, indices)
+            written.update(indices)
+
+        self.encode_segments([segments[i] for i in pending], slide_names, boundaries, work_dir,
+                             transition, progress_callback,
+                             output_paths=[segment_paths[i] for i in pending],
+                             prepare=write_segment_slides)
+
+        if chunk_dir:
+            # Keep the chunk directory at the size of the latest render
+            current = {os.path.basename(path) for path in segment_paths}
+            for name in os.listdir(chunk_dir):
+                if name not in current:
+                    try:
+                        os.remove(os.path.join(chunk_dir, name))
+                    except OSError:
+                        pass
+
+        if progress_callback:
+            progress_callback("Joining segments...", 95)
+        print("Joining segments and muxing audio...")
+        total_duration = boundaries[-1] / fps
+        cmd = self.concat_command(segment_paths, output_path, work_dir, total_duration, audio_path,
+                                  [segment.num_frames / fps for segment in segments])
+        run_ffmpeg(cmd, total_duration, progress_callback, progress_range=(95, 99),
+                   message="Joining segments", cwd=work_dir,
+                   log_path=os.path.join(work_dir, "concat.log"))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Slide Cache
+Persistent on-disk cache of preprocessed (resized and letterboxed) slides,
+so re-rendering the same episode does not re-decode and re-resize every image.
+"""
+
+import os
+import sys
+import json
+import hashlib
+from typing import Optional, Tuple
+
+import numpy as np
+
+from frame_store import load_frame, save_frame
+
+# Default upper bound for the total size of cached slides
+DEFAULT_CACHE_SIZE_MB = 4096
+
+# Bump when the stored slide format changes so stale entries are never reused
+CACHE_FORMAT_VERSION = 2
+
+
+def default_cache_dir() -> str:
+    """Return the per-user default cache directory."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "podcast-slideshow", "slides")
+
+
+def slide_key(image_path: str, target_size: Tuple[int, int], fill_mode: str = "fit", **settings) -> str:
+    """Identify a processed slide by its source file identity and processing settings."""
+    stat = os.stat(image_path)
+    parts = {
+        "version": CACHE_FORMAT_VERSION,
+        "path": os.path.abspath(image_path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "target": list(target_size),
+        "fill_mode": fill_mode,
+    }
+    parts.update(settings)
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class SlideCache:
+    """Content-addressed cache of processed slides with size-bounded LRU eviction."""
+
+    # Slides are stored as raw RGB .npy files so they can be memory-mapped
+    ENTRY_SUFFIX = ".npy"
+
+    def __init__(self, cache_dir: str = None, max_size_mb: float = DEFAULT_CACHE_SIZE_MB):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, image_path: str, target_size: Tuple[int, int],
+                 fill_mode: str = "fit", **settings) -> str:
+        """Build a cache key from the source file identity and the processing settings."""
+        return slide_key(image_path, target_size, fill_mode, **settings)
+
+    def entry_path(self, key: str) -> str:
+        """Path where the slide for a key is (or would be) stored."""
+        return os.path.join(self.cache_dir, key[:2], key + self.ENTRY_SUFFIX)
+
+    def get(self, key: str, shape: Tuple[int, ...] = None) -> Optional[np.ndarray]:
+        """Return the cached slide for key memory-mapped, or None on a miss.
+
+        An entry that can't be read, or isn't a uint8 frame of the given
+        shape, is damaged: it is removed and counts as a miss only.
+        """
+        path = self.entry_path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            frame = load_frame(path)
+            if frame.dtype != np.uint8 or (shape is not None and frame.shape != tuple(shape)):
+                raise ValueError(f"unexpected slide {frame.dtype} {frame.shape}")
+        except (OSError, ValueError) as e:
+            print(f"Discarding damaged cached slide {os.path.basename(path)}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            os.utime(path, None)  # Mark as recently used for LRU eviction
+        except OSError:
+            pass
+        return frame
+
+    def put(self, key: str, frame: np.ndarray) -> str:
+        """Store a processed slide in the cache and return its cached path."""
+        path = self.entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        save_frame(temp_path, frame)
+        os.replace(temp_path, path)  # Atomic, so readers never see partial files
+        return path
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def total_size(self) -> int:
+        """Total size of all cached slides in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def prune(self) -> int:
+        """Evict least recently used slides until the cache fits in max_bytes.
+
+        Returns the number of evicted entries.
+        """
+        entries = sorted(self._entries())  # Oldest access time first
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def _entries(self):
+        """Yield (mtime, path, size) for every cached slide."""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(self.ENTRY_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, path, stat.st_size
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Slide Pipeline
+Streams processed slides to the renderer: worker processes decode and resize
+images a bounded number of slides ahead of the encoder, and each slide is
+released as soon as the renderer moves past it, so memory stays flat no
+matter how many images an episode has.
+
+When the frame shape is known, workers write their slides straight into
+preallocated shared-memory slots and the renderer reads them in place,
+instead of every multi-megabyte frame being pickled back to the parent.
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+
+def _worker_context():
+    """Start method for the worker processes.
+
+    Workers start on the first cache miss, which can be after the renderer
+    has opened its ffmpeg pipe. A forked worker would inherit the write end
+    of ffmpeg's stdin, so ffmpeg never sees EOF and the render hangs.
+    Spawned workers start clean (and forkserver breaks in the forked render
+    jobs of render_scheduler), as on Windows.
+    """
+    return multiprocessing.get_context("spawn")
+
+
+def _process_into_slot(process_job: Callable[[str], np.ndarray], image_path: str,
+                       slot_name: str, frame_shape: Tuple[int, ...]) -> Optional[np.ndarray]:
+    """Process an image into a shared-memory slot (runs in a worker process).
+
+    Returns None once the slot holds the frame, or the frame itself if its
+    shape doesn't fit the slot (it is then pickled back as usual).
+    """
+    frame = process_job(image_path)
+    if frame.shape != tuple(frame_shape) or frame.dtype != np.uint8:
+        return frame
+    slot = shared_memory.SharedMemory(name=slot_name)
+    try:
+        view = np.ndarray(frame_shape, dtype=np.uint8, buffer=slot.buf)
+        view[...] = frame
+        del view  # The buffer can't be closed while a view exists
+    finally:
+        slot.close()
+    return None
+
+
+def shared_memory_available(nbytes: int) -> bool:
+    """True if nbytes of shared memory can be allocated safely.
+
+    On Linux shared memory lives in /dev/shm, which is often small in
+    containers; touching pages beyond its size kills the process instead
+    of raising an error, so the free space is checked up front.
+    """
+    if shared_memory is None:
+        return False
+    if os.name == "posix" and os.path.isdir("/dev/shm"):
+        try:
+            stats = os.statvfs("/dev/shm")
+        except OSError:
+            return False
+        return stats.f_bavail * stats.f_frsize > nbytes
+    return True
+
+
+class SlidePipeline:
+    """Sequence of processed slides, produced just ahead of the consumer.
+
+    Indexing blocks until the slide is ready. Reading slide i queues the
+    slides up to i + lookahead and drops everything before i - 1 (the
+    previous slide is kept for crossfades). Slides behind the window are
+    produced again on demand, so seeking back still works, just slower.
+
+    process_job(image_path) runs in a worker process and returns the RGB
+    frame; load_cached(index) may return a ready frame (e.g. from the slide
+    cache) and store(index, frame) is called for every newly processed one.
+
+    With frame_shape (height, width, 3), each queued slide gets one of
+    lookahead + 2 shared-memory slots. A slide read from a slot is a
+    read-only view of it, valid until the slide is released; its slot is
+    then reused for an upcoming slide. Consumers that keep a slide after
+    the window has moved past it must copy it.
+    """
+
+    def __init__(self, image_files: List[str], process_job: Callable[[str], np.ndarray],
+                 load_cached: Callable[[int], Optional[np.ndarray]] = None,
+                 store: Callable[[int, np.ndarray], None] = None,
+                 max_workers: int = None, lookahead: int = None,
+                 frame_shape: Tuple[int, int, int] = None):
+        self.image_files = list(image_files)
+        self.process_job = process_job
+        self.load_cached = load_cached
+        self.store = store
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        # Enough slides in flight to keep every worker busy
+        self.lookahead = max(2, lookahead or 2 * self.max_workers)
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_worker_context())
+        self._slides = {}  # index -> frame or Future
+        self._window_start = 0
+        self._next_index = 0
+        self.peak_slides = 0  # Most slides held at once, for diagnostics
+
+        # Shared-memory slots: every slide in the window, plus the one being read
+        self.frame_shape = tuple(frame_shape) if frame_shape else None
+        self._slots = []
+        self._free_slots = []
+        self._slot_of = {}  # index -> slot of a queued or ready slide
+        if self.frame_shape:
+            slot_size = int(np.prod(self.frame_shape))
+            num_slots = min(len(self.image_files), self.lookahead + 2)
+            if shared_memory_available(slot_size * num_slots):
+                self._slots = [shared_memory.SharedMemory(create=True, size=slot_size)
+                               for _ in range(num_slots)]
+                self._free_slots = list(self._slots)
+
+    def __len__(self) -> int:
+        return len(self.image_files)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Slide index {index} out of range")
+        if index < self._window_start:
+            # Already released: produce it again without moving the window
+            return self._produce_now(index)
+
+        self._window_start = max(self._window_start, index - 1)
+        for old in [i for i in self._slides if i < self._window_start]:
+            self.release(old)
+        self._queue_until(index + self.lookahead)
+
+        slide = self._slides[index]
+        if isinstance(slide, Future):
+            slide = self._finish(index, slide.result())
+        return slide
+
+    @property
+    def uses_shared_memory(self) -> bool:
+        """True if workers hand slides over through shared-memory slots."""
+        return bool(self._slots)
+
+    def release(self, index: int):
+        """Drop a slide (cancelling it if it hasn't been processed yet) and free its slot."""
+        slide = self._slides.pop(index, None)
+        slot = self._slot_of.pop(index, None)
+        if isinstance(slide, Future) and not slide.cancel() and slot is not None:
+            # A worker is still writing into the slot; reuse it once it's done
+            slide.add_done_callback(lambda _, slot=slot: self._free_slots.append(slot))
+        elif slot is not None:
+            self._free_slots.append(slot)
+
+    def close(self):
+        """Stop the worker processes, drop all slides and free the shared memory."""
+        for index in list(self._slides):
+            self.release(index)
+        self._executor.shutdown(wait=True)
+        for slot in self._slots:
+            try:
+                slot.close()
+            except BufferError:
+                pass  # A consumer still holds a view; the mapping goes with it
+            slot.unlink()
+        self._slots = []
+        self._free_slots = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _queue_until(self, last_index: int):
+        start = max(self._next_index, self._window_start)
+        for index in range(start, min(last_index, len(self) - 1) + 1):
+            frame = self.load_cached(index) if self.load_cached else None
+            if frame is None:
+                frame = self._submit(index)
+            self._slides[index] = frame
+        self._next_index = max(self._next_index, last_index + 1)
+        self.peak_slides = max(self.peak_slides, len(self._slides))
+
+    def _submit(self, index: int) -> Future:
+        if not self._free_slots:
+            # No slots (or all still busy): the frame is pickled back instead
+            return self._executor.submit(self.process_job, self.image_files[index])
+        slot = self._free_slots.pop()
+        self._slot_of[index] = slot
+        return self._executor.submit(_process_into_slot, self.process_job, self.image_files[index],
+                                     slot.name, self.frame_shape)
+
+    def _finish(self, index: int, frame: Optional[np.ndarray]) -> np.ndarray:
+        if frame is None:
+            frame = np.ndarray(self.frame_shape, dtype=np.uint8, buffer=self._slot_of[index].buf)
+            frame.flags.writeable = False
+        elif index in self._slot_of:
+            # The frame didn't fit its slot
+            self._free_slots.append(self._slot_of.pop(index))
+        if self.store:
+            self.store(index, frame)
+        self._slides[index] = frame
+        return frame
+
+    def _produce_now(self, index: int) -> np.ndarray:
+        frame = self.load_cached(index) if self.load_cached else None
+        if frame is None:
+            frame = self._executor.submit(self.process_job, self.image_files[index]).result()
+        return frame
@@ -7,15 +7,19 @@ Creates MP4 videos by combining images with audio for podcast episodes.
 import os
 import sys
 import argparse
+import copy
 import math
+import json
 from pathlib import Path
 from typing import List, Tuple
 import subprocess
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
 except ImportError as e:
     print(f"Missing PIL/Pillow: {e}")
     print("Please install requirements using: pip install -r requirements.txt")
@@ -33,6 +37,7 @@ except ImportError:
         class mp:
             AudioFileClip = moviepy.AudioFileClip
             ImageClip = moviepy.ImageClip
+            VideoClip = moviepy.VideoClip
             concatenate_videoclips = moviepy.concatenate_videoclips
     except ImportError as e:
         print(f"Missing moviepy: {e}")
@@ -40,47 +45,173 @@ except ImportError:
         sys.exit(1)
 
 try:
-    from mutagen import File as AudioFile
+    import numpy as np
 except ImportError as e:
-    print(f"Missing mutagen: {e}")
-    print("Please install mutagen: pip install mutagen")
+    print(f"Missing numpy: {e}")
+    print("Please install requirements using: pip install -r requirements.txt")
     sys.exit(1)
 
+from audio_probe import AudioInfo, AudioProbeIndex
+from chapters import SLIDES_SOURCE, Chapter, script_chapters, slide_chapters, write_ffmetadata
+from encoder_profiles import DEFAULT_PROFILE, EncoderProfile, get_profile
+from ffmpeg_renderer import (VFR_HOLD_SECONDS, FFmpegRenderer, is_complete_mp4, is_mp4_compatible_audio,
+                             run_ffmpeg)
+from frame_store import FrameStore, DEFAULT_MEMORY_BUDGET_MB
+from render_manifest import compute_fingerprint, is_up_to_date, write_manifest
+from segment_encoder import SegmentEncoder, plan_segments
+from slide_cache import SlideCache, DEFAULT_CACHE_SIZE_MB, slide_key
+from slide_pipeline import SlidePipeline
+from timeline import SlideTimeline
+from variants import FILL_MODES, Variant, parse_variants, variant_output_path
+from yuv_pipe import YUVPipeEncoder, YUVTimeline
+
+# File name of the audio probe index inside the cache directory
+AUDIO_INDEX_NAME = "audio_index.json"
+
+# Available render engines for create_slideshow_video
+RENDER_ENGINES = ("moviepy", "ffmpeg", "yuv")
+
+# "best" fully decodes every image; "fast" downscales oversized images while decoding
+DECODE_QUALITIES = ("best", "fast")
+
+# The "blur" background is blurred at 1/BLUR_SCALE of the frame size
+BLUR_SCALE = 8
+BLUR_RADIUS = 4
+
+# Video length per stored segment; an edit or an interrupted render only re-encodes its segments
+SEGMENT_SECONDS = 30
+# Encoded segments of incremental renders are kept next to the output
+SEGMENT_DIR_SUFFIX = ".segments"
+# Checkpoints of an unfinished render (slides and encoded segments) are kept next to the output
+JOB_DIR_SUFFIX = ".job"
+
+# Single-image (static cover) videos: one frame per second and a keyframe every minute
+STATIC_FPS = 1
+STATIC_GOP_SECONDS = 60
+
+# Preview renders: small frames and the draft encoder profile (low fps, fastest preset)
+PREVIEW_SHORT_SIDE = 360
+PREVIEW_PROFILE = "draft"
+# Seconds kept before and after each slide change when previewing transitions only
+PREVIEW_WINDOW_SECONDS = 2.0
+# Previews are written next to the output as <name>.preview.mp4
+PREVIEW_SUFFIX = ".preview"
+
+
+def _process_image_job(generator, image_path: str) -> np.ndarray:
+    """Resize a single image into an RGB array (runs in a worker process)."""
+    processed_img = generator.resize_image_to_fit(image_path, generator.output_resolution)
+    return np.asarray(processed_img)
+
+
+def _process_variants_job(generators: list, image_path: str) -> List[np.ndarray]:
+    """Decode an image once and fit it to every generator's variant (runs in a worker process)."""
+    img = generators[0].decode_image(image_path, [(g.output_resolution, g.fill_mode) for g in generators])
+    return [np.asarray(g.fit_image(img, g.output_resolution, g.fill_mode)) for g in generators]
+
+
+def scaled_size(image_size: Tuple[int, int], target_size: Tuple[int, int],
+                cover: bool = False) -> Tuple[int, int]:
+    """Size of an image scaled to fit inside target_size (or to cover it)."""
+    width, height = image_size
+    img_ratio = width / height
+    target_ratio = target_size[0] / target_size[1]
+    # Covering rounds up so the scaled image never falls short of the frame
+    rounding = math.ceil if cover else int
+    if (img_ratio > target_ratio) != cover:
+        # Scale by width
+        return target_size[0], max(1, rounding(target_size[0] / img_ratio))
+    # Scale by height
+    return max(1, rounding(target_size[1] * img_ratio)), target_size[1]
+
+
+def preview_output_path(output_path: str) -> str:
+    """Where the preview of output_path is written (episode.mp4 -> episode.preview.mp4)."""
+    root, ext = os.path.splitext(output_path)
+    return root + PREVIEW_SUFFIX + (ext or ".mp4")
+
+
+def preview_resolution(resolution: Tuple[int, int], short_side: int = PREVIEW_SHORT_SIDE) -> Tuple[int, int]:
+    """Scale resolution down so its shorter side is short_side, keeping even dimensions."""
+    width, height = resolution
+    scale = min(1.0, short_side / min(width, height))
+    return (max(2, int(round(width * scale / 2)) * 2), max(2, int(round(height * scale / 2)) * 2))
+
+
+def preview_windows(timeline: SlideTimeline, fps: float, minutes: float = None,
+                    transitions: bool = False) -> List[Tuple[int, int]]:
+    """Frame ranges (start, end) a preview shows.
+    
+    The whole timeline, or only its first minutes; with transitions only
+    PREVIEW_WINDOW_SECONDS around every slide change (overlapping windows merged).
+    """
+    boundaries = timeline.frame_boundaries(fps)
+    total = boundaries[-1]
+    if minutes:
+        total = min(total, max(1, int(round(minutes * 60 * fps))))
+    if not transitions:
+        return [(0, total)]
+    reach = int(round(PREVIEW_WINDOW_SECONDS * fps))
+    windows = []
+    for boundary in boundaries[1:-1]:
+        start, end = max(0, boundary - reach), min(total, boundary + reach)
+        if start >= end:
+            break  # Past the first minutes
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+    return windows or [(0, total)]
+
 
 class SlideshowGenerator:
     """Generate slideshow videos from images and audio."""
     
-    def __init__(self, output_resolution: Tuple[int, int] = (1920, 1080)):
+    def __init__(self, output_resolution: Tuple[int, int] = (1920, 1080), use_cache: bool = True,
+                 cache_dir: str = None, cache_size_mb: float = DEFAULT_CACHE_SIZE_MB,
+                 decode_quality: str = "best", fill_mode: str = "fit"):
+        if decode_quality not in DECODE_QUALITIES:
+            raise ValueError(f"decode_quality must be one of: {', '.join(DECODE_QUALITIES)}")
+        if fill_mode not in FILL_MODES:
+            raise ValueError(f"fill_mode must be one of: {', '.join(FILL_MODES)}")
         self.output_resolution = output_resolution
+        self.decode_quality = decode_quality
+        self.fill_mode = fill_mode
+        self.slide_cache = SlideCache(cache_dir, cache_size_mb) if use_cache else None
+        # Probe results persist next to the slide cache; without a cache they live in memory
+        self.audio_index = AudioProbeIndex(
+            os.path.join(self.slide_cache.cache_dir, AUDIO_INDEX_NAME) if self.slide_cache else None)
         self.supported_image_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
         self.supported_audio_formats = {'.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac'}
     
-    def get_audio_duration(self, audio_path: str) -> float:
-        """Get duration of audio file in seconds."""
-        try:
-            audio_file = AudioFile(audio_path)
-            if audio_file is not None and hasattr(audio_file, 'info'):
-                return float(audio_file.info.length)
-        except Exception:
-            pass
+    def get_audio_info(self, audio_path: str) -> AudioInfo:
+        """Get duration, codec, sample rate and channels of an audio file.
         
-        # Fallback using moviepy
+        Results are read from container headers and remembered in the audio
+        index, so the same file is never probed twice.
+        """
         try:
-            audio = mp.AudioFileClip(audio_path)
-            duration = audio.duration
-            audio.close()
-            return duration
+            return self.audio_index.get(audio_path)
         except Exception as e:
             raise ValueError(f"Could not determine audio duration: {e}")
     
+    def get_audio_duration(self, audio_path: str) -> float:
+        """Get duration of audio file in seconds."""
+        return self.get_audio_info(audio_path).duration
+    
     def get_image_files(self, image_dir: str) -> List[str]:
-        """Get all supported image files from directory."""
+        """Get all supported image files from directory (or a single image file)."""
         image_files = []
         image_path = Path(image_dir)
         
         if not image_path.exists():
             raise FileNotFoundError(f"Image directory not found: {image_dir}")
         
+        if image_path.is_file():
+            if image_path.suffix.lower() not in self.supported_image_formats:
+                raise ValueError(f"Unsupported image format: {image_dir}")
+            return [str(image_path)]
+        
         for file_path in image_path.iterdir():
             if file_path.suffix.lower() in self.supported_image_formats:
                 image_files.append(str(file_path))
@@ -93,39 +224,647 @@ class SlideshowGenerator:
         return image_files
     
     def resize_image_to_fit(self, image_path: str, target_size: Tuple[int, int]) -> Image.Image:
-        """Resize image to fit target size while maintaining aspect ratio."""
+        """Resize image to target size in the generator's fill mode (default: fit).
+        
+        With decode_quality="fast", oversized images are first shrunk cheaply
+        (JPEG DCT-domain scaling via Image.draft, then Image.reduce by an
+        integer factor) so LANCZOS only handles the remaining ratio.
+        """
+        img = self.decode_image(image_path, [(target_size, self.fill_mode)])
+        return self.fit_image(img, target_size, self.fill_mode)
+    
+    def decode_image(self, image_path: str, targets: List[Tuple[Tuple[int, int], str]]) -> Image.Image:
+        """Decode an image to RGB once for every (target size, fill mode) in targets.
+        
+        With decode_quality="fast" it is decoded no larger than the biggest
+        target needs.
+        """
         with Image.open(image_path) as img:
+            # Calculate the largest scaled size needed (from the header size)
+            needed = [scaled_size(img.size, target_size, fill_mode == "fill")
+                      for target_size, fill_mode in targets]
+            new_width = max(size[0] for size in needed)
+            new_height = max(size[1] for size in needed)
+            
+            if self.decode_quality == "fast":
+                # Decode JPEGs at 1/2, 1/4 or 1/8 scale, never below the target size
+                img.draft('RGB', (new_width, new_height))
+            
             # Convert to RGB if necessary
             if img.mode != 'RGB':
                 img = img.convert('RGB')
-            
-            # Calculate scaling to fit within target size
-            img_ratio = img.width / img.height
-            target_ratio = target_size[0] / target_size[1]
-            
-            if img_ratio > target_ratio:
-                # Image is wider, scale by width
-                new_width = target_size[0]
-                new_height = int(target_size[0] / img_ratio)
             else:
-                # Image is taller, scale by height
-                new_height = target_size[1]
-                new_width = int(target_size[1] * img_ratio)
+                img.load()
             
-            # Resize image
+            if self.decode_quality == "fast":
+                factor = min(img.width // new_width, img.height // new_height)
+                if factor >= 2:
+                    img = img.reduce(factor)
+            return img
+    
+    def fit_image(self, img: Image.Image, target_size: Tuple[int, int], fill_mode: str = "fit") -> Image.Image:
+        """Resize a decoded image to exactly target_size.
+        
+        "fit" shows the whole image centered on black bars, "fill" covers the
+        frame and crops the overflow, and "blur" shows the whole image over a
+        blurred, zoomed copy of itself (e.g. landscape photos in vertical video).
+        """
+        if fill_mode == "fill":
+            new_width, new_height = scaled_size(img.size, target_size, cover=True)
             resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
+            x_offset = (new_width - target_size[0]) // 2
+            y_offset = (new_height - target_size[1]) // 2
+            return resized.crop((x_offset, y_offset, x_offset + target_size[0], y_offset + target_size[1]))
+        
+        new_width, new_height = scaled_size(img.size, target_size)
+        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        
+        if fill_mode == "blur":
+            # Blurring a small copy and scaling it up is much cheaper than a wide blur
+            small = (max(1, target_size[0] // BLUR_SCALE), max(1, target_size[1] // BLUR_SCALE))
+            background = self.fit_image(img, small, "fill").filter(ImageFilter.GaussianBlur(BLUR_RADIUS))
+            canvas = background.resize(target_size, Image.Resampling.BILINEAR)
+        else:
             # Create canvas with target size and center the image
             canvas = Image.new('RGB', target_size, (0, 0, 0))
-            x_offset = (target_size[0] - new_width) // 2
-            y_offset = (target_size[1] - new_height) // 2
-            canvas.paste(resized, (x_offset, y_offset))
+        x_offset = (target_size[0] - new_width) // 2
+        y_offset = (target_size[1] - new_height) // 2
+        canvas.paste(resized, (x_offset, y_offset))
+        return canvas
+    
+    def load_cached_slide(self, cache: SlideCache, image_path: str):
+        """Look up the processed slide of image_path in cache.
+        
+        Returns (cache key, memory-mapped frame or None). A damaged entry
+        counts as a miss.
+        """
+        key = cache.make_key(image_path, self.output_resolution, self.fill_mode,
+                             decode_quality=self.decode_quality)
+        expected_shape = (self.output_resolution[1], self.output_resolution[0], 3)
+        return key, cache.get(key, expected_shape)
+    
+    def process_images(self, image_files: List[str], temp_dir: str, progress_callback=None,
+                       max_workers: int = None,
+                       memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                       slide_cache: SlideCache = None) -> FrameStore:
+        """Resize all images into RGB frames, in parallel when max_workers > 1.
+        
+        Slides already in the slide cache (or the given slide_cache, e.g. a
+        job's checkpoint directory) are reused instead of reprocessed, once
+        verified to be intact. Frames stay in memory up to memory_budget_mb;
+        the rest are memory-mapped from the cache or from lossless spill files
+        in temp_dir. Results and progress messages are produced in the
+        original image order.
+        """
+        num_images = len(image_files)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, max_workers)
+        frames = FrameStore(num_images, temp_dir, memory_budget_mb)
+        
+        def report(i, img_path):
+            progress = 20 + (i / num_images) * 30  # 20-50% for image processing
+            if progress_callback:
+                progress_callback(f"Processing image {i+1}/{num_images}: {os.path.basename(img_path)}", progress)
+            print(f"Processing image {i+1}/{num_images}: {os.path.basename(img_path)}")
+        
+        # Reuse cached slides and only process new or changed images
+        cache = slide_cache or self.slide_cache
+        cache_keys = [None] * num_images
+        pending = []
+        for i, img_path in enumerate(image_files):
+            if cache:
+                cache_keys[i], frame = self.load_cached_slide(cache, img_path)
+                if frame is not None:
+                    frames.add(i, frame)
+                    continue
+            pending.append(i)
+        
+        if cache:
+            print(f"Slide cache: {num_images - len(pending)} of {num_images} images already processed")
+        
+        def store(i, frame):
+            cached_path = cache.put(cache_keys[i], frame) if cache else None
+            frames.add(i, frame, backing_path=cached_path)
+        
+        pending_set = set(pending)
+        max_workers = min(max_workers, max(1, len(pending)))
+        if max_workers == 1:
+            for i, img_path in enumerate(image_files):
+                report(i, img_path)
+                if i in pending_set:
+                    store(i, _process_image_job(self, img_path))
+            return frames
+        
+        print(f"Using {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {i: executor.submit(_process_image_job, self, image_files[i]) for i in pending}
+            try:
+                for i, img_path in enumerate(image_files):
+                    if i in futures:
+                        store(i, futures[i].result())
+                    report(i, img_path)
+            except BaseException:
+                # Don't wait for queued images when cancelled or failed
+                for future in futures.values():
+                    future.cancel()
+                raise
+        
+        return frames
+    
+    def stream_images(self, image_files: List[str], max_workers: int = None,
+                      slide_cache: SlideCache = None) -> SlidePipeline:
+        """Process images on demand, a few slides ahead of the renderer.
+        
+        Unlike process_images, nothing is processed up front: the renderer
+        starts right away, worker processes resize the upcoming slides while
+        earlier ones are encoded, and slides are released once rendered.
+        Workers hand slides over in shared memory rather than pickling them.
+        Cached slides are memory-mapped; new ones are added to the cache.
+        """
+        cache = slide_cache or self.slide_cache
+        num_images = len(image_files)
+        cache_keys = {}
+        
+        def load_cached(i):
+            if not cache:
+                return None
+            cache_keys[i], frame = self.load_cached_slide(cache, image_files[i])
+            return frame
+        
+        def store(i, frame):
+            print(f"Processed image {i+1}/{num_images}: {os.path.basename(image_files[i])}")
+            if cache:
+                cache.put(cache_keys[i], frame)
+        
+        width, height = self.output_resolution
+        return SlidePipeline(image_files, partial(_process_image_job, self), load_cached, store,
+                             max_workers, frame_shape=(height, width, 3))
+    
+    def make_renderer(self, profile: EncoderProfile, threads: int = None,
+                      fps: float = None, vfr: bool = False) -> FFmpegRenderer:
+        """FFmpegRenderer encoding with profile's settings (threads: the profile's by default)."""
+        fps = fps or profile.fps
+        return FFmpegRenderer(fps=fps, codec='libx264', audio_codec='aac',
+                              threads=threads or profile.threads, audio_index=self.audio_index,
+                              encoder_args=profile.codec_args(fps, vfr=vfr), vfr=vfr,
+                              keyframe_interval=profile.gop_seconds)
+    
+    def episode_chapters(self, chapters: str, image_files: List[str], time_per_image: float,
+                         duration: float, fps: float, static: bool = False) -> List[Chapter]:
+        """Chapters from SLIDES_SOURCE or a script directory (none without chapters).
+        
+        Slide starts are snapped to the frame grid, so chapters start on the
+        slide changes, where every engine forces a keyframe.
+        """
+        if not chapters:
+            return []
+        slide_starts = [int(round(i * time_per_image * fps)) / fps for i in range(len(image_files))]
+        if chapters == SLIDES_SOURCE:
+            chapter_list = slide_chapters(image_files, slide_starts, duration)
+        else:
+            chapter_list = script_chapters(chapters, duration, None if static else slide_starts)
+        print(f"Chapters: {len(chapter_list)} from "
+              f"{'slide filenames' if chapters == SLIDES_SOURCE else chapters}")
+        return chapter_list
+    
+    def render_settings(self, silent_mode: bool, time_per_image: float, transition_duration: float,
+                        engine: str, segments: int, incremental: bool, static: bool,
+                        profile: EncoderProfile, vfr: bool, chapters: List[Chapter]) -> dict:
+        """Everything besides the input files that changes the output (fingerprinted in the manifest)."""
+        return {
+            "resolution": list(self.output_resolution),
+            "decode_quality": self.decode_quality,
+            "fill_mode": self.fill_mode,
+            "silent_mode": silent_mode,
+            "time_per_image": time_per_image,
+            "transition_duration": transition_duration,
+            "engine": engine,
+            "segments": segments,
+            "incremental": incremental,
+            "static": static,
+            "fps": STATIC_FPS if static else profile.fps,
+            "profile": profile._asdict(),
+            "vfr": vfr and not static,
+            "chapters": [list(chapter) for chapter in chapters],
+            "codec": "libx264",
+            "audio_codec": "aac",
+        }
+    
+    def add_chapters(self, output_path: str, chapters: List[Chapter], temp_dir: str,
+                     progress_callback=None):
+        """Add chapter markers to a finished video (stream copy, replaces output_path)."""
+        if progress_callback:
+            progress_callback("Adding chapters...", 99)
+        print(f"Adding {len(chapters)} chapters")
+        metadata_path = os.path.join(temp_dir, "chapters.txt")
+        write_ffmetadata(chapters, metadata_path)
+        root, ext = os.path.splitext(output_path)
+        chaptered_path = f"{root}.chapters{ext}"
+        renderer = FFmpegRenderer(audio_index=self.audio_index)
+        cmd = renderer.chapters_command(output_path, metadata_path, chaptered_path)
+        run_ffmpeg(cmd, chapters[-1].end, message="Adding chapters",
+                   log_path=os.path.join(temp_dir, "chapters.log"))
+        os.replace(chaptered_path, output_path)
+    
+    def render_with_moviepy(self, frames: FrameStore, time_per_image: float, output_path: str,
+                            temp_dir: str, audio_path: str = None, audio_duration: float = None,
+                            transition_duration: float = 0.5, progress_callback=None,
+                            encoder_threads: int = None, chunk_dir: str = None,
+                            profile: EncoderProfile = None):
+        """Render slides with moviepy, drawing each frame from a SlideTimeline.
+        
+        The video is written without audio into temp_dir; the audio is then
+        muxed in by ffmpeg, copying AAC as-is and transcoding anything else.
+        With chunk_dir the video is written as resumable segments there.
+        profile sets the encoder settings (default: standard).
+        """
+        profile = profile or get_profile(DEFAULT_PROFILE)
+        fps = profile.fps
+        encoder_threads = encoder_threads or profile.threads
+        if progress_callback:
+            progress_callback("Building slide timeline...", 50)
+        print("Building slide timeline...")
+        
+        # The timeline finds the active slide(s) for each frame by bisecting
+        # precomputed boundaries instead of checking every clip
+        timeline = SlideTimeline(frames, [time_per_image] * len(frames), transition_duration, fps=fps)
+        video = mp.VideoClip(timeline.get_frame, duration=timeline.duration)
+        
+        if progress_callback:
+            progress_callback("Timeline ready", 70)
+        
+        if audio_path:
+            # Trim video to match audio duration exactly
+            if progress_callback:
+                progress_callback("Synchronizing video with audio...", 80)
+            if video.duration > audio_duration:
+                video = video.subclip(0, audio_duration)
+            elif video.duration < audio_duration:
+                # Loop video if it's shorter than audio
+                loops_needed = math.ceil(audio_duration / video.duration)
+                video = mp.concatenate_videoclips([video] * loops_needed)
+                video = video.subclip(0, audio_duration)
+        else:
+            # Silent mode - no audio processing needed
+            if progress_callback:
+                progress_callback("Preparing silent video...", 75)
+            print("Creating silent video...")
+        
+        if progress_callback:
+            progress_callback("Rendering final video...", 85)
+        print(f"Rendering final video to: {output_path}")
+        
+        renderer = self.make_renderer(profile, encoder_threads)
+        if chunk_dir:
+            def encode_range(start, end, path):
+                # Frames are taken at t = k / fps while t < duration, so ending half a
+                # frame early gives exactly end - start frames
+                video.subclip(start / fps, (end - 0.5) / fps).write_videofile(
+                    path,
+                    fps=fps,
+                    codec='libx264',
+                    preset=profile.preset,
+                    audio=False,
+                    threads=encoder_threads,
+                    ffmpeg_params=profile.codec_args(fps, preset=False) +
+                                  renderer.keyframe_args(timeline.keyframe_times(start, end)),
+                    verbose=False,
+                    logger=None
+                )
+            segment_paths, segment_durations = self.write_video_segments(timeline, int(round(video.duration * fps)),
+                                                      chunk_dir, encode_range, progress_callback, fps)
+        else:
+            # Write the video track; with audio it goes to a per-job temp file first
+            video_path = os.path.join(temp_dir, "video.mp4") if audio_path else output_path
+            video.write_videofile(
+                video_path,
+                fps=fps,
+                codec='libx264',
+                preset=profile.preset,
+                audio=False,
+                threads=encoder_threads,
+                ffmpeg_params=profile.codec_args(fps, preset=False) +
+                              renderer.keyframe_args(timeline.keyframe_times(0, int(round(video.duration * fps)))),
+                verbose=False,
+                logger=None
+            )
+        
+        print(f"Video rendering completed.")
+        duration = video.duration
+        
+        # Clean up resources immediately
+        print("Cleaning up resources...")
+        video.close()
+        
+        # Force garbage collection
+        import gc
+        gc.collect()
+        
+        if chunk_dir:
+            # Join the segments by stream copy and add the audio in the same pass
+            if progress_callback:
+                progress_callback("Joining segments...", 95)
+            print("Joining segments..." + (" and adding audio track" if audio_path else ""))
+            cmd = SegmentEncoder(renderer, 1).concat_command(segment_paths, output_path, temp_dir,
+                                                             duration, audio_path, segment_durations)
+            run_ffmpeg(cmd, duration, progress_callback, progress_range=(95, 99),
+                       message="Joining segments", cwd=temp_dir,
+                       log_path=os.path.join(temp_dir, "concat.log"))
+        elif audio_path:
+            if progress_callback:
+                progress_callback("Adding audio track...", 95)
+            print("Adding audio track...")
+            cmd = renderer.mux_audio_command(video_path, audio_path, output_path, audio_duration)
+            run_ffmpeg(cmd, audio_duration, progress_callback, progress_range=(95, 99),
+                       message="Adding audio track", log_path=os.path.join(temp_dir, "mux.log"))
+    
+    def write_video_segments(self, timeline: SlideTimeline, total_frames: int, chunk_dir: str,
+                             encode_range, progress_callback=None,
+                             fps: float = 24) -> Tuple[List[str], List[float]]:
+        """Write a video as segments of about SEGMENT_SECONDS, cut on slide boundaries.
+        
+        encode_range(start, end, path) encodes frames start..end - 1 to path.
+        Every finished segment stays in chunk_dir, and intact segments already
+        there are reused, so an interrupted render continues where it stopped.
+        Returns the segment paths and their durations in seconds, in order.
+        """
+        os.makedirs(chunk_dir, exist_ok=True)
+        # The video may be trimmed or looped to the audio, so clamp the cuts to its length
+        cuts = sorted({min(segment.start_frame, total_frames)
+                       for segment in plan_segments(timeline, math.ceil(timeline.duration / SEGMENT_SECONDS), fps)})
+        ranges = [(start, end) for start, end in zip(cuts, cuts[1:] + [total_frames]) if end > start]
+        
+        segment_paths = []
+        reused = 0
+        for i, (start, end) in enumerate(ranges):
+            path = os.path.join(chunk_dir, f"part_{start:08d}_{end:08d}.mp4")
+            segment_paths.append(path)
+            if is_complete_mp4(path):
+                reused += 1
+                continue
+            if progress_callback:
+                progress_callback(f"Encoding segment {i + 1}/{len(ranges)}...",
+                                  85 + 10 * start / max(1, total_frames))
+            partial_path = os.path.splitext(path)[0] + ".partial.mp4"
+            encode_range(start, end, partial_path)
+            os.replace(partial_path, path)
+        if reused:
+            print(f"Reused {reused} of {len(ranges)} encoded segments")
+        return segment_paths, [(end - start) / fps for start, end in ranges]
+    
+    def render_with_yuv(self, frames: FrameStore, time_per_image: float, output_path: str,
+                        temp_dir: str, audio_path: str = None, audio_duration: float = None,
+                        transition_duration: float = 0.5, progress_callback=None,
+                        encoder_threads: int = None, chunk_dir: str = None,
+                        profile: EncoderProfile = None, vfr: bool = False):
+        """Render slides by piping raw YUV420 frames from a YUVTimeline into ffmpeg.
+        
+        Like the moviepy engine every frame is composited in Python, but each
+        slide is converted to yuv420p once and still frames reuse its bytes,
+        so ffmpeg gets half the data and no pixel format conversion. The
+        video is written without audio and the audio muxed in afterwards;
+        with chunk_dir it is written as resumable segments there. With vfr
+        only crossfade frames and one frame per VFR_HOLD_SECONDS of held
+        slides are composited and encoded.
+        """
+        if progress_callback:
+            progress_callback("Rendering final video...", 85)
+        print(f"Rendering final video as YUV420 frames to: {output_path}")
+        
+        renderer = self.make_renderer(profile or get_profile(DEFAULT_PROFILE), encoder_threads, vfr=vfr)
+        timeline = YUVTimeline(frames, [time_per_image] * len(frames), transition_duration,
+                               fps=renderer.fps)
+        encoder = YUVPipeEncoder(renderer, self.output_resolution)
+        duration = audio_duration if audio_path else timeline.duration
+        total_frames = int(round(duration * renderer.fps))
+        
+        if chunk_dir:
+            def encode_range(start, end, path):
+                encoder.encode(timeline, start, end, path,
+                               log_path=os.path.join(temp_dir, "encode.log"))
+            segment_paths, segment_durations = self.write_video_segments(timeline, total_frames, chunk_dir,
+                                                      encode_range, progress_callback, renderer.fps)
+            if progress_callback:
+                progress_callback("Joining segments...", 95)
+            print("Joining segments..." + (" and adding audio track" if audio_path else ""))
+            cmd = SegmentEncoder(renderer, 1).concat_command(segment_paths, output_path, temp_dir,
+                                                             duration, audio_path, segment_durations)
+            run_ffmpeg(cmd, duration, progress_callback, progress_range=(95, 99),
+                       message="Joining segments", cwd=temp_dir,
+                       log_path=os.path.join(temp_dir, "concat.log"))
+        else:
+            video_path = os.path.join(temp_dir, "video.mp4") if audio_path else output_path
+            encoder.encode(timeline, 0, total_frames, video_path, progress_callback,
+                           log_path=os.path.join(temp_dir, "encode.log"))
+            if audio_path:
+                if progress_callback:
+                    progress_callback("Adding audio track...", 95)
+                print("Adding audio track...")
+                cmd = renderer.mux_audio_command(video_path, audio_path, output_path, duration)
+                run_ffmpeg(cmd, duration, progress_callback, progress_range=(95, 99),
+                           message="Adding audio track", log_path=os.path.join(temp_dir, "mux.log"))
+        print("Video rendering completed.")
+    
+    def render_static(self, image_path: str, duration: float, output_path: str, temp_dir: str,
+                      audio_path: str = None, progress_callback=None, encoder_threads: int = None,
+                      slide_cache: SlideCache = None, profile: EncoderProfile = None,
+                      frame: np.ndarray = None):
+        """Render one still image for the whole duration (static cover art video).
+        
+        Instead of compositing every frame, one GOP of STATIC_GOP_SECONDS at
+        STATIC_FPS is encoded with x264's stillimage tuning and then repeated
+        by stream copy for the whole duration, so even an hour-long episode
+        renders in seconds into a small file. frame is the already processed
+        slide, if there is one.
+        """
+        if progress_callback:
+            progress_callback("Processing cover image...", 20)
+        print(f"Static video: {os.path.basename(image_path)} for the whole {'audio' if audio_path else 'video'}")
+        cache = slide_cache or self.slide_cache
+        if frame is None and cache:
+            key, frame = self.load_cached_slide(cache, image_path)
+        if frame is None:
+            frame = np.asarray(self.resize_image_to_fit(image_path, self.output_resolution))
+            if cache:
+                cache.put(key, frame)
+        
+        if progress_callback:
+            progress_callback("Rendering final video...", 85)
+        print(f"Rendering static video with ffmpeg to: {output_path}")
+        # The still clip sets its own tuning and keyframe interval
+        profile = (profile or get_profile(DEFAULT_PROFILE))._replace(tune=None, gop_seconds=None)
+        renderer = self.make_renderer(profile, encoder_threads, fps=STATIC_FPS)
+        slide_name = renderer.write_slides([frame], temp_dir)[0]
+        clip_path = os.path.join(temp_dir, "still.mp4")
+        clip_seconds = min(duration, STATIC_GOP_SECONDS)
+        cmd = renderer.build_still_command(os.path.join(temp_dir, slide_name), clip_seconds, clip_path)
+        run_ffmpeg(cmd, clip_seconds, progress_callback, progress_range=(85, 90),
+                   message="Encoding still image", log_path=os.path.join(temp_dir, "still.log"))
+        
+        if progress_callback:
+            progress_callback("Looping still image over the audio...", 90)
+        cmd = renderer.build_loop_command(clip_path, duration, output_path, audio_path)
+        run_ffmpeg(cmd, duration, progress_callback, progress_range=(90, 99),
+                   message="Looping still image", log_path=os.path.join(temp_dir, "render.log"))
+        print("Video rendering completed.")
+    
+    def render_with_ffmpeg(self, frames: FrameStore, time_per_image: float, output_path: str,
+                           temp_dir: str, audio_path: str = None,
+                           transition_duration: float = 0.5, progress_callback=None,
+                           segments: int = 1, encoder_threads: int = None,
+                           slide_keys: List[str] = None, chunk_dir: str = None,
+                           profile: EncoderProfile = None, vfr: bool = False):
+        """Render slides by handing the slide list and durations straight to ffmpeg.
+        
+        The timeline is split on slide boundaries into segments of about
+        SEGMENT_SECONDS (at least segments of them), encoded up to segments
+        at a time and joined by stream copy. encoder_threads caps the encoder
+        threads of the whole render.
+        
+        With chunk_dir and slide_keys (one per slide) the segments are stored
+        in chunk_dir, and segments already there for the same slides and
+        timing are reused, so only changed or unfinished segments are encoded
+        (incremental and resumed renders). profile sets the encoder settings (default: standard); with
+        vfr held slides are encoded at a variable, much lower frame rate.
+        """
+        profile = profile or get_profile(DEFAULT_PROFILE)
+        encoder_threads = encoder_threads or profile.threads
+        durations = [time_per_image] * len(frames)
+        if progress_callback:
+            progress_callback("Rendering final video...", 85)
+        print(f"Rendering final video with ffmpeg to: {output_path}")
+        
+        # One ffmpeg graph per segment of about SEGMENT_SECONDS keeps the number
+        # of slide inputs per process bounded however long the episode is
+        if segments > 1:
+            # Split the cores between the segment encoders so they don't oversubscribe
+            encoder_threads = max(1, (encoder_threads or os.cpu_count() or 1) // segments)
+        renderer = self.make_renderer(profile, encoder_threads, vfr=vfr)
+        timeline = SlideTimeline(frames, durations, transition_duration, fps=renderer.fps)
+        num_segments = max(segments, math.ceil(timeline.duration / SEGMENT_SECONDS))
+        encoder = SegmentEncoder(renderer, num_segments, max_parallel=segments)
+        encoder.render(frames, timeline, output_path, temp_dir, audio_path, progress_callback,
+                       chunk_dir=chunk_dir, slide_keys=slide_keys)
+        print("Video rendering completed.")
+    
+    def create_preview_video(self, image_dir: str, audio_path: str = None, output_path: str = None,
+                             transition_duration: float = 0.5, progress_callback=None,
+                             silent_mode: bool = False, image_duration: float = 3.0,
+                             minutes: float = None, transitions: bool = False,
+                             max_workers: int = None, profile_config: str = None) -> dict:
+        """Render a quick draft of the slideshow to check slide order and pacing.
+        
+        Uses the same slide timing and transitions as create_slideshow_video,
+        at PREVIEW_SHORT_SIDE pixels with the draft encoder profile (from
+        profile_config if given), through the YUV frame pipe. minutes limits
+        the preview to the start of the episode; transitions keeps only the
+        windows around each slide change (with the matching audio). Slides come from the slide cache
+        when possible: preview-sized ones, or production ones scaled down.
+        
+        Returns a summary dict like create_slideshow_video.
+        """
+        import time
+        start_time = time.time()
+        
+        if not silent_mode and not audio_path:
+            raise ValueError("Audio path is required when not in silent mode")
+        if not silent_mode and not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if self.slide_cache:
+            self.slide_cache.reset_stats()
+        if progress_callback:
+            progress_callback("Preparing preview...", 5)
+        
+        image_files = self.get_image_files(image_dir)
+        num_images = len(image_files)
+        if silent_mode:
+            audio_path = None
+            time_per_image = image_duration
+        else:
+            time_per_image = self.get_audio_info(audio_path).duration / num_images
+        
+        resolution = preview_resolution(self.output_resolution)
+        profile = get_profile(PREVIEW_PROFILE, profile_config)
+        fps = profile.fps
+        print(f"Preview: {num_images} images at {resolution[0]}x{resolution[1]}, {fps} fps")
+        # Same image processing as a full render, at preview size
+        preview = SlideshowGenerator(output_resolution=resolution, use_cache=False, decode_quality="fast",
+                                     fill_mode=self.fill_mode)
+        cache = self.slide_cache
+        cache_keys = {}
+        
+        def load_cached(i):
+            if not cache:
+                return None
+            cache_keys[i], frame = preview.load_cached_slide(cache, image_files[i])
+            if frame is None:
+                # Scale down the production slide if it's cached
+                _, full_frame = self.load_cached_slide(cache, image_files[i])
+                if full_frame is not None:
+                    frame = np.asarray(Image.fromarray(full_frame).resize(resolution, Image.Resampling.BILINEAR))
+            return frame
+        
+        def store(i, frame):
+            if cache:
+                cache.put(cache_keys[i], frame)
+        
+        renderer = self.make_renderer(profile)
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                SlidePipeline(image_files, partial(_process_image_job, preview), load_cached, store,
+                              max_workers, frame_shape=(resolution[1], resolution[0], 3)) as slides:
+            timeline = YUVTimeline(slides, [time_per_image] * num_images, transition_duration,
+                                   fps=fps)
+            windows = preview_windows(timeline, fps, minutes, transitions)
+            frame_numbers = [k for start, end in windows for k in range(start, end)]
+            duration = len(frame_numbers) / fps
+            print(f"Rendering {duration:.1f} seconds of preview"
+                  + (f" ({len(windows)} windows around slide changes)" if transitions else ""))
             
-            return canvas
+            video_path = os.path.join(temp_dir, "video.mp4") if audio_path else output_path
+            YUVPipeEncoder(renderer, resolution).encode_frames(
+                timeline, frame_numbers, video_path, progress_callback, progress_range=(10, 90),
+                message="Rendering preview", log_path=os.path.join(temp_dir, "encode.log"))
+            if audio_path:
+                if progress_callback:
+                    progress_callback("Adding audio track...", 90)
+                if transitions:
+                    cmd = renderer.mux_audio_windows_command(
+                        video_path, audio_path, output_path,
+                        [(start / fps, end / fps) for start, end in windows], temp_dir)
+                else:
+                    cmd = renderer.mux_audio_command(video_path, audio_path, output_path, duration)
+                run_ffmpeg(cmd, duration, progress_callback, progress_range=(90, 99),
+                           message="Adding audio track", log_path=os.path.join(temp_dir, "mux.log"))
+        
+        render_time = time.time() - start_time
+        file_size = os.path.getsize(output_path)
+        if progress_callback:
+            progress_callback(f"Preview ready ({file_size / (1024*1024):.1f} MB) - {render_time:.1f}s", 100)
+        print(f"✅ Preview created: {output_path} ({file_size / (1024*1024):.1f} MB, {render_time:.1f} seconds)")
+        return {
+            "output_path": output_path,
+            "num_images": num_images,
+            "video_duration": duration,
+            "render_time": render_time,
+            "file_size": file_size,
+            "profile": profile.name,
+            "cache_hits": self.slide_cache.hits if self.slide_cache else 0,
+            "cache_misses": self.slide_cache.misses if self.slide_cache else 0,
+            "up_to_date": False,
+        }
     
     def create_slideshow_video(self, image_dir: str, audio_path: str = None, output_path: str = None, 
                              transition_duration: float = 0.5, progress_callback=None, 
-                             silent_mode: bool = False, image_duration: float = 3.0) -> None:
+                             silent_mode: bool = False, image_duration: float = 3.0,
+                             max_workers: int = None,
+                             memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                             engine: str = "moviepy", segments: int = 1,
+                             encoder_threads: int = None, force: bool = False,
+                             incremental: bool = False, resume: bool = False,
+                             pipeline: bool = True, static: bool = False,
+                             profile: str = DEFAULT_PROFILE, profile_config: str = None,
+                             vfr: bool = False, chapters: str = None) -> dict:
         """Create slideshow video from images and optionally audio.
         
         Args:
@@ -136,27 +875,79 @@ class SlideshowGenerator:
             progress_callback: Optional callback function for progress updates
             silent_mode: If True, create video without audio
             image_duration: Duration per image in seconds (for silent mode)
+            max_workers: Worker processes for image preprocessing (default: CPU count)
+            memory_budget_mb: RAM for in-memory slides before spilling to memory-mapped files
+            engine: "moviepy" (frame-by-frame compositing), "ffmpeg" (direct ffmpeg render)
+                or "yuv" (frame-by-frame compositing piped to ffmpeg as raw YUV420)
+            segments: Number of segments encoded in parallel (ffmpeg engine only)
+            encoder_threads: Threads for video encoding (default: the profile's setting)
+            force: Render even if the output is up to date with its inputs and settings
+            incremental: Keep encoded segments next to the output and only re-encode
+                segments whose slides or timing changed (ffmpeg engine only)
+            resume: Continue an interrupted render from the checkpoints (processed
+                slides and encoded segments) in the job directory next to the output
+            pipeline: Stream slides to the renderer as they are processed instead of
+                processing all images first (memory stays flat; memory_budget_mb unused)
+            static: Show only the first image for the whole video, encoded as a
+                looped still (always used when there is a single image)
+            profile: Encoder profile name (draft, standard, archive, small-upload
+                or one defined in the profile config)
+            profile_config: JSON file overriding or adding encoder profiles
+                (default: encoder_profiles.json next to the scripts, if present)
+            vfr: Variable frame rate output: full frame rate only in crossfades,
+                one frame per VFR_HOLD_SECONDS while a slide is held (ffmpeg and
+                yuv engines)
+            chapters: Add MP4 chapters: "slides" for one per slide titled from the
+                image filenames, or a directory of numbered script files
+                (01_title.txt, 02_title.txt, ...) for one per script section
+        
+        Returns:
+            Summary dict with output_path, num_images, video_duration,
+            render_time, file_size, profile, chapters, cache_hits, cache_misses
+            and up_to_date
         """
         
         import time
         start_time = time.time()
         
         print("Starting slideshow generation...")
+        # The job and segment directories next to the output are used from other working directories
+        output_path = os.path.abspath(output_path)
+        if self.slide_cache:
+            self.slide_cache.reset_stats()
         if progress_callback:
             progress_callback("Starting slideshow generation...", 5)
         
         # Validate inputs
+        if engine not in RENDER_ENGINES:
+            raise ValueError(f"engine must be one of: {', '.join(RENDER_ENGINES)}")
+        
+        if segments > 1 and engine != "ffmpeg":
+            raise ValueError("Segment-parallel encoding requires the ffmpeg engine")
+        
+        if incremental and engine != "ffmpeg":
+            raise ValueError("Incremental rendering requires the ffmpeg engine")
+        
+        if vfr and engine not in ("ffmpeg", "yuv"):
+            raise ValueError("Variable frame rate output requires the ffmpeg or yuv engine")
+        
         if not silent_mode and not audio_path:
             raise ValueError("Audio path is required when not in silent mode")
         
         if not silent_mode and not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
+        encoder_profile = get_profile(profile, profile_config)
+        encoder_threads = encoder_threads or encoder_profile.threads
+        print(f"Encoder profile: {encoder_profile.name} (preset {encoder_profile.preset}, "
+              f"{encoder_profile.fps} fps)")
+        
         # Get audio duration and image files
         if not silent_mode:
             if progress_callback:
                 progress_callback("Getting audio duration...", 10)
-            audio_duration = self.get_audio_duration(audio_path)
+            audio_info = self.get_audio_info(audio_path)
+            audio_duration = audio_info.duration
         else:
             if progress_callback:
                 progress_callback("Calculating video duration for silent mode...", 10)
@@ -169,6 +960,11 @@ class SlideshowGenerator:
         print(f"Audio duration: {audio_duration:.2f} seconds ({audio_duration/60:.1f} minutes)" if not silent_mode else f"Silent mode: Using {image_duration}s per image")
         print(f"Found {len(image_files)} images")
         
+        # A single image (or --static) needs no compositing: loop one still
+        if static or len(image_files) == 1:
+            static = True
+            image_files = image_files[:1]
+        
         # Calculate timing
         num_images = len(image_files)
         if not silent_mode:
@@ -179,112 +975,121 @@ class SlideshowGenerator:
             total_video_duration = num_images * image_duration
         
         print(f"Each image will be displayed for {time_per_image:.1f} seconds")
+        if not silent_mode:
+            if is_mp4_compatible_audio(audio_path, audio_info):
+                print("Audio: AAC stream will be copied without re-encoding")
+            else:
+                print("Audio: will be transcoded to AAC")
         if silent_mode:
             print(f"Total video duration: {total_video_duration:.1f} seconds ({total_video_duration/60:.1f} minutes)")
         
+        chapter_list = self.episode_chapters(chapters, image_files, time_per_image, total_video_duration,
+                                             STATIC_FPS if static else encoder_profile.fps, static)
+        
+        # Skip the render when the output was made from the same inputs and settings
+        render_settings = self.render_settings(silent_mode, time_per_image, transition_duration, engine,
+                                               segments, incremental, static, encoder_profile, vfr,
+                                               chapter_list)
+        fingerprint = compute_fingerprint(image_files, None if silent_mode else audio_path,
+                                          render_settings)
+        manifest = None if force else is_up_to_date(output_path, fingerprint)
+        if manifest:
+            print(f"✅ Up to date: {output_path} (use --force to render anyway)")
+            if progress_callback:
+                progress_callback("Up to date - nothing to render", 100)
+            return {
+                "output_path": output_path,
+                "num_images": num_images,
+                "video_duration": total_video_duration,
+                "render_time": 0.0,
+                "file_size": manifest["file_size"],
+                "profile": encoder_profile.name,
+                "chapters": len(chapter_list),
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "up_to_date": True,
+            }
+        
+        # Completed slides and segments are checkpointed in the job directory
+        # until the render succeeds, so an interrupted render can be resumed
+        job_dir = output_path + JOB_DIR_SUFFIX
+        job_file = os.path.join(job_dir, "job.json")
+        if resume:
+            try:
+                with open(job_file, "r", encoding="utf-8") as f:
+                    checkpoint = json.load(f)
+            except (OSError, ValueError):
+                checkpoint = None
+            if checkpoint and checkpoint.get("fingerprint") == fingerprint:
+                print(f"Resuming from checkpoints in {job_dir}")
+            else:
+                print("No checkpoints for these inputs and settings; starting from the beginning")
+                shutil.rmtree(job_dir, ignore_errors=True)
+        else:
+            shutil.rmtree(job_dir, ignore_errors=True)
+        os.makedirs(job_dir, exist_ok=True)
+        with open(job_file, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "output_path": output_path,
+                       "settings": render_settings}, f, ensure_ascii=False, indent=1)
+        # Without the slide cache, processed slides are checkpointed in the job directory
+        checkpoint_cache = None if self.slide_cache else SlideCache(os.path.join(job_dir, "slides"))
+        
         # Create temporary directory for processed images
         with tempfile.TemporaryDirectory() as temp_dir:
-            if progress_callback:
-                progress_callback("Processing images...", 20)
-            print("Processing images...")
-            processed_images = []
-            
-            for i, img_path in enumerate(image_files):
-                progress = 20 + (i / num_images) * 30  # 20-50% for image processing
-                if progress_callback:
-                    progress_callback(f"Processing image {i+1}/{num_images}: {os.path.basename(img_path)}", progress)
-                print(f"Processing image {i+1}/{num_images}: {os.path.basename(img_path)}")
-                
-                # Resize and save processed image
-                processed_img = self.resize_image_to_fit(img_path, self.output_resolution)
-                temp_img_path = os.path.join(temp_dir, f"img_{i:04d}.jpg")
-                processed_img.save(temp_img_path, "JPEG", quality=95)
-                processed_images.append(temp_img_path)
-            
-            if progress_callback:
-                progress_callback("Creating video clips...", 50)
-            print("Creating video clips...")
-            
-            # Create video clips for each image
-            clips = []
-            for i, img_path in enumerate(processed_images):
-                progress = 50 + (i / num_images) * 20  # 50-70% for clip creation
-                if progress_callback:
-                    progress_callback(f"Creating clip {i+1}/{num_images}", progress)
-                
-                # Create image clip
-                img_clip = mp.ImageClip(img_path, duration=time_per_image)
-                
-                # Add crossfade transition (except for the first image)
-                if i > 0 and transition_duration > 0:
-                    img_clip = img_clip.crossfadein(transition_duration)
-                
-                clips.append(img_clip)
-            
-            if progress_callback:
-                progress_callback("Concatenating video clips...", 70)
-            print("Concatenating video clips...")
-            
-            # Concatenate all clips
-            video = mp.concatenate_videoclips(clips, method="compose")
-            
-            if not silent_mode:
-                # Load and attach audio
-                if progress_callback:
-                    progress_callback("Loading audio...", 75)
-                print("Loading audio...")
-                audio = mp.AudioFileClip(audio_path)
+            processed_images = None
+            try:
+                if static:
+                    self.render_static(image_files[0], total_video_duration, output_path, temp_dir,
+                                       None if silent_mode else audio_path, progress_callback,
+                                       encoder_threads, checkpoint_cache, encoder_profile)
+                else:
+                    if pipeline:
+                        print("Streaming slides to the renderer as they are processed")
+                        processed_images = self.stream_images(image_files, max_workers, checkpoint_cache)
+                    else:
+                        if progress_callback:
+                            progress_callback("Processing images...", 20)
+                        print("Processing images...")
+                        processed_images = self.process_images(image_files, temp_dir, progress_callback,
+                                                               max_workers, memory_budget_mb, checkpoint_cache)
+                        if processed_images.spilled:
+                            print(f"Memory budget reached: {processed_images.spilled} slides memory-mapped from disk")
                 
-                # Trim video to match audio duration exactly
-                if progress_callback:
-                    progress_callback("Synchronizing video with audio...", 80)
-                if video.duration > audio_duration:
-                    video = video.subclip(0, audio_duration)
-                elif video.duration < audio_duration:
-                    # Loop video if it's shorter than audio
-                    loops_needed = math.ceil(audio_duration / video.duration)
-                    video = mp.concatenate_videoclips([video] * loops_needed)
-                    video = video.subclip(0, audio_duration)
-                
-                # Set audio
-                final_video = video.set_audio(audio)
-            else:
-                # Silent mode - no audio processing needed
-                if progress_callback:
-                    progress_callback("Preparing silent video...", 75)
-                print("Creating silent video...")
-                final_video = video
+                    if engine == "ffmpeg":
+                        slide_keys = [slide_key(path, self.output_resolution, self.fill_mode,
+                                                decode_quality=self.decode_quality)
+                                      for path in image_files]
+                        chunk_dir = output_path + SEGMENT_DIR_SUFFIX if incremental else os.path.join(job_dir, "segments")
+                        self.render_with_ffmpeg(processed_images, time_per_image, output_path, temp_dir,
+                                                None if silent_mode else audio_path,
+                                                transition_duration, progress_callback, segments,
+                                                encoder_threads, slide_keys, chunk_dir, encoder_profile, vfr)
+                    elif engine == "yuv":
+                        self.render_with_yuv(processed_images, time_per_image, output_path, temp_dir,
+                                             None if silent_mode else audio_path, audio_duration,
+                                             transition_duration, progress_callback, encoder_threads,
+                                             os.path.join(job_dir, "segments"), encoder_profile, vfr)
+                    else:
+                        self.render_with_moviepy(processed_images, time_per_image, output_path, temp_dir,
+                                                 None if silent_mode else audio_path, audio_duration,
+                                                 transition_duration, progress_callback, encoder_threads,
+                                                 os.path.join(job_dir, "segments"), encoder_profile)
+                if chapter_list:
+                    self.add_chapters(output_path, chapter_list, temp_dir, progress_callback)
+            except BaseException:
+                print(f"Render interrupted; completed work is kept in {job_dir} (continue with --resume)")
+                raise
+            finally:
+                if isinstance(processed_images, SlidePipeline):
+                    processed_images.close()
+                processed_images = None
+            shutil.rmtree(job_dir, ignore_errors=True)
             
-            if progress_callback:
-                progress_callback("Rendering final video...", 85)
-            print(f"Rendering final video to: {output_path}")
-            
-            # Write final video
-            final_video.write_videofile(
-                output_path,
-                fps=24,
-                codec='libx264',
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
-                remove_temp=True,
-                verbose=False,
-                logger=None
-            )
-            
-            print(f"Video rendering completed.")
-            
-            # Clean up resources immediately
-            print("Cleaning up resources...")
-            final_video.close()
-            if not silent_mode:
-                audio.close()
-            video.close()
-            for clip in clips:
-                clip.close()
-            
-            # Force garbage collection
-            import gc
-            gc.collect()
+            # Keep the slide cache within its size limit
+            if self.slide_cache:
+                evicted = self.slide_cache.prune()
+                if evicted:
+                    print(f"Evicted {evicted} old slides from the cache")
             
             # Verify file was created
             if os.path.exists(output_path):
@@ -301,7 +1106,12 @@ class SlideshowGenerator:
                 print("=" * 70)
                 print(f"✅ Video file created: {output_path}")
                 print(f"📊 File size: {file_size / (1024*1024):.1f} MB")
+                print(f"🎛️  Encoder profile: {encoder_profile.name}")
+                if chapter_list:
+                    print(f"📑 Chapters: {len(chapter_list)}")
                 print(f"⏱️  Render time: {minutes:02d}:{seconds:02d} ({total_time:.1f} seconds)")
+                if self.slide_cache:
+                    print(f"🗂️  Slide cache: {self.slide_cache.hits} hits, {self.slide_cache.misses} misses")
                 print(f"🎬 Video is ready to play and share!")
                 print("=" * 70)
             else:
@@ -310,6 +1120,266 @@ class SlideshowGenerator:
             print(f"\n🎥 Your podcast slideshow video is now complete and ready to use!")
             print(f"📁 Location: {output_path}")
             print(f"⏱️  Total generation time: {minutes:02d}:{seconds:02d}")
+            
+            summary = {
+                "output_path": output_path,
+                "num_images": num_images,
+                "video_duration": total_video_duration,
+                "render_time": total_time,
+                "file_size": file_size,
+                "profile": encoder_profile.name,
+                "chapters": len(chapter_list),
+                "cache_hits": self.slide_cache.hits if self.slide_cache else 0,
+                "cache_misses": self.slide_cache.misses if self.slide_cache else 0,
+                "up_to_date": False,
+            }
+            write_manifest(output_path, fingerprint, render_settings, summary)
+            return summary
+
+    
+    def variant_generator(self, variant: Variant) -> "SlideshowGenerator":
+        """A generator for one output variant, sharing this one's caches and settings."""
+        generator = copy.copy(self)
+        generator.output_resolution = tuple(variant.resolution)
+        generator.fill_mode = variant.fill_mode
+        return generator
+    
+    def process_variant_images(self, image_files: List[str], generators: List["SlideshowGenerator"],
+                               temp_dir: str, progress_callback=None, max_workers: int = None,
+                               memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB) -> List[FrameStore]:
+        """Decode every image once and fit it to each generator's resolution and fill mode.
+        
+        Returns one FrameStore per generator, sharing memory_budget_mb. Images
+        whose slides are all in the slide cache are not decoded at all.
+        """
+        num_images = len(image_files)
+        max_workers = max(1, max_workers or os.cpu_count() or 1)
+        stores = []
+        for n in range(len(generators)):
+            store_dir = os.path.join(temp_dir, f"variant_{n}")
+            os.makedirs(store_dir, exist_ok=True)
+            stores.append(FrameStore(num_images, store_dir, memory_budget_mb / len(generators)))
+        
+        cache = self.slide_cache
+        cache_keys = {}
+        pending = []
+        for i, img_path in enumerate(image_files):
+            if cache:
+                cached = [g.load_cached_slide(cache, img_path) for g in generators]
+                cache_keys[i] = [key for key, _ in cached]
+                if all(frame is not None for _, frame in cached):
+                    for store, (_, frame) in zip(stores, cached):
+                        store.add(i, frame)
+                    continue
+            pending.append(i)
+        if cache:
+            print(f"Slide cache: {num_images - len(pending)} of {num_images} images already processed")
+        
+        def store_all(i, frames):
+            progress = 20 + (i / num_images) * 30  # 20-50% for image processing
+            if progress_callback:
+                progress_callback(f"Processing image {i+1}/{num_images}: {os.path.basename(image_files[i])}", progress)
+            print(f"Processing image {i+1}/{num_images}: {os.path.basename(image_files[i])}")
+            for n, (store, frame) in enumerate(zip(stores, frames)):
+                cached_path = cache.put(cache_keys[i][n], frame) if cache else None
+                store.add(i, frame, backing_path=cached_path)
+        
+        max_workers = min(max_workers, max(1, len(pending)))
+        if max_workers == 1:
+            for i in pending:
+                store_all(i, _process_variants_job(generators, image_files[i]))
+            return stores
+        
+        print(f"Using {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {i: executor.submit(_process_variants_job, generators, image_files[i]) for i in pending}
+            try:
+                for i in pending:
+                    store_all(i, futures[i].result())
+            except BaseException:
+                for future in futures.values():
+                    future.cancel()
+                raise
+        return stores
+    
+    def create_variant_videos(self, image_dir: str, variants: List[Variant], audio_path: str = None,
+                              output_path: str = None, transition_duration: float = 0.5,
+                              progress_callback=None, silent_mode: bool = False,
+                              image_duration: float = 3.0, max_workers: int = None,
+                              memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                              engine: str = "moviepy", encoder_threads: int = None,
+                              force: bool = False, static: bool = False,
+                              profile: str = DEFAULT_PROFILE, profile_config: str = None,
+                              vfr: bool = False, chapters: str = None) -> List[dict]:
+        """Render several resolutions and fill modes of one episode in one pass.
+        
+        Every image is decoded once and fitted to each variant, and the audio
+        is probed once and, unless it is AAC already, encoded once. The
+        variants' video tracks are encoded in parallel (sharing the encoder
+        threads), then the audio is muxed into each by stream copy. Outputs
+        are named by variant_output_path; variants that are up to date are
+        skipped. The other arguments are as for create_slideshow_video.
+        
+        Returns:
+            One summary dict (as from create_slideshow_video) per variant
+        """
+        import time
+        start_time = time.time()
+        
+        print(f"Starting {len(variants)} slideshow variants...")
+        if self.slide_cache:
+            self.slide_cache.reset_stats()
+        if progress_callback:
+            progress_callback("Starting slideshow generation...", 5)
+        
+        if engine not in RENDER_ENGINES:
+            raise ValueError(f"engine must be one of: {', '.join(RENDER_ENGINES)}")
+        if vfr and engine not in ("ffmpeg", "yuv"):
+            raise ValueError("Variable frame rate output requires the ffmpeg or yuv engine")
+        if not silent_mode and not audio_path:
+            raise ValueError("Audio path is required when not in silent mode")
+        if not silent_mode and not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if silent_mode:
+            audio_path = None
+        
+        encoder_profile = get_profile(profile, profile_config)
+        encoder_threads = encoder_threads or encoder_profile.threads
+        print(f"Encoder profile: {encoder_profile.name} (preset {encoder_profile.preset}, "
+              f"{encoder_profile.fps} fps)")
+        audio_info = self.get_audio_info(audio_path) if audio_path else None
+        image_files = self.get_image_files(image_dir)
+        if static or len(image_files) == 1:
+            static = True
+            image_files = image_files[:1]
+        num_images = len(image_files)
+        time_per_image = audio_info.duration / num_images if audio_path else image_duration
+        total_video_duration = audio_info.duration if audio_path else num_images * image_duration
+        print(f"Found {len(image_files)} images, {time_per_image:.1f} seconds each")
+        chapter_list = self.episode_chapters(chapters, image_files, time_per_image, total_video_duration,
+                                             STATIC_FPS if static else encoder_profile.fps, static)
+        
+        # Skip the variants whose outputs were made from the same inputs and settings
+        jobs = []
+        summaries = {}
+        for variant in variants:
+            generator = self.variant_generator(variant)
+            path = variant_output_path(output_path, variant, variants)
+            settings = generator.render_settings(silent_mode, time_per_image, transition_duration, engine,
+                                                 1, False, static, encoder_profile, vfr, chapter_list)
+            fingerprint = compute_fingerprint(image_files, audio_path, settings)
+            manifest = None if force else is_up_to_date(path, fingerprint)
+            if manifest:
+                print(f"✅ Up to date: {path} (use --force to render anyway)")
+                summaries[variant] = {
+                    "output_path": path,
+                    "variant": variant.name,
+                    "fill_mode": variant.fill_mode,
+                    "num_images": num_images,
+                    "video_duration": total_video_duration,
+                    "render_time": 0.0,
+                    "file_size": manifest["file_size"],
+                    "profile": encoder_profile.name,
+                    "chapters": len(chapter_list),
+                    "up_to_date": True,
+                }
+            else:
+                jobs.append((variant, generator, path, fingerprint, settings))
+        if not jobs:
+            if progress_callback:
+                progress_callback("Up to date - nothing to render", 100)
+            return [summaries[variant] for variant in variants]
+        
+        for _, _, path, _, _ in jobs:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+        generators = [generator for _, generator, _, _, _ in jobs]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            if progress_callback:
+                progress_callback("Processing images...", 20)
+            print(f"Processing images once for {', '.join(f'{v.name} ({v.fill_mode})' for v, *_ in jobs)}")
+            stores = self.process_variant_images(image_files, generators, temp_dir, progress_callback,
+                                                 max_workers, memory_budget_mb)
+            
+            # The audio is encoded at most once and then copied into every variant
+            mux_audio = audio_path
+            renderer = self.make_renderer(encoder_profile)
+            if audio_path and not is_mp4_compatible_audio(audio_path, audio_info):
+                if progress_callback:
+                    progress_callback("Encoding audio...", 50)
+                print("Encoding audio to AAC once for all variants")
+                mux_audio = os.path.join(temp_dir, "audio.m4a")
+                run_ffmpeg(renderer.audio_encode_command(audio_path, mux_audio), total_video_duration,
+                           message="Encoding audio", log_path=os.path.join(temp_dir, "audio.log"))
+            
+            if progress_callback:
+                progress_callback(f"Rendering {len(jobs)} variants...", 55)
+            threads = max(1, (encoder_threads or os.cpu_count() or 1) // len(jobs))
+            
+            def render_variant(n):
+                variant, generator, path, _, _ = jobs[n]
+                variant_dir = os.path.join(temp_dir, f"variant_{n}")
+                video_path = os.path.join(variant_dir, "video.mp4") if mux_audio else path
+                if static:
+                    generator.render_static(image_files[0], total_video_duration, video_path, variant_dir,
+                                            encoder_threads=threads, profile=encoder_profile,
+                                            frame=stores[n][0])
+                elif engine == "ffmpeg":
+                    generator.render_with_ffmpeg(stores[n], time_per_image, video_path, variant_dir,
+                                                 transition_duration=transition_duration,
+                                                 encoder_threads=threads, profile=encoder_profile, vfr=vfr)
+                elif engine == "yuv":
+                    generator.render_with_yuv(stores[n], time_per_image, video_path, variant_dir,
+                                              transition_duration=transition_duration,
+                                              encoder_threads=threads, profile=encoder_profile, vfr=vfr)
+                else:
+                    generator.render_with_moviepy(stores[n], time_per_image, video_path, variant_dir,
+                                                  transition_duration=transition_duration,
+                                                  encoder_threads=threads, profile=encoder_profile)
+                if mux_audio:
+                    cmd = renderer.mux_audio_command(video_path, mux_audio, path, total_video_duration)
+                    run_ffmpeg(cmd, total_video_duration, message="Adding audio track",
+                               log_path=os.path.join(variant_dir, "mux.log"))
+                if chapter_list:
+                    generator.add_chapters(path, chapter_list, variant_dir)
+            
+            # Encoders run in their own processes, so threads are enough to run them side by side
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                for future in [executor.submit(render_variant, n) for n in range(len(jobs))]:
+                    future.result()
+            stores = None
+        
+        if self.slide_cache:
+            evicted = self.slide_cache.prune()
+            if evicted:
+                print(f"Evicted {evicted} old slides from the cache")
+        
+        total_time = time.time() - start_time
+        print("\n" + "=" * 70)
+        print(f"🎉 {len(jobs)} SLIDESHOW VARIANTS COMPLETED in {total_time:.1f} seconds")
+        print("=" * 70)
+        for variant, generator, path, fingerprint, settings in jobs:
+            if not os.path.exists(path):
+                raise Exception(f"Video file was not created successfully: {path}")
+            file_size = os.path.getsize(path)
+            print(f"✅ {variant.name} ({variant.fill_mode}): {path} ({file_size / (1024*1024):.1f} MB)")
+            summaries[variant] = {
+                "output_path": path,
+                "variant": variant.name,
+                "fill_mode": variant.fill_mode,
+                "num_images": num_images,
+                "video_duration": total_video_duration,
+                "render_time": total_time,
+                "file_size": file_size,
+                "profile": encoder_profile.name,
+                "chapters": len(chapter_list),
+                "up_to_date": False,
+            }
+            write_manifest(path, fingerprint, settings, summaries[variant])
+        if progress_callback:
+            progress_callback(f"🎉 SUCCESS! {len(jobs)} variants created", 100)
+        return [summaries[variant] for variant in variants]
 
 
 def main():
@@ -324,21 +1394,96 @@ Examples:
   python slideshow_generator.py pics/ sound.m4a -o video.mp4 --transition 1.0
   python slideshow_generator.py images/ --silent -o silent_slideshow.mp4 --image-duration 5.0
   python slideshow_generator.py photos/ --silent --resolution 1280x720 -o quick_slideshow.mp4
+  python slideshow_generator.py photos/ audio.mp3 -o output.mp4 --jobs 8
+  python slideshow_generator.py photos/ audio.mp3 -o output.mp4 --cache-dir D:/slide_cache
+  python slideshow_generator.py dslr_photos/ audio.mp3 -o output.mp4 --decode-quality fast
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --engine ffmpeg
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --engine ffmpeg --segments 8
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --engine yuv
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --engine ffmpeg --vfr
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --chapters slides
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --variants landscape,vertical,square
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --variants 1920x1080,1080x1920:fill
+  python slideshow_generator.py images/ episode.m4a -o vertical.mp4 --resolution 1080x1920 --fill blur
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --chapters scripts/
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --force
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --engine ffmpeg --incremental
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --resume
+  python slideshow_generator.py Images/Logo.png episode.m4a -o episode.mp4
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --preview --preview-minutes 5
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --profile small-upload
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --profile podcast --profile-config my_profiles.json
+  python slideshow_generator.py images/ episode.m4a -o episode.mp4 --no-pipeline --memory-budget 4096
         """
     )
     
-    parser.add_argument('image_dir', help='Directory containing images')
+    parser.add_argument('image_dir', help='Directory containing images (or a single image)')
     parser.add_argument('audio_file', nargs='?', help='Audio file for the podcast (optional if --silent)')
     parser.add_argument('-o', '--output', default='slideshow.mp4', 
                        help='Output video file (default: slideshow.mp4)')
     parser.add_argument('--resolution', default='1920x1080',
                        help='Output resolution (default: 1920x1080)')
+    parser.add_argument('--fill', choices=FILL_MODES, default='fit',
+                       help='How images fill the frame: "fit" adds black bars, "fill" crops, '
+                            '"blur" puts the whole image over a blurred copy (default: fit)')
+    parser.add_argument('--variants', default=None, metavar='LIST',
+                       help='Render several outputs from one decode pass, e.g. "landscape,vertical,square" or '
+                            '"1920x1080,1080x1920:blur,1080x1080:fill"; written as <output>_<WxH>.mp4')
     parser.add_argument('--transition', type=float, default=0.5,
                        help='Transition duration in seconds (default: 0.5)')
     parser.add_argument('--silent', action='store_true',
                        help='Create silent slideshow without audio')
     parser.add_argument('--image-duration', type=float, default=3.0,
                        help='Duration per image in seconds for silent mode (default: 3.0)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Worker processes for image preprocessing (default: CPU count)')
+    parser.add_argument('--cache-dir', default=None,
+                       help='Directory for the preprocessed slide cache (default: user cache dir)')
+    parser.add_argument('--cache-size', type=float, default=DEFAULT_CACHE_SIZE_MB,
+                       help=f'Maximum slide cache size in MB (default: {DEFAULT_CACHE_SIZE_MB})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the preprocessed slide cache')
+    parser.add_argument('--engine', choices=RENDER_ENGINES, default='moviepy',
+                       help='Render engine; "ffmpeg" renders without per-frame Python work, '
+                            '"yuv" pipes composited frames to ffmpeg as raw YUV420 (default: moviepy)')
+    parser.add_argument('--segments', type=int, default=1,
+                       help='Encode N segments in parallel and join them (ffmpeg engine, default: 1)')
+    parser.add_argument('--vfr', action='store_true',
+                       help='Variable frame rate: full frame rate only during crossfades, '
+                            f'one frame per {VFR_HOLD_SECONDS:g}s while a slide is held (ffmpeg and yuv engines)')
+    parser.add_argument('--chapters', default=None, metavar='SOURCE',
+                       help='Add MP4 chapters: "slides" (one per slide, titled from the filenames) or a '
+                            'folder of numbered script files such as 01_intro.txt (one per section)')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE,
+                       help=f'Encoder profile: draft, standard, archive, small-upload or one from '
+                            f'--profile-config (default: {DEFAULT_PROFILE})')
+    parser.add_argument('--profile-config', default=None,
+                       help='JSON file overriding or adding encoder profiles '
+                            '(default: encoder_profiles.json next to the scripts, if present)')
+    parser.add_argument('--encoder-threads', type=int, default=None,
+                       help="Threads for video encoding (default: the profile's setting)")
+    parser.add_argument('--memory-budget', type=float, default=DEFAULT_MEMORY_BUDGET_MB,
+                       help=f'RAM in MB for in-memory slides before spilling to disk (default: {DEFAULT_MEMORY_BUDGET_MB})')
+    parser.add_argument('--decode-quality', choices=DECODE_QUALITIES, default='best',
+                       help='"fast" downscales large images while decoding (default: best)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Keep encoded segments next to the output and only re-encode changed ones (ffmpeg engine)')
+    parser.add_argument('--no-pipeline', action='store_true',
+                       help='Process all images before rendering instead of streaming them to the encoder')
+    parser.add_argument('--static', action='store_true',
+                       help='Show only the first image for the whole audio, encoded as a looped still '
+                            '(automatic for a single image)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue an interrupted render from its checkpoints next to the output')
+    parser.add_argument('--force', action='store_true',
+                       help='Render even if the output is up to date with its inputs and settings')
+    parser.add_argument('--preview', action='store_true',
+                       help=f'Quickly render a low-resolution draft to <output>{PREVIEW_SUFFIX}.mp4 '
+                            'to check slide order and pacing')
+    parser.add_argument('--preview-minutes', type=float, default=None,
+                       help='With --preview, only render the first N minutes')
+    parser.add_argument('--preview-transitions', action='store_true',
+                       help=f'With --preview, only render {PREVIEW_WINDOW_SECONDS:g}s around each slide change')
     
     args = parser.parse_args()
     
@@ -350,6 +1495,51 @@ Examples:
         print("Error: Resolution must be in format WIDTHxHEIGHT (e.g., 1920x1080)")
         sys.exit(1)
     
+    variants = None
+    if args.variants:
+        try:
+            variants = parse_variants(args.variants)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if args.segments > 1 or args.incremental or args.resume or args.preview:
+            print("Error: --variants cannot be combined with --segments, --incremental, --resume or --preview")
+            sys.exit(1)
+    
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        sys.exit(1)
+    
+    if args.segments < 1:
+        print("Error: --segments must be at least 1")
+        sys.exit(1)
+    
+    if args.segments > 1 and args.engine != 'ffmpeg':
+        print("Error: --segments requires --engine ffmpeg")
+        sys.exit(1)
+    
+    if args.incremental and args.engine != 'ffmpeg':
+        print("Error: --incremental requires --engine ffmpeg")
+        sys.exit(1)
+    
+    if args.vfr and args.engine not in ('ffmpeg', 'yuv'):
+        print("Error: --vfr requires --engine ffmpeg or --engine yuv")
+        sys.exit(1)
+    
+    if args.encoder_threads is not None and args.encoder_threads < 1:
+        print("Error: --encoder-threads must be at least 1")
+        sys.exit(1)
+    
+    try:
+        get_profile(args.profile, args.profile_config)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if args.chapters and args.chapters != SLIDES_SOURCE and not os.path.isdir(args.chapters):
+        print(f"Error: --chapters must be \"slides\" or a folder of script files: {args.chapters}")
+        sys.exit(1)
+    
     # Validate inputs
     if not os.path.exists(args.image_dir):
         print(f"Error: Image directory not found: {args.image_dir}")
@@ -370,19 +1560,83 @@ Examples:
     
     try:
         # Create slideshow generator
-        generator = SlideshowGenerator(output_resolution=resolution)
+        generator = SlideshowGenerator(output_resolution=resolution,
+                                       use_cache=not args.no_cache,
+                                       cache_dir=args.cache_dir,
+                                       cache_size_mb=args.cache_size,
+                                       decode_quality=args.decode_quality,
+                                       fill_mode=args.fill)
+        
+        if variants:
+            summaries = generator.create_variant_videos(
+                image_dir=args.image_dir,
+                variants=variants,
+                audio_path=args.audio_file if not args.silent else None,
+                output_path=args.output,
+                transition_duration=args.transition,
+                silent_mode=args.silent,
+                image_duration=args.image_duration,
+                max_workers=args.jobs,
+                memory_budget_mb=args.memory_budget,
+                engine=args.engine,
+                encoder_threads=args.encoder_threads,
+                force=args.force,
+                static=args.static,
+                profile=args.profile,
+                profile_config=args.profile_config,
+                vfr=args.vfr,
+                chapters=args.chapters
+            )
+            for summary in summaries:
+                state = "up to date" if summary["up_to_date"] else "saved"
+                print(f"{summary['variant']} ({summary['fill_mode']}) {state}: {summary['output_path']}")
+            return
+        
+        if args.preview or args.preview_minutes or args.preview_transitions:
+            preview_path = preview_output_path(args.output)
+            generator.create_preview_video(
+                image_dir=args.image_dir,
+                audio_path=args.audio_file if not args.silent else None,
+                output_path=preview_path,
+                transition_duration=args.transition,
+                silent_mode=args.silent,
+                image_duration=args.image_duration,
+                minutes=args.preview_minutes,
+                transitions=args.preview_transitions,
+                max_workers=args.jobs,
+                profile_config=args.profile_config
+            )
+            print(f"\nSuccess! Preview saved to: {preview_path}")
+            return
         
         # Generate slideshow
-        generator.create_slideshow_video(
+        summary = generator.create_slideshow_video(
             image_dir=args.image_dir,
             audio_path=args.audio_file if not args.silent else None,
             output_path=args.output,
             transition_duration=args.transition,
             silent_mode=args.silent,
-            image_duration=args.image_duration
+            image_duration=args.image_duration,
+            max_workers=args.jobs,
+            memory_budget_mb=args.memory_budget,
+            engine=args.engine,
+            segments=args.segments,
+            encoder_threads=args.encoder_threads,
+            force=args.force,
+            incremental=args.incremental,
+            resume=args.resume,
+            pipeline=not args.no_pipeline,
+            static=args.static,
+            profile=args.profile,
+            profile_config=args.profile_config,
+            vfr=args.vfr,
+            chapters=args.chapters
         )
         
-        print(f"\nSuccess! Slideshow video saved to: {args.output}")
+        if summary["up_to_date"]:
+            print(f"\nNothing to do: {args.output} is up to date")
+        else:
+            print(f"\nSuccess! Slideshow video saved to: {args.output}")
         
     except Exception as e:
         print(f"Error: {e}")
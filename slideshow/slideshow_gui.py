@@ -26,7 +26,8 @@ except ImportError:
 
 # Try to import the slideshow generator
 try:
-    from slideshow_generator import SlideshowGenerator
+    from slideshow_generator import SlideshowGenerator, preview_output_path
+    from encoder_profiles import BUILTIN_PROFILES, DEFAULT_PROFILE, load_profiles
 except ImportError as e:
     print(f"Error importing slideshow_generator: {e}")
     print("Make sure all dependencies are installed: pip install -r requirements.txt")
@@ -50,6 +51,7 @@ class SlideshowGUI:
         self.transition_var = tk.DoubleVar(value=0.5)
         self.silent_mode_var = tk.BooleanVar(value=False)
         self.image_duration_var = tk.DoubleVar(value=3.0)
+        self.profile_var = tk.StringVar(value=DEFAULT_PROFILE)
         
         # Status variables
         self.is_generating = False
@@ -150,6 +152,17 @@ class SlideshowGUI:
                                               state="disabled")
         self.image_duration_spin.grid(row=3, column=1, sticky=tk.W, padx=(10, 0), pady=5)
         
+        # Encoder Profile (built-in ones plus any from encoder_profiles.json)
+        try:
+            profile_names = list(load_profiles())
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read encoder profiles - {e}")
+            profile_names = list(BUILTIN_PROFILES)
+        ttk.Label(settings_frame, text="Encoder Profile:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        profile_combo = ttk.Combobox(settings_frame, textvariable=self.profile_var,
+                                    values=profile_names, state="readonly", width=15)
+        profile_combo.grid(row=4, column=1, sticky=tk.W, padx=(10, 0), pady=5)
+        
         # Buttons Frame
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=8, column=0, columnspan=3, pady=(30, 0))
@@ -160,6 +173,16 @@ class SlideshowGUI:
                                       style="Accent.TButton")
         self.generate_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        # Resume Button (continues a stopped or failed render from its checkpoints)
+        self.resume_btn = ttk.Button(button_frame, text="⏯️ Resume",
+                                    command=lambda: self.generate_slideshow(resume=True))
+        self.resume_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Quick Preview Button (low-resolution draft to check slide order and pacing)
+        self.preview_btn = ttk.Button(button_frame, text="👁️ Quick Preview",
+                                     command=self.quick_preview)
+        self.preview_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         # Stop Button (initially hidden)
         self.stop_btn = ttk.Button(button_frame, text="⏹️ Stop Generation", 
                                   command=self.stop_generation,
@@ -377,8 +400,87 @@ class SlideshowGUI:
             self.log_message("Stopping generation...")
             self.status_var.set("Stopping...")
     
-    def generate_slideshow(self):
-        """Generate the slideshow video."""
+    def open_file(self, path):
+        """Open a file with the system's default application."""
+        if sys.platform == "win32":
+            os.startfile(path)
+        elif sys.platform == "darwin":  # macOS
+            subprocess.run(["open", path])
+        else:  # Linux
+            subprocess.run(["xdg-open", path])
+    
+    def quick_preview(self):
+        """Render a low-resolution draft next to the output and open it."""
+        if self.is_generating:
+            messagebox.showwarning("Warning", "Generation is already in progress")
+            return
+        
+        if not self.validate_inputs():
+            return
+        
+        def run_preview():
+            try:
+                self.is_generating = True
+                self.should_stop = False
+                self.generate_btn.configure(state="disabled")
+                self.resume_btn.configure(state="disabled")
+                self.preview_btn.configure(state="disabled")
+                self.stop_btn.configure(state="normal")
+                self.progress_var.set(0)
+                self.log_text.delete(1.0, tk.END)
+                self.completion_var.set("")
+                
+                preview_path = preview_output_path(self.output_file_var.get())
+                self.log_message(f"Rendering quick preview: {preview_path}")
+                self.status_var.set("Rendering preview...")
+                
+                def progress_callback(message, progress):
+                    if self.should_stop:
+                        raise InterruptedError("Preview was cancelled by user")
+                    self.progress_var.set(progress)
+                    self.status_var.set(message)
+                    self.root.update_idletasks()
+                
+                width, height = map(int, self.resolution_var.get().split('x'))
+                self.generator = SlideshowGenerator(output_resolution=(width, height))
+                summary = self.generator.create_preview_video(
+                    image_dir=self.image_dir_var.get(),
+                    audio_path=self.audio_file_var.get() if not self.silent_mode_var.get() else None,
+                    output_path=preview_path,
+                    transition_duration=self.transition_var.get(),
+                    progress_callback=progress_callback,
+                    silent_mode=self.silent_mode_var.get(),
+                    image_duration=self.image_duration_var.get()
+                )
+                
+                self.log_message(f"✅ Preview ready in {summary['render_time']:.1f} seconds")
+                self.status_var.set("Preview ready")
+                self.completion_var.set(f"👁️ Preview ready: {os.path.basename(preview_path)}")
+                self.root.after(0, lambda: self.open_file(preview_path))
+                
+            except InterruptedError:
+                self.log_message("Preview was cancelled by user")
+                self.status_var.set("Preview cancelled")
+                self.progress_var.set(0)
+                
+            except Exception as e:
+                self.log_message(f"Error: {str(e)}")
+                self.status_var.set("Error occurred during preview")
+                self.progress_var.set(0)
+                messagebox.showerror("Error", f"An error occurred during preview:\n\n{str(e)}")
+                
+            finally:
+                self.is_generating = False
+                self.should_stop = False
+                self.generate_btn.configure(state="normal")
+                self.resume_btn.configure(state="normal")
+                self.preview_btn.configure(state="normal")
+                self.stop_btn.configure(state="disabled")
+        
+        threading.Thread(target=run_preview, daemon=True).start()
+    
+    def generate_slideshow(self, resume=False):
+        """Generate the slideshow video; with resume, continue from the last checkpoints."""
         if self.is_generating:
             messagebox.showwarning("Warning", "Generation is already in progress")
             return
@@ -394,6 +496,8 @@ class SlideshowGUI:
                 self.is_generating = True
                 self.should_stop = False
                 self.generate_btn.configure(state="disabled")
+                self.resume_btn.configure(state="disabled")
+                self.preview_btn.configure(state="disabled")
                 self.stop_btn.configure(state="normal")
                 self.progress_var.set(0)
                 
@@ -436,6 +540,7 @@ class SlideshowGUI:
                 self.log_message(f"Output file: {self.output_file_var.get()}")
                 self.log_message(f"Resolution: {self.resolution_var.get()}")
                 self.log_message(f"Transition: {self.transition_var.get()}s")
+                self.log_message(f"Encoder profile: {self.profile_var.get()}")
                 
                 self.progress_var.set(10)
                 self.status_var.set("Getting audio duration...")
@@ -487,7 +592,9 @@ class SlideshowGUI:
                     transition_duration=self.transition_var.get(),
                     progress_callback=progress_callback,
                     silent_mode=self.silent_mode_var.get(),
-                    image_duration=self.image_duration_var.get()
+                    image_duration=self.image_duration_var.get(),
+                    resume=resume,
+                    profile=self.profile_var.get()
                 )
                 
                 # Final progress updates
@@ -593,6 +700,7 @@ class SlideshowGUI:
                 
                 self.log_message(f"\n=== GENERATION CANCELLED ===")
                 self.log_message(f"Generation was stopped by user")
+                self.log_message("Completed work was kept - press Resume to continue")
                 self.status_var.set("Generation cancelled")
                 self.completion_var.set("⛔ Generation was cancelled by user")
                 self.progress_var.set(0)
@@ -617,6 +725,8 @@ class SlideshowGUI:
                 self.is_generating = False
                 self.should_stop = False
                 self.generate_btn.configure(state="normal")
+                self.resume_btn.configure(state="normal")
+                self.preview_btn.configure(state="normal")
                 self.stop_btn.configure(state="disabled")
                 # Force garbage collection to help with file cleanup
                 import gc
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for muxing the episode audio into the finished video.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from ffmpeg_renderer import FFmpegRenderer, get_ffmpeg_exe, is_complete_mp4
+
+
+def _ffmpeg(*args):
+    subprocess.run([get_ffmpeg_exe(), "-y", "-loglevel", "error", *args], check=True)
+
+
+def _stream_md5(path, stream):
+    """MD5 of the packets of one stream, without decoding them."""
+    return subprocess.run([get_ffmpeg_exe(), "-loglevel", "error", "-i", path, "-map", f"0:{stream}:0",
+                           "-c", "copy", "-f", "md5", "-"], capture_output=True, text=True).stdout.strip()
+
+
+def test_single_mux_pass_copies_or_transcodes_audio():
+    """AAC is copied as-is, mp3 is transcoded to AAC, both in one pass that copies the video."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video_path = os.path.join(temp_dir, "video.mp4")
+        _ffmpeg("-f", "lavfi", "-i", "color=c=gray:s=64x36:r=24", "-t", "3", "-c:v", "libx264", video_path)
+        audio_paths = {}
+        for ext, codec in (("m4a", "aac"), ("mp3", "libmp3lame")):
+            audio_paths[ext] = os.path.join(temp_dir, f"episode.{ext}")
+            _ffmpeg("-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100", "-t", "2",
+                    "-c:a", codec, audio_paths[ext])
+
+        renderer = FFmpegRenderer()
+        for ext, audio_codec in (("m4a", "copy"), ("mp3", "aac")):
+            output_path = os.path.join(temp_dir, f"episode_{ext}.mp4")
+            cmd = renderer.mux_audio_command(video_path, audio_paths[ext], output_path, 3.0)
+            assert cmd[0] == renderer.ffmpeg and cmd.count("-i") == 2, cmd
+            assert cmd[cmd.index("-c:v") + 1] == "copy" and cmd[cmd.index("-c:a") + 1] == audio_codec, cmd
+            subprocess.run(cmd, check=True)
+
+            assert is_complete_mp4(output_path)
+            info = subprocess.run([get_ffmpeg_exe(), "-i", output_path], capture_output=True, text=True).stderr
+            assert "Audio: aac" in info, info
+            assert _stream_md5(output_path, "v") == _stream_md5(video_path, "v")
+            copied = _stream_md5(output_path, "a") == _stream_md5(audio_paths[ext], "a")
+            assert copied == (audio_codec == "copy"), (ext, copied)
+
+
+if __name__ == "__main__":
+    try:
+        test_single_mux_pass_copies_or_transcodes_audio()
+    except AssertionError as e:
+        print(f"❌ Audio mux test failed: {e}")
+        sys.exit(1)
+    print("✅ Audio mux tests passed!")
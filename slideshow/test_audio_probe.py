@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for header-only audio probing and the audio probe index.
+"""
+
+import os
+import sys
+import wave
+import tempfile
+
+import audio_probe
+from audio_probe import AudioProbeIndex, probe_audio
+
+
+def _write_wav(path, seconds, sample_rate=8000, channels=2):
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\0\0" * channels * int(seconds * sample_rate))
+
+
+def test_probe_reads_headers():
+    """Duration, codec, sample rate and channels come from the WAV header."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "episode.wav")
+        _write_wav(path, 2.5)
+        info = probe_audio(path)
+        assert abs(info.duration - 2.5) < 0.01
+        assert info.codec == "pcm"
+        assert info.sample_rate == 8000 and info.channels == 2
+
+
+def test_index_probes_each_file_once():
+    """Unchanged files are answered from the index, even after a reload."""
+    calls = []
+    original = audio_probe.probe_audio
+
+    def counting_probe(path):
+        calls.append(path)
+        return original(path)
+
+    audio_probe.probe_audio = counting_probe
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "episode.wav")
+            index_path = os.path.join(temp_dir, "audio_index.json")
+            _write_wav(path, 1.0)
+
+            AudioProbeIndex(index_path).get(path)
+            index = AudioProbeIndex(index_path)
+            assert abs(index.get(path).duration - 1.0) < 0.01
+            assert len(calls) == 1
+
+            _write_wav(path, 3.0)  # Changing the file invalidates its entry
+            assert abs(index.get(path).duration - 3.0) < 0.01
+            assert len(calls) == 2
+    finally:
+        audio_probe.probe_audio = original
+
+
+if __name__ == "__main__":
+    try:
+        test_probe_reads_headers()
+        test_index_probes_each_file_once()
+    except AssertionError as e:
+        print(f"❌ Audio probe test failed: {e}")
+        sys.exit(1)
+    print("✅ Audio probe tests passed!")
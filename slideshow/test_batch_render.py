@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for batch rendering of episode folders.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from PIL import Image
+
+from batch_render import discover_jobs, render_batch
+from ffmpeg_renderer import get_ffmpeg_exe, is_complete_mp4
+from render_manifest import read_manifest
+
+
+def _episode(root, name, broken=False):
+    folder = os.path.join(root, name)
+    os.makedirs(os.path.join(folder, "audio"))
+    for i in range(2):
+        Image.new("RGB", (64, 36), (100 * i, 50, 0)).save(os.path.join(folder, f"{i:02d}.png"))
+    if broken:
+        with open(os.path.join(folder, "02.jpg"), "wb") as f:
+            f.write(b"not an image")
+    subprocess.run([get_ffmpeg_exe(), "-y", "-loglevel", "error", "-f", "lavfi", "-i",
+                    "anullsrc=r=44100:cl=mono", "-t", "2", "-c:a", "aac",
+                    os.path.join(folder, "audio", "episode.m4a")], check=True)
+
+
+def test_discover_jobs():
+    """Folders with images and audio become jobs with absolute output paths."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _episode(temp_dir, "ep1")
+        os.makedirs(os.path.join(temp_dir, "no_audio"))
+        Image.new("RGB", (8, 8)).save(os.path.join(temp_dir, "no_audio", "01.png"))
+        jobs = discover_jobs(temp_dir, "output")
+        assert [job["name"] for job in jobs] == ["ep1"], jobs
+        assert jobs[0]["audio_path"].endswith(os.path.join("audio", "episode.m4a"))
+        assert jobs[0]["output_path"] == os.path.abspath(os.path.join("output", "ep1.mp4"))
+
+
+def test_failed_episode_does_not_stop_the_batch():
+    """Each episode has its own log; a broken one fails alone."""
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            for name in ("ep1", "ep2", "ep3"):
+                _episode("episodes", name, broken=name == "ep2")
+            jobs = discover_jobs("episodes")
+            jobs[2]["fill_mode"] = "fill"
+            results = render_batch(jobs, concurrency=2, log_dir="logs",
+                                   generator_options={"output_resolution": (64, 36), "use_cache": False},
+                                   render_options={"transition_duration": 0.0, "engine": "ffmpeg"})
+            assert [r["status"] for r in results] == ["done", "failed", "done"], results
+            assert results[1]["error"], results[1]
+            for result in results:
+                with open(result["log_path"], encoding="utf-8") as f:
+                    log = f.read()
+                # Every log only holds its own episode's output
+                assert result["output_path"] in log or result["status"] == "failed", log
+                for other in results:
+                    if other is not result:
+                        assert other["output_path"] not in log, log
+            assert is_complete_mp4(os.path.join("output", "ep1.mp4"))
+            assert is_complete_mp4(os.path.join("output", "ep3.mp4"))
+            assert not os.path.exists(os.path.join("output", "ep2.mp4"))
+            assert read_manifest(os.path.join("output", "ep3.mp4"))["settings"]["fill_mode"] == "fill"
+        finally:
+            os.chdir(previous_dir)
+
+
+if __name__ == "__main__":
+    try:
+        test_discover_jobs()
+        test_failed_episode_does_not_stop_the_batch()
+    except AssertionError as e:
+        print(f"❌ Batch render test failed: {e}")
+        sys.exit(1)
+    print("✅ Batch render tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for chapters and slide-aligned keyframes.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from chapters import chapter_title, script_chapters, slide_chapters, write_ffmetadata
+from ffmpeg_renderer import FFmpegRenderer, get_ffmpeg_exe
+from yuv_pipe import YUVPipeEncoder, YUVTimeline
+
+
+def _keyframe_times(path):
+    """Presentation times (seconds) of the video keyframes of path."""
+    output = subprocess.run([get_ffmpeg_exe(), "-skip_frame", "nokey", "-i", path, "-map", "0:v",
+                             "-f", "framemd5", "-"], capture_output=True, text=True).stdout
+    timebase = None
+    times = []
+    for line in output.splitlines():
+        if line.startswith("#tb 0:"):
+            num, den = line.split(":")[1].strip().split("/")
+            timebase = int(num) / int(den)
+        elif line and not line.startswith("#"):
+            times.append(round(int(line.split(",")[2]) * timebase, 3))
+    return times
+
+
+def test_chapter_titles():
+    """Titles come from file names; script sections are timed by their text length."""
+    assert chapter_title("01_บทนำ_ความหวัง.txt", "x") == "บทนำ ความหวัง"
+    assert chapter_title("02-Anicca.txt", "x") == "Anicca"
+    assert chapter_title("sample_003.jpg", "x") == "sample 003"
+    assert chapter_title("07.png", "Slide 7") == "Slide 7"
+    chapters = slide_chapters(["01_intro_a.jpg", "intro a.jpg", "02_story.jpg"], [0, 10, 20], 30)
+    assert [(c.start, c.end, c.title) for c in chapters] == [(0, 20, "intro a"), (20, 30, "story")], chapters
+
+    with tempfile.TemporaryDirectory() as script_dir:
+        for name, text in (("02_body.txt", "b" * 300), ("01_intro.txt", "a " * 100), ("notes.txt", "x")):
+            with open(os.path.join(script_dir, name), "w", encoding="utf-8") as f:
+                f.write(text)
+        chapters = script_chapters(script_dir, 40.0)
+        assert [(c.start, c.end, c.title) for c in chapters] == [(0, 10, "intro"), (10, 40, "body")], chapters
+        # Snapped to the nearest slide change
+        chapters = script_chapters(script_dir, 40.0, [0, 8, 16, 24, 32])
+        assert [c.start for c in chapters] == [0, 8], chapters
+
+
+def test_keyframes_and_chapters_in_mp4():
+    """Slide changes are keyframes and the chapters end up in the MP4."""
+    slides = [np.full((36, 64, 3), value, dtype=np.uint8) for value in (0, 120, 240)]
+    timeline = YUVTimeline(slides, [3.0, 3.0, 3.0], 0.0, fps=24)
+    renderer = FFmpegRenderer(fps=24, threads=1, encoder_args=["-g", "240"])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video_path = os.path.join(temp_dir, "video.mp4")
+        YUVPipeEncoder(renderer, (64, 36)).encode(timeline, 0, 216, video_path)
+        assert _keyframe_times(video_path) == [0.0, 3.0, 6.0], _keyframe_times(video_path)
+        # Times relative to a segment start that is not on a whole second
+        segment_path = os.path.join(temp_dir, "segment.mp4")
+        YUVPipeEncoder(renderer, (64, 36)).encode(timeline, 5, 216, segment_path)
+        assert _keyframe_times(segment_path) == [0.0, 2.792, 5.792], _keyframe_times(segment_path)
+
+        metadata_path = os.path.join(temp_dir, "chapters.txt")
+        write_ffmetadata(slide_chapters(["01_a=b.png", "02_b.png", "03_c.png"], [0, 3, 6], 9), metadata_path)
+        output_path = os.path.join(temp_dir, "chapters.mp4")
+        subprocess.run(renderer.chapters_command(video_path, metadata_path, output_path), check=True)
+        info = subprocess.run([get_ffmpeg_exe(), "-i", output_path], capture_output=True, text=True).stderr
+    assert info.count("Chapter #") == 3, info
+    assert "start 3.000000, end 6.000000" in info and "title           : a=b" in info, info
+
+
+if __name__ == "__main__":
+    try:
+        test_chapter_titles()
+        test_keyframes_and_chapters_in_mp4()
+    except AssertionError as e:
+        print(f"❌ Chapters test failed: {e}")
+        sys.exit(1)
+    print("✅ Chapters tests passed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the decode quality benchmark.
+"""
+
+import io
+import re
+import sys
+from contextlib import redirect_stdout
+from unittest import mock
+
+import benchmark_decode
+from slideshow_generator import DECODE_QUALITIES
+
+
+def test_benchmark_reports_every_mode():
+    """Each mode gets a row whose numbers agree, and fast decoding is the faster one."""
+    output = io.StringIO()
+    argv = ["benchmark_decode.py", "--size", "3000x2000", "--count", "2", "--resolution", "320x180"]
+    with mock.patch.object(sys, "argv", argv), redirect_stdout(output):
+        benchmark_decode.main()
+    report = output.getvalue()
+
+    # Rows: mode, total seconds, milliseconds per image, peak memory (MB or n/a)
+    rows = {match[0]: match[1:] for match in re.findall(r"^(\w+) +([\d.]+) +(\d+) +(\d+|n/a)$",
+                                                          report, re.MULTILINE)}
+    assert sorted(rows) == sorted(DECODE_QUALITIES), report
+    for mode, (total, per_image, peak) in rows.items():
+        assert float(total) > 0, report
+        # Totals are printed to 10 ms, so per image they agree within 2.5 ms
+        assert abs(float(per_image) - float(total) / 2 * 1000) <= 3, report
+        assert peak == "n/a" or float(peak) >= 0, report
+
+    speedup = float(report.split("fast mode speedup:")[1].strip().rstrip("x"))
+    assert speedup > 1, report
+    ratio = float(rows["best"][1]) / float(rows["fast"][1])
+    assert abs(speedup - ratio) <= 0.05 * ratio + 0.05, report
+
+
+if __name__ == "__main__":
+    try:
+        test_benchmark_reports_every_mode()
+    except AssertionError as e:
+        print(f"❌ Decode benchmark test failed: {e}")
+        sys.exit(1)
+    print("✅ Decode benchmark tests passed!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for encoder profiles.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from encoder_profiles import get_profile, load_profiles
+
+
+def test_builtin_profile_args():
+    """Profiles turn into x264 options; a bitrate caps CRF or replaces it."""
+    assert get_profile().name == "standard"
+    assert get_profile("standard").codec_args() == ["-preset", "medium", "-crf", "23",
+                                                    "-tune", "stillimage", "-g", "240"]
+    small = get_profile("small-upload").codec_args(preset=False)
+    assert small[:6] == ["-crf", "28", "-maxrate", "1M", "-bufsize", "2000000"], small
+    assert get_profile("draft").fps == 12
+    assert get_profile("draft")._replace(crf=None, bitrate="800k", tune=None,
+                                         gop_seconds=None).codec_args() == ["-preset", "ultrafast", "-b:v", "800k"]
+
+
+def test_config_overrides_and_adds_profiles():
+    """The config file changes built-in profiles and defines new ones from a base."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "profiles.json")
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump({"standard": {"crf": 21}, "podcast": {"base": "small-upload", "fps": 15}}, f)
+        profiles = load_profiles(config_path)
+        assert profiles["standard"].crf == 21 and profiles["standard"].preset == "medium"
+        assert profiles["podcast"].fps == 15 and profiles["podcast"].bitrate == "1M"
+        assert profiles["archive"].crf == 18
+
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump({"standard": {"quality": "high"}}, f)
+        try:
+            load_profiles(config_path)
+            assert False, "unknown setting accepted"
+        except ValueError as e:
+            assert "quality" in str(e)
+
+    try:
+        get_profile("no-such-profile")
+        assert False, "unknown profile accepted"
+    except ValueError as e:
+        assert "standard" in str(e)
+
+
+if __name__ == "__main__":
+    try:
+        test_builtin_profile_args()
+        test_config_overrides_and_adds_profiles()
+    except AssertionError as e:
+        print(f"❌ Encoder profile test failed: {e}")
+        sys.exit(1)
+    print("✅ Encoder profile tests passed!")
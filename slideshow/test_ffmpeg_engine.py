@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script comparing the ffmpeg render engine with the moviepy engine.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from PIL import Image
+
+from ffmpeg_renderer import get_ffmpeg_exe
+from slideshow_generator import SlideshowGenerator
+from variants import parse_variants
+
+
+def _video_frames(path):
+    """Number of video frames and end time (seconds) of the video stream of path."""
+    output = subprocess.run([get_ffmpeg_exe(), "-i", path, "-map", "0:v", "-f", "framemd5", "-"],
+                            capture_output=True, text=True).stdout
+    timebase = None
+    frames = []
+    for line in output.splitlines():
+        if line.startswith("#tb 0:"):
+            num, den = line.split(":")[1].strip().split("/")
+            timebase = int(num) / int(den)
+        elif line and not line.startswith("#"):
+            _, _, pts, duration = line.split(",")[:4]
+            frames.append((int(pts) + int(duration)) * timebase)
+    return len(frames), round(max(frames), 3)
+
+
+def test_ffmpeg_engine_matches_moviepy():
+    """Both engines, and ffmpeg variants, give the same frames and length over several segments."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_dir = os.path.join(temp_dir, "images")
+        os.makedirs(image_dir)
+        # 25 slides of 1.5 s: longer than one ffmpeg segment
+        for i in range(25):
+            Image.new("RGB", (64, 36), (i * 10, 255 - i * 10, 0)).save(os.path.join(image_dir, f"{i:02d}.png"))
+
+        results = {}
+        for engine in ("moviepy", "ffmpeg"):
+            output_path = os.path.join(temp_dir, f"{engine}.mp4")
+            generator = SlideshowGenerator(output_resolution=(64, 36), use_cache=False)
+            generator.create_slideshow_video(image_dir, output_path=output_path, silent_mode=True,
+                                             image_duration=1.5, transition_duration=0.5, engine=engine)
+            results[engine] = _video_frames(output_path)
+        # Variants are rendered without the checkpoint segments
+        summaries = SlideshowGenerator(use_cache=False).create_variant_videos(
+            image_dir, parse_variants("64x36"), output_path=os.path.join(temp_dir, "variant.mp4"),
+            silent_mode=True, image_duration=1.5, transition_duration=0.5, engine="ffmpeg")
+        results["variant"] = _video_frames(summaries[0]["output_path"])
+        assert results["variant"] == results["moviepy"], results
+        assert results["ffmpeg"] == results["moviepy"] == (900, 37.5), results
+
+
+if __name__ == "__main__":
+    try:
+        test_ffmpeg_engine_matches_moviepy()
+    except AssertionError as e:
+        print(f"❌ ffmpeg engine test failed: {e}")
+        sys.exit(1)
+    print("✅ ffmpeg engine tests passed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the memory-bounded frame store.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from frame_store import FrameStore, save_frame
+
+
+def test_frames_spill_once_over_budget():
+    """Frames stay in RAM up to the budget; later ones are memory-mapped from disk."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        frames = [np.full((100, 100, 3), i, dtype=np.uint8) for i in range(5)]  # 30000 bytes each
+        store = FrameStore(len(frames), temp_dir, memory_budget_mb=70000 / (1024 * 1024))
+        for i, frame in enumerate(frames):
+            store.add(i, frame)
+
+        assert store.in_memory_bytes == 60000 and store.spilled == 3, (store.in_memory_bytes, store.spilled)
+        assert [isinstance(frame, np.memmap) for frame in store] == [False, False, True, True, True]
+        assert sorted(os.listdir(temp_dir)) == ["slide_0002.npy", "slide_0003.npy", "slide_0004.npy"]
+        for i, frame in enumerate(frames):
+            assert np.array_equal(store[i], frame), f"frame {i} differs"
+
+        # Releasing a frame frees its budget for the next one
+        store.release(0)
+        assert store.in_memory_bytes == 30000
+        store.add(0, frames[0])
+        assert not isinstance(store[0], np.memmap) and store.in_memory_bytes == 60000
+
+        # Over budget, an existing file (e.g. the slide cache) is mapped instead of a new spill file
+        large = np.full((200, 100, 3), 9, dtype=np.uint8)
+        cached_path = os.path.join(temp_dir, "cached.npy")
+        save_frame(cached_path, large)
+        store.release(1)
+        store.add(1, large, backing_path=cached_path)
+        assert store.spilled == 4 and store[1].filename == cached_path
+        assert np.array_equal(store[1], large)
+        assert not os.path.exists(os.path.join(temp_dir, "slide_0001.npy"))
+
+
+if __name__ == "__main__":
+    try:
+        test_frames_spill_once_over_budget()
+    except AssertionError as e:
+        print(f"❌ Frame store test failed: {e}")
+        sys.exit(1)
+    print("✅ Frame store tests passed!")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for preprocessing slides in worker processes.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from slide_cache import SlideCache
+from slideshow_generator import SlideshowGenerator
+
+
+def _images(image_dir, count=6):
+    """Images of different sizes and shapes, so every slide is resized differently."""
+    paths = []
+    for i in range(count):
+        path = os.path.join(image_dir, f"{i:02d}.png")
+        image = Image.effect_noise((90 + i * 37, 60 + i * 11), 40 + i * 10).convert("RGB")
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+def test_parallel_loading_matches_serial():
+    """max_workers > 1 gives the same frames in the same order as loading one by one."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_files = _images(temp_dir)
+        generator = SlideshowGenerator(output_resolution=(64, 36), use_cache=False)
+        serial = generator.process_images(image_files, temp_dir, max_workers=1)
+        parallel = generator.process_images(image_files, temp_dir, max_workers=3)
+        assert len(serial) == len(parallel) == len(image_files)
+        for i in range(len(image_files)):
+            assert np.array_equal(serial[i], parallel[i]), f"slide {i} differs"
+
+        # With some slides already cached, the rest still come out in order
+        cache = SlideCache(os.path.join(temp_dir, "cache"))
+        generator.process_images(image_files[::2], temp_dir, max_workers=1, slide_cache=cache)
+        cache.reset_stats()
+        mixed = generator.process_images(image_files, temp_dir, max_workers=3, slide_cache=cache)
+        assert cache.hits == 3 and cache.misses == 3, (cache.hits, cache.misses)
+        for i in range(len(image_files)):
+            assert np.array_equal(serial[i], mixed[i]), f"slide {i} differs with the cache"
+
+
+if __name__ == "__main__":
+    try:
+        test_parallel_loading_matches_serial()
+    except AssertionError as e:
+        print(f"❌ Parallel loading test failed: {e}")
+        sys.exit(1)
+    print("✅ Parallel loading tests passed!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for quick preview renders.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from ffmpeg_renderer import is_complete_mp4
+from slideshow_generator import (SlideshowGenerator, preview_output_path, preview_resolution,
+                                 preview_windows)
+from timeline import SlideTimeline
+
+
+def test_preview_geometry_and_path():
+    """Previews keep the aspect ratio at a small size and don't overwrite the output."""
+    assert preview_resolution((1920, 1080)) == (640, 360)
+    assert preview_resolution((1080, 1920)) == (360, 640)
+    assert preview_resolution((320, 180)) == (320, 180)
+    assert preview_output_path("out/episode.mp4") == os.path.join("out", "episode.preview.mp4")
+
+
+def test_preview_windows():
+    """Windows surround each slide change, merge when they overlap and stop at the limit."""
+    frames = [np.zeros((2, 2, 3), dtype=np.uint8)] * 4
+    timeline = SlideTimeline(frames, [10.0, 10.0, 3.0, 10.0], 0.5, fps=10)
+    assert preview_windows(timeline, 10) == [(0, 330)]
+    assert preview_windows(timeline, 10, minutes=0.25) == [(0, 150)]
+    # Changes at 10 s, 20 s and 23 s; the last two windows overlap
+    assert preview_windows(timeline, 10, transitions=True) == [(80, 120), (180, 250)]
+    assert preview_windows(timeline, 10, minutes=0.25, transitions=True) == [(80, 120)]
+
+
+def test_preview_reuses_production_slides():
+    """A preview after a full render scales the cached production slides down."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_dir = os.path.join(temp_dir, "images")
+        os.makedirs(image_dir)
+        for i in range(3):
+            Image.new("RGB", (200, 100), (80 * i, 0, 0)).save(os.path.join(image_dir, f"{i}.png"))
+        generator = SlideshowGenerator(output_resolution=(960, 540),
+                                       cache_dir=os.path.join(temp_dir, "cache"))
+        generator.create_slideshow_video(image_dir, output_path=os.path.join(temp_dir, "full.mp4"),
+                                         silent_mode=True, image_duration=1.0, engine="ffmpeg")
+
+        output_path = preview_output_path(os.path.join(temp_dir, "full.mp4"))
+        summary = generator.create_preview_video(image_dir, output_path=output_path,
+                                                 silent_mode=True, image_duration=1.0)
+        assert is_complete_mp4(output_path)
+        assert summary["video_duration"] == 3.0
+        assert summary["cache_hits"] == 3, summary
+
+
+if __name__ == "__main__":
+    try:
+        test_preview_geometry_and_path()
+        test_preview_windows()
+        test_preview_reuses_production_slides()
+    except AssertionError as e:
+        print(f"❌ Preview test failed: {e}")
+        sys.exit(1)
+    print("✅ Preview tests passed!")
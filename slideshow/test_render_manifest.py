@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for render fingerprints and the up-to-date check.
+"""
+
+import os
+import sys
+import tempfile
+
+from PIL import Image
+
+from ffmpeg_renderer import is_complete_mp4
+from render_manifest import compute_fingerprint, is_up_to_date, read_manifest, write_manifest
+from slideshow_generator import RENDER_ENGINES, SlideshowGenerator
+
+
+def _write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_fingerprint_tracks_inputs_and_settings():
+    """Changing an image, the image list or a setting changes the fingerprint."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        images = [os.path.join(temp_dir, f"{i}.jpg") for i in range(2)]
+        for path in images:
+            _write(path, b"image")
+        settings = {"resolution": [1920, 1080], "transition_duration": 0.5}
+        fingerprint = compute_fingerprint(images, None, settings)
+
+        assert compute_fingerprint(images, None, dict(settings)) == fingerprint
+        assert compute_fingerprint(images[::-1], None, settings) != fingerprint
+        assert compute_fingerprint(images, None, dict(settings, transition_duration=1.0)) != fingerprint
+        _write(images[0], b"edited image")
+        assert compute_fingerprint(images, None, settings) != fingerprint
+
+
+def test_up_to_date_requires_matching_manifest_and_output():
+    """Only an intact output with the same fingerprint is up to date."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, "episode.mp4")
+        assert not is_up_to_date(output, "abc")
+
+        _write(output, b"video data")
+        write_manifest(output, "abc", {}, {"file_size": 10})
+        assert is_up_to_date(output, "abc")
+        assert not is_up_to_date(output, "def")
+
+        _write(output, b"truncated")
+        assert not is_up_to_date(output, "abc")
+
+
+def test_render_to_relative_output_path():
+    """Every engine renders (through its checkpoint segments) to a path relative to the cwd."""
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            os.makedirs("images")
+            for i in range(3):
+                Image.new("RGB", (64, 36), (80 * i, 0, 0)).save(os.path.join("images", f"{i:02d}.png"))
+            generator = SlideshowGenerator(output_resolution=(64, 36), use_cache=False)
+            for engine in RENDER_ENGINES:
+                output = os.path.join("output", f"{engine}.mp4")
+                os.makedirs("output", exist_ok=True)
+                generator.create_slideshow_video("images", output_path=output, silent_mode=True,
+                                                 image_duration=1.0, engine=engine, pipeline=False)
+                assert is_complete_mp4(output) and read_manifest(output), engine
+                assert not os.path.exists(output + ".job"), engine
+        finally:
+            os.chdir(previous_dir)
+
+
+if __name__ == "__main__":
+    try:
+        test_fingerprint_tracks_inputs_and_settings()
+        test_up_to_date_requires_matching_manifest_and_output()
+        test_render_to_relative_output_path()
+    except AssertionError as e:
+        print(f"❌ Render manifest test failed: {e}")
+        sys.exit(1)
+    print("✅ Render manifest tests passed!")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the CPU- and memory-aware render scheduler.
+"""
+
+import sys
+import time
+
+from render_scheduler import JobCost, RenderScheduler, estimate_job_cost
+
+
+def _slow_square(value):
+    time.sleep(0.5)
+    return value * value
+
+
+def test_estimate_scales_with_resolution_and_images():
+    """Bigger frames need more threads and RAM; slides beyond the budget or the
+    streaming window don't add RAM."""
+    hd = estimate_job_cost(10, (1280, 720), 60)
+    full_hd = estimate_job_cost(10, (1920, 1080), 60)
+    assert full_hd.threads > hd.threads
+    assert full_hd.memory_mb > hd.memory_mb
+    assert estimate_job_cost(1000, (1920, 1080), 60, memory_budget_mb=100, pipeline=False).memory_mb < \
+        estimate_job_cost(1000, (1920, 1080), 60, memory_budget_mb=500, pipeline=False).memory_mb
+    assert estimate_job_cost(1000, (1920, 1080), 60).memory_mb == \
+        estimate_job_cost(100, (1920, 1080), 60).memory_mb
+    assert estimate_job_cost(10, (1920, 1080), 120).work == 2 * full_hd.work
+
+
+def test_admission_respects_thread_budget():
+    """A job that doesn't fit waits; a smaller one behind it is backfilled."""
+    with RenderScheduler(cpu_threads=4, memory_mb=1000, max_jobs=3) as scheduler:
+        first = scheduler.submit("first", JobCost(3, 100, 0), _slow_square, 2)
+        second = scheduler.submit("second", JobCost(3, 100, 0), _slow_square, 3)
+        small = scheduler.submit("small", JobCost(1, 100, 0), _slow_square, 4)
+
+        status = scheduler.status()
+        assert status["running"] == ["first", "small"], status
+        assert status["queued"] == ["second"] and scheduler.queue_depth == 1
+        assert status["threads_in_use"] == 4
+
+        assert (first.result(), second.result(), small.result()) == (4, 9, 16)
+        assert scheduler.queue_depth == 0 and scheduler.running_jobs == []
+
+
+def test_oversized_job_runs_alone():
+    """A job larger than the whole budget still runs when nothing else does."""
+    with RenderScheduler(cpu_threads=2, memory_mb=100) as scheduler:
+        cost = JobCost(16, 5000, 0)
+        assert scheduler.pinned_threads(cost) == 2
+        assert scheduler.submit("huge", cost, _slow_square, 5).result() == 25
+
+
+if __name__ == "__main__":
+    try:
+        test_estimate_scales_with_resolution_and_images()
+        test_admission_respects_thread_budget()
+        test_oversized_job_runs_alone()
+    except AssertionError as e:
+        print(f"❌ Render scheduler test failed: {e}")
+        sys.exit(1)
+    print("✅ Render scheduler tests passed!")
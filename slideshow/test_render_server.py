@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the local render server.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import threading
+import urllib.request
+
+from PIL import Image
+
+from render_manifest import read_manifest
+from render_server import RenderServer, RenderService
+
+
+def _request(server, method, path, body=None):
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=120) as response:
+        return response.read()
+
+
+def _silent_job(image_dir):
+    return {"image_dir": image_dir, "silent_mode": True, "image_duration": 0.5,
+            "transition_duration": 0.0, "engine": "ffmpeg", "resolution": [320, 180],
+            "use_cache": False}
+
+
+def _make_images(directory):
+    os.makedirs(directory)
+    for i, color in enumerate(("red", "blue")):
+        Image.new("RGB", (160, 90), color).save(os.path.join(directory, f"{i:02d}.png"))
+
+
+def test_submit_stream_and_download():
+    """A submitted job streams progress events, finishes and serves its video."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_dir = os.path.join(temp_dir, "images")
+        _make_images(image_dir)
+        service = RenderService(os.path.join(temp_dir, "data"))
+        server = RenderServer(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            job = json.loads(_request(server, "POST", "/jobs", dict(_silent_job(image_dir), fill_mode="blur")))
+            assert job["status"] == "queued"
+
+            stream = _request(server, "GET", f"/jobs/{job['id']}/events").decode("utf-8")
+            assert "event: progress" in stream and stream.rstrip().endswith("event: end\ndata: {}")
+
+            job = json.loads(_request(server, "GET", f"/jobs/{job['id']}"))
+            assert job["status"] == "done", job
+            video = _request(server, "GET", f"/jobs/{job['id']}/result")
+            assert video[4:8] == b"ftyp" and len(video) == job["result"]["file_size"]
+            # fill_mode configures the generator
+            assert read_manifest(job["result"]["output_path"])["settings"]["fill_mode"] == "blur"
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.shutdown()
+
+
+def test_queue_survives_restart_and_cancel():
+    """Unfinished jobs are queued again after a restart; queued jobs can be cancelled."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_dir = os.path.join(temp_dir, "images")
+        _make_images(image_dir)
+        data_dir = os.path.join(temp_dir, "data")
+        os.makedirs(os.path.join(data_dir, "jobs"))
+        interrupted = {"id": "0123456789ab", "status": "running", "params": _silent_job(image_dir),
+                       "created": 0, "started": 1, "finished": None, "progress": 40,
+                       "message": "Processing", "result": None, "error": None, "log_path": None}
+        interrupted["params"]["output_path"] = os.path.join(temp_dir, "resumed.mp4")
+        with open(os.path.join(data_dir, "jobs", "0123456789ab.json"), "w") as f:
+            json.dump(interrupted, f)
+
+        service = RenderService(data_dir, max_jobs=1)
+        try:
+            queued = service.submit(_silent_job(image_dir))
+            assert service.cancel(queued["id"])["status"] == "cancelled"
+            # A single image is accepted like on the command line; a missing one is not
+            single = service.submit(_silent_job(os.path.join(image_dir, "00.png")))
+            assert service.cancel(single["id"])["status"] == "cancelled"
+            try:
+                service.submit(_silent_job(os.path.join(image_dir, "missing.png")))
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("a missing image path should be rejected")
+
+            events, finished = service.events_since("0123456789ab", 0, timeout=120)
+            while not finished:
+                more, finished = service.events_since("0123456789ab", len(events), timeout=120)
+                events += more
+            assert service.get("0123456789ab")["status"] == "done"
+            assert os.path.exists(os.path.join(temp_dir, "resumed.mp4"))
+        finally:
+            service.shutdown()
+
+
+if __name__ == "__main__":
+    try:
+        test_submit_stream_and_download()
+        test_queue_survives_restart_and_cancel()
+    except AssertionError as e:
+        print(f"❌ Render server test failed: {e}")
+        sys.exit(1)
+    print("✅ Render server tests passed!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for segment planning and incremental segment keys.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from ffmpeg_renderer import FFmpegRenderer, is_complete_mp4
+from segment_encoder import SegmentEncoder, plan_segments
+from timeline import SlideTimeline
+
+
+def _timeline(num_slides, duration=6.0, transition=0.5):
+    frames = [np.zeros((4, 4, 3), dtype=np.uint8)] * num_slides
+    return SlideTimeline(frames, [duration] * num_slides, transition, fps=24)
+
+
+def test_segments_cover_every_slide_once():
+    """Segments are contiguous runs of whole slides."""
+    segments = plan_segments(_timeline(20), 4, 24)
+    assert len(segments) == 4
+    assert segments[0].first_slide == 0 and segments[-1].end_slide == 20
+    for previous, segment in zip(segments, segments[1:]):
+        assert previous.end_slide == segment.first_slide
+        assert previous.end_frame == segment.start_frame
+
+
+def test_segment_key_only_changes_for_affected_segments():
+    """Changing one slide invalidates its segment and the one it leads into."""
+    timeline = _timeline(20)
+    encoder = SegmentEncoder(FFmpegRenderer(threads=2), 4)
+    segments = plan_segments(timeline, 4, 24)
+    boundaries = timeline.frame_boundaries()
+    keys = [f"slide{i}" for i in range(20)]
+
+    before = [encoder.segment_key(s, keys, boundaries, 0.5) for s in segments]
+    last_of_first = segments[0].end_slide - 1
+    keys[last_of_first] = "edited"
+    after = [encoder.segment_key(s, keys, boundaries, 0.5) for s in segments]
+    # The edited slide is also the lead-in of the second segment's crossfade
+    assert [b != a for b, a in zip(before, after)] == [True, True, False, False]
+
+    # Encoder threads don't change the encoded content
+    other = SegmentEncoder(FFmpegRenderer(threads=8), 4)
+    assert other.segment_key(segments[3], keys, boundaries, 0.5) == after[3]
+    assert encoder.segment_key(segments[3], keys, boundaries, 1.0) != after[3]
+
+
+def test_only_complete_segments_are_reused():
+    """A segment file is only reused when its MP4 boxes are all there."""
+    def box(kind, payload=b""):
+        return (8 + len(payload)).to_bytes(4, "big") + kind + payload
+
+    data = box(b"ftyp", b"isom") + box(b"mdat", b"\0" * 100) + box(b"moov", b"\0" * 20)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "segment.mp4")
+        with open(path, "wb") as f:
+            f.write(data)
+        assert is_complete_mp4(path)
+        with open(path, "wb") as f:
+            f.write(data[:-10])  # Interrupted while writing
+        assert not is_complete_mp4(path)
+        with open(path, "wb") as f:
+            f.write(data[:-28])  # No moov box
+        assert not is_complete_mp4(path)
+
+
+def test_incremental_render_reencodes_only_changed_segments():
+    """Editing the last slide re-encodes its segment only; relative paths join fine."""
+    frames = [np.full((36, 64, 3), 20 * i, dtype=np.uint8) for i in range(8)]
+    keys = [f"slide{i}" for i in range(8)]
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            work_dir = os.path.join(temp_dir, "work")
+            os.makedirs(work_dir)
+
+            def render():
+                timeline = SlideTimeline(frames, [1.0] * 8, 0.0, fps=24)
+                SegmentEncoder(FFmpegRenderer(threads=1), 4).render(
+                    frames, timeline, "out.mp4", work_dir, chunk_dir="chunks", slide_keys=keys)
+                return {name: os.stat(os.path.join("chunks", name)).st_mtime_ns
+                        for name in os.listdir("chunks")}
+
+            before = render()
+            assert len(before) == 4 and is_complete_mp4("out.mp4"), before
+            frames[7] = np.full((36, 64, 3), 255, dtype=np.uint8)
+            keys[7] = "edited"
+            after = render()
+            reused = {name for name in after if before.get(name) == after[name]}
+            assert len(after) == 4 and len(reused) == 3, (before, after)
+            assert is_complete_mp4("out.mp4")
+        finally:
+            os.chdir(previous_dir)
+
+
+if __name__ == "__main__":
+    try:
+        test_segments_cover_every_slide_once()
+        test_segment_key_only_changes_for_affected_segments()
+        test_only_complete_segments_are_reused()
+        test_incremental_render_reencodes_only_changed_segments()
+    except AssertionError as e:
+        print(f"❌ Segment encoder test failed: {e}")
+        sys.exit(1)
+    print("✅ Segment encoder tests passed!")
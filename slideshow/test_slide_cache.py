@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent slide cache.
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+import numpy as np
+
+from frame_store import load_frame
+from slide_cache import SlideCache
+
+
+def _write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_cache_hit_and_miss():
+    """A slide is a miss until stored, then a hit with the same key."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = SlideCache(os.path.join(temp_dir, "cache"))
+        source = os.path.join(temp_dir, "image.jpg")
+        _write(source, b"source image")
+        frame = np.full((72, 128, 3), 200, dtype=np.uint8)
+
+        key = cache.make_key(source, (128, 72))
+        assert cache.get(key) is None
+        cached_path = cache.put(key, frame)
+        assert np.array_equal(cache.get(key, frame.shape), frame)
+        assert np.array_equal(load_frame(cached_path), frame)
+        assert cache.hits == 1 and cache.misses == 1
+
+
+def test_damaged_entry_is_only_a_miss():
+    """A corrupt or wrongly sized entry is dropped and never counted as a hit."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = SlideCache(os.path.join(temp_dir, "cache"))
+        frame = np.zeros((72, 128, 3), dtype=np.uint8)
+        corrupt_path = cache.put("a" * 64, frame)
+        _write(corrupt_path, b"truncated")
+        resized_path = cache.put("b" * 64, frame)
+
+        assert cache.get("a" * 64, frame.shape) is None
+        assert cache.get("b" * 64, (720, 1280, 3)) is None
+        assert cache.hits == 0 and cache.misses == 2
+        assert not os.path.exists(corrupt_path) and not os.path.exists(resized_path)
+
+
+def test_cache_key_changes_with_inputs():
+    """Changing the source file or the target resolution changes the key."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = SlideCache(os.path.join(temp_dir, "cache"))
+        source = os.path.join(temp_dir, "image.jpg")
+        _write(source, b"v1")
+        key = cache.make_key(source, (1280, 720))
+
+        assert cache.make_key(source, (1920, 1080)) != key
+        _write(source, b"version 2")
+        assert cache.make_key(source, (1280, 720)) != key
+
+
+def test_prune_evicts_least_recently_used():
+    """Pruning removes the oldest entries until the cache fits its budget."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        frame = np.zeros((10, 100, 3), dtype=np.uint8)  # 3000 bytes + .npy header
+        cache = SlideCache(os.path.join(temp_dir, "cache"), max_size_mb=7000 / (1024 * 1024))
+
+        paths = [cache.put(f"{i:02d}" + "0" * 62, frame) for i in range(3)]
+        now = time.time()
+        for age, path in zip((300, 200, 100), paths):
+            os.utime(path, (now - age, now - age))
+
+        assert cache.prune() == 1
+        assert not os.path.exists(paths[0])
+        assert os.path.exists(paths[1]) and os.path.exists(paths[2])
+
+
+if __name__ == "__main__":
+    try:
+        test_cache_hit_and_miss()
+        test_damaged_entry_is_only_a_miss()
+        test_cache_key_changes_with_inputs()
+        test_prune_evicts_least_recently_used()
+    except AssertionError as e:
+        print(f"❌ Slide cache test failed: {e}")
+        sys.exit(1)
+    print("✅ Slide cache tests passed!")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming slide pipeline.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+from slide_pipeline import SlidePipeline
+from timeline import SlideTimeline
+
+
+def _render_after_adding_a_slide(temp_dir, engine):
+    """Render four slides, add a fifth and render again: only the last one misses the cache.
+
+    With one worker the pipeline only looks two slides ahead, so the worker
+    is started after the encoder is already running.
+    """
+    from slideshow_generator import SlideshowGenerator
+    image_dir = os.path.join(temp_dir, "images")
+    os.makedirs(image_dir)
+    generator = SlideshowGenerator(output_resolution=(64, 36), cache_dir=os.path.join(temp_dir, "cache"))
+    for i in range(3):
+        Image.new("RGB", (64, 36), (i * 60, 0, 0)).save(os.path.join(image_dir, f"{i:02d}.png"))
+    for count in (3, 4):
+        Image.new("RGB", (64, 36), (count * 60, 0, 0)).save(os.path.join(image_dir, f"{count:02d}.png"))
+        generator.create_slideshow_video(image_dir, output_path=os.path.join(temp_dir, "episode.mp4"),
+                                         silent_mode=True, image_duration=1.0, engine=engine,
+                                         max_workers=1, force=True)
+
+
+
+def _resume_interrupted_render(temp_dir):
+    """Interrupt a render partway into its second segment, then resume it.
+
+    The slides read before the interrupt are checkpointed, so the resumed
+    render starts encoding the second segment from checkpoints and only
+    starts a worker for the first slide that wasn't reached.
+    """
+    from ffmpeg_renderer import is_complete_mp4
+    from slideshow_generator import JOB_DIR_SUFFIX, SlideshowGenerator
+    image_dir = os.path.join(temp_dir, "images")
+    os.makedirs(image_dir)
+    # 40 s in two segments of 20 slides
+    for i in range(40):
+        Image.new("RGB", (64, 36), (i * 5, 0, 0)).save(os.path.join(image_dir, f"{i:02d}.png"))
+    output_path = os.path.join(temp_dir, "episode.mp4")
+    generator = SlideshowGenerator(output_resolution=(64, 36), use_cache=False)
+    settings = dict(output_path=output_path, silent_mode=True, image_duration=1.0, max_workers=1)
+
+    read_slide = SlidePipeline.__getitem__
+
+    def interrupt_at_slide_25(pipeline, index):
+        if index >= 25:
+            raise KeyboardInterrupt
+        return read_slide(pipeline, index)
+
+    try:
+        with mock.patch.object(SlidePipeline, "__getitem__", interrupt_at_slide_25):
+            generator.create_slideshow_video(image_dir, **settings)
+    except KeyboardInterrupt:
+        pass
+    else:
+        raise AssertionError("the render was not interrupted")
+    assert os.path.isdir(output_path + JOB_DIR_SUFFIX) and not os.path.exists(output_path)
+
+    messages = []
+    generator.create_slideshow_video(image_dir, progress_callback=lambda message, percent: messages.append(message),
+                                     resume=True, **settings)
+    assert is_complete_mp4(output_path) and not os.path.exists(output_path + JOB_DIR_SUFFIX)
+    encoded = [message for message in messages if message.startswith("Encoding segment")]
+    assert encoded == ["Encoding segment 2/2..."], encoded
+
+
+def _run_with_timeout(call, hang_message, timeout=60):
+    """Run one of the helpers above in a fresh interpreter; fail if it hangs or raises."""
+    script = f"import test_slide_pipeline as t; t.{call}"
+    # Own process group, so a hung render can be killed with its workers and ffmpeg
+    process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, start_new_session=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    try:
+        _, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+        raise AssertionError(hang_message) from None
+    assert process.returncode == 0, stderr.decode(errors="replace")
+
+
+def _fake_slide(name):
+    """Stand-in for image processing: a tiny frame filled with the image number."""
+    return np.full((4, 4, 3), int(name), dtype=np.uint8)
+
+
+def test_slides_arrive_in_order_with_bounded_window():
+    """Every slide is produced once, in order, with only a few held at a time."""
+    stored = []
+    names = [str(i) for i in range(30)]
+    with SlidePipeline(names, _fake_slide, store=lambda i, frame: stored.append(i),
+                       max_workers=2, lookahead=3) as slides:
+        assert len(slides) == 30
+        for i, frame in enumerate(slides):
+            assert frame[0, 0, 0] == i
+        assert stored == list(range(30))
+        # Lookahead plus the current and previous slide
+        assert slides.peak_slides <= 3 + 2
+
+
+def test_seeking_back_and_cached_slides():
+    """Released slides are produced again; cached ones are never processed."""
+    stored = []
+    cached = {5: np.zeros((4, 4, 3), dtype=np.uint8)}
+    names = [str(i) for i in range(10)]
+    with SlidePipeline(names, _fake_slide, load_cached=cached.get,
+                       store=lambda i, frame: stored.append(i), max_workers=1, lookahead=2) as slides:
+        assert slides[8][0, 0, 0] == 8
+        assert slides[1][0, 0, 0] == 1  # Behind the window
+        assert slides[5][0, 0, 0] == 0  # From the cache
+        assert 5 not in stored
+
+
+def test_shared_memory_slots_are_reused():
+    """Workers write into a fixed set of slots that the reader views in place."""
+    names = [str(i) for i in range(20)]
+    with SlidePipeline(names, _fake_slide, max_workers=1, lookahead=2,
+                       frame_shape=(4, 4, 3)) as slides:
+        assert slides.uses_shared_memory and len(slides._slots) == 4
+        for i, frame in enumerate(slides):
+            assert frame[0, 0, 0] == i and not frame.flags.writeable
+        # A frame of another size doesn't fit a slot and is pickled instead
+        with SlidePipeline(["1"], _fake_slide, frame_shape=(2, 2, 3)) as other:
+            assert other[0].shape == (4, 4, 3)
+
+
+def test_timeline_reads_streamed_slides_while_seeking():
+    """The timeline never holds a slide whose slot has been reused."""
+    names = [str(i) for i in range(12)]
+    with SlidePipeline(names, _fake_slide, max_workers=1, lookahead=2,
+                       frame_shape=(4, 4, 3)) as slides:
+        timeline = SlideTimeline(slides, [1.0] * 12, 0.0, fps=24)
+        for t in (5.5, 8.5, 5.5, 11.5, 2.5, 3.5, 10.5, 9.5):
+            assert timeline.get_frame(t)[0, 0, 0] == int(t)
+
+
+def test_workers_started_mid_render_dont_hold_the_encoder_pipe():
+    """A cache miss after cached slides starts workers during the render without hanging it."""
+    for engine in ("moviepy", "yuv"):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _run_with_timeout(f"_render_after_adding_a_slide({temp_dir!r}, {engine!r})",
+                              f"{engine} render hung after a cache miss mid-render")
+
+
+def test_resume_streams_the_remaining_slides():
+    """A resumed render reuses the finished segment and streams the slides it still needs."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _run_with_timeout(f"_resume_interrupted_render({temp_dir!r})", "resumed render hung")
+
+
+if __name__ == "__main__":
+    try:
+        test_slides_arrive_in_order_with_bounded_window()
+        test_seeking_back_and_cached_slides()
+        test_shared_memory_slots_are_reused()
+        test_timeline_reads_streamed_slides_while_seeking()
+        test_workers_started_mid_render_dont_hold_the_encoder_pipe()
+        test_resume_streams_the_remaining_slides()
+    except AssertionError as e:
+        print(f"❌ Slide pipeline test failed: {e}")
+        sys.exit(1)
+    print("✅ Slide pipeline tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the single-image (static cover) fast path.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+from PIL import Image
+
+from ffmpeg_renderer import get_ffmpeg_exe, is_complete_mp4
+from render_manifest import read_manifest
+from slideshow_generator import SlideshowGenerator
+
+
+def _container_duration(path):
+    """Duration (seconds) ffmpeg reports for the whole file."""
+    info = subprocess.run([get_ffmpeg_exe(), "-i", path], capture_output=True, text=True).stderr
+    hours, minutes, seconds = re.search(r"Duration: (\d+):(\d+):([\d.]+)", info).groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def test_single_image_renders_as_looped_still():
+    """One image is detected, encoded once and looped for the whole duration."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_path = os.path.join(temp_dir, "Logo.png")
+        Image.new("RGB", (320, 320), (200, 40, 40)).save(image_path)
+        output_path = os.path.join(temp_dir, "episode.mp4")
+
+        generator = SlideshowGenerator(output_resolution=(320, 180), use_cache=False)
+        # Longer than one GOP, so the encoded still is repeated
+        summary = generator.create_slideshow_video(image_path, output_path=output_path,
+                                                   silent_mode=True, image_duration=75.0)
+        assert is_complete_mp4(output_path)
+        assert summary["num_images"] == 1 and summary["video_duration"] == 75.0
+        assert read_manifest(output_path)["settings"]["static"] is True
+        assert abs(_container_duration(output_path) - 75.0) <= 0.05, _container_duration(output_path)
+
+
+def test_looped_still_ends_with_the_audio():
+    """The looped still doesn't run past audio that ends between two frames."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_path = os.path.join(temp_dir, "Logo.png")
+        Image.new("RGB", (320, 320), (40, 40, 200)).save(image_path)
+        audio_path = os.path.join(temp_dir, "episode.m4a")
+        subprocess.run([get_ffmpeg_exe(), "-y", "-loglevel", "error", "-f", "lavfi", "-i",
+                        "anullsrc=r=44100:cl=mono", "-t", "75.05", "-c:a", "aac", audio_path], check=True)
+        output_path = os.path.join(temp_dir, "episode.mp4")
+
+        generator = SlideshowGenerator(output_resolution=(320, 180), use_cache=False)
+        generator.create_slideshow_video(image_path, audio_path, output_path=output_path)
+        assert is_complete_mp4(output_path)
+        audio_duration = _container_duration(audio_path)
+        duration = _container_duration(output_path)
+        assert audio_duration - 0.05 <= duration <= audio_duration, (duration, audio_duration)
+
+
+def test_static_flag_uses_first_image():
+    """--static ignores every image but the first."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ("01_cover.png", "02_other.png"):
+            Image.new("RGB", (64, 64), (0, 0, 0)).save(os.path.join(temp_dir, name))
+        output_path = os.path.join(temp_dir, "episode.mp4")
+
+        generator = SlideshowGenerator(output_resolution=(64, 36), use_cache=False)
+        summary = generator.create_slideshow_video(temp_dir, output_path=output_path, silent_mode=True,
+                                                   image_duration=2.0, static=True)
+        assert summary["num_images"] == 1 and summary["video_duration"] == 2.0
+        assert is_complete_mp4(output_path)
+
+
+if __name__ == "__main__":
+    try:
+        test_single_image_renders_as_looped_still()
+        test_looped_still_ends_with_the_audio()
+        test_static_flag_uses_first_image()
+    except AssertionError as e:
+        print(f"❌ Static video test failed: {e}")
+        sys.exit(1)
+    print("✅ Static video tests passed!")
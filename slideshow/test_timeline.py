@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the slide timeline used by the renderers.
+"""
+
+import sys
+
+import numpy as np
+
+from timeline import SlideTimeline
+
+
+def _frames(count, size=(8, 4)):
+    return [np.full((size[1], size[0], 3), (i * 40) % 256, dtype=np.uint8) for i in range(count)]
+
+
+def test_locate_slide_boundaries():
+    """Timestamps map to the slide whose window contains them."""
+    timeline = SlideTimeline(_frames(3), [2.0, 2.0, 2.0])
+    assert timeline.duration == 6.0
+    assert timeline.locate(0.0) == (0, 1.0)
+    assert timeline.locate(1.99) == (0, 1.0)
+    assert timeline.locate(2.0) == (1, 1.0)
+    assert timeline.locate(5.5) == (2, 1.0)
+    assert timeline.locate(99.0) == (2, 1.0)  # Past the end stays on the last slide
+
+
+def test_crossfade_at_boundaries():
+    """Each slide but the first fades in over its predecessor."""
+    frames = _frames(2)
+    timeline = SlideTimeline(frames, [2.0, 2.0], transition_duration=1.0)
+    index, alpha = timeline.locate(2.5)
+    assert index == 1 and abs(alpha - 0.5) < 1e-9
+    assert np.array_equal(timeline.get_frame(0.5), frames[0])
+    assert np.array_equal(timeline.get_frame(3.5), frames[1])
+    assert abs(int(timeline.get_frame(2.5)[0, 0, 0]) - 20) <= 1
+
+
+def test_integer_blend_matches_float():
+    """Fixed-point crossfade stays within one level of the exact blend."""
+    rng = np.random.default_rng(0)
+    previous, current = rng.integers(0, 256, size=(2, 16, 16, 3), dtype=np.uint8)
+    timeline = SlideTimeline([previous, current], [1.0, 1.0], transition_duration=0.5, fps=24)
+    for weight in timeline.alpha_table:
+        exact = previous * (1 - weight / 256) + current * (weight / 256)
+        blended = timeline.blend(previous, current, weight)
+        assert np.abs(blended.astype(float) - exact).max() <= 1.0
+
+
+def test_holds_at_most_two_slides():
+    """Only the active slides stay decoded while playing through."""
+    timeline = SlideTimeline(_frames(10), [1.0] * 10, transition_duration=0.5)
+    for step in range(100):
+        timeline.get_frame(step / 10)
+        assert len(timeline._active) <= 2
+
+
+if __name__ == "__main__":
+    try:
+        test_locate_slide_boundaries()
+        test_crossfade_at_boundaries()
+        test_integer_blend_matches_float()
+        test_holds_at_most_two_slides()
+    except AssertionError as e:
+        print(f"❌ Timeline test failed: {e}")
+        sys.exit(1)
+    print("✅ Timeline tests passed!")
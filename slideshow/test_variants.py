@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for fill modes and multi-variant output.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from ffmpeg_renderer import is_complete_mp4
+from render_manifest import read_manifest
+from slideshow_generator import SlideshowGenerator
+from variants import Variant, parse_variants, variant_output_path
+
+
+def test_fill_modes_and_variant_names():
+    """fit letterboxes, fill crops, blur fills the bars; variants parse and name their outputs."""
+    generator = SlideshowGenerator(use_cache=False)
+    # A red 2:1 image in a square frame
+    img = Image.new("RGB", (200, 100), (255, 0, 0))
+    fit = np.asarray(generator.fit_image(img, (100, 100), "fit"))
+    fill = np.asarray(generator.fit_image(img, (100, 100), "fill"))
+    blur = np.asarray(generator.fit_image(img, (100, 100), "blur"))
+    assert fit.shape == fill.shape == blur.shape == (100, 100, 3)
+    assert fit[0, 50].tolist() == [0, 0, 0] and fit[50, 50].tolist() == [255, 0, 0]
+    assert (fill[..., 0] == 255).all()
+    assert blur[0, 50, 0] > 200 and blur[50, 50].tolist() == [255, 0, 0]
+
+    variants = parse_variants("landscape, 1080x1920:fill,1080x1920")
+    assert variants == [Variant((1920, 1080), "fit"), Variant((1080, 1920), "fill"),
+                        Variant((1080, 1920), "fit")], variants
+    assert variant_output_path("out/ep.mp4", variants[0], variants) == "out/ep_1920x1080.mp4"
+    assert variant_output_path("out/ep.mp4", variants[1], variants) == "out/ep_1080x1920_fill.mp4"
+    for spec in ("1920x1080:stretch", "wide", "landscape,1920x1080"):
+        try:
+            parse_variants(spec)
+        except ValueError:
+            continue
+        raise AssertionError(f"{spec} should be rejected")
+
+
+def test_variants_render_from_one_pass():
+    """Each variant gets its own size and manifest; a second run skips them all."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image_dir = os.path.join(temp_dir, "images")
+        os.makedirs(image_dir)
+        for i, color in enumerate(((200, 40, 40), (40, 200, 40))):
+            Image.new("RGB", (160, 90), color).save(os.path.join(image_dir, f"{i:02d}.png"))
+        output_path = os.path.join(temp_dir, "episode.mp4")
+        variants = parse_variants("64x36,36x64:blur")
+
+        generator = SlideshowGenerator(use_cache=False)
+        summaries = generator.create_variant_videos(image_dir, variants, output_path=output_path,
+                                                    silent_mode=True, image_duration=1.0, engine="ffmpeg")
+        assert [s["variant"] for s in summaries] == ["64x36", "36x64"], summaries
+        for summary in summaries:
+            assert is_complete_mp4(summary["output_path"]) and not summary["up_to_date"]
+        assert read_manifest(summaries[1]["output_path"])["settings"]["fill_mode"] == "blur"
+
+        again = generator.create_variant_videos(image_dir, variants, output_path=output_path,
+                                                silent_mode=True, image_duration=1.0, engine="ffmpeg")
+        assert all(summary["up_to_date"] for summary in again), again
+
+
+if __name__ == "__main__":
+    try:
+        test_fill_modes_and_variant_names()
+        test_variants_render_from_one_pass()
+    except AssertionError as e:
+        print(f"❌ Variants test failed: {e}")
+        sys.exit(1)
+    print("✅ Variants tests passed!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for variable frame rate output.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from ffmpeg_renderer import FFmpegRenderer, frame_runs, get_ffmpeg_exe
+from timeline import vfr_frame_numbers
+from yuv_pipe import YUVPipeEncoder, YUVTimeline
+
+
+def _packets(path):
+    """(pts, duration) of every video packet in seconds, in decode order."""
+    output = subprocess.run([get_ffmpeg_exe(), "-i", path, "-map", "0:v", "-c", "copy",
+                             "-f", "framemd5", "-"], capture_output=True, text=True).stdout
+    timebase = None
+    packets = []
+    for line in output.splitlines():
+        if line.startswith("#tb 0:"):
+            num, den = line.split(":")[1].strip().split("/")
+            timebase = int(num) / int(den)
+        elif line and not line.startswith("#"):
+            fields = [field.strip() for field in line.split(",")]
+            packets.append((int(fields[2]) * timebase, int(fields[3]) * timebase))
+    return packets
+
+
+def test_vfr_frame_selection():
+    """Crossfades keep every frame, held slides one per hold interval, the ends always."""
+    # Slide changes at frames 24 and 48 with 6-frame crossfades, 72 frames in all
+    frames = vfr_frame_numbers([24, 48], 72, 6, 12)
+    assert frames == [0, 12, 24, 25, 26, 27, 28, 29, 30, 42, 48, 49, 50, 51, 52, 53, 54, 66, 71], frames
+    # A range keeps its first and last frame
+    assert vfr_frame_numbers([24, 48], 72, 6, 12, 20, 40) == [20, 24, 25, 26, 27, 28, 29, 30, 39]
+    assert frame_runs([0, 12, 24, 25, 26, 30]) == [(0, 3, 12), (25, 2, 1), (30, 1, 1)]
+
+
+def test_vfr_encode_keeps_timing():
+    """A VFR encode has far fewer frames but the same length and slide change times."""
+    slides = [np.full((36, 64, 3), value, dtype=np.uint8) for value in (0, 120, 240)]
+    timeline = YUVTimeline(slides, [4.0, 4.0, 4.0], 0.25, fps=24)
+    encoder = YUVPipeEncoder(FFmpegRenderer(fps=24, threads=1, vfr=True), (64, 36))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "video.mp4")
+        encoder.encode(timeline, 0, 288, path)
+        packets = _packets(path)
+    frame_times = {round(pts * 24, 3) for pts, _ in packets}
+    assert len(packets) == len(timeline.vfr_frames(24)) < 288 / 4, len(packets)
+    # Crossfades start right on the slide boundaries, and the video ends on time
+    assert {96, 97, 192} <= frame_times, sorted(frame_times)
+    last_pts, last_duration = max(packets)
+    assert abs(last_pts + last_duration - 12.0) < 1e-3, packets[-1]
+
+
+if __name__ == "__main__":
+    try:
+        test_vfr_frame_selection()
+        test_vfr_encode_keeps_timing()
+    except AssertionError as e:
+        print(f"❌ VFR test failed: {e}")
+        sys.exit(1)
+    print("✅ VFR tests passed!")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the YUV420 frame pipe.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from ffmpeg_renderer import FFmpegRenderer, is_complete_mp4
+from yuv_pipe import YUVPipeEncoder, YUVTimeline, rgb_to_yuv420, yuv420_frame_size
+
+
+def _solid(color, width=4, height=2):
+    return np.full((height, width, 3), color, dtype=np.uint8)
+
+
+def test_bt709_conversion():
+    """Reference colors land on their limited-range BT.709 values."""
+    for color, expected in (((255, 255, 255), (235, 128, 128)), ((0, 0, 0), (16, 128, 128)),
+                            ((255, 0, 0), (63, 102, 240)), ((0, 0, 255), (32, 240, 118))):
+        yuv = rgb_to_yuv420(_solid(color))
+        assert yuv.size == yuv420_frame_size(4, 2) == 12
+        # Y plane (8 bytes), then one U and one V byte per 2x2 block
+        assert tuple(yuv[[0, 8, 10]]) == expected, (color, yuv)
+
+    try:
+        rgb_to_yuv420(_solid(0, width=3))
+        assert False, "odd widths can't be subsampled"
+    except ValueError:
+        pass
+
+
+def test_still_frames_reuse_the_converted_slide():
+    """Still frames are one buffer per slide; crossfades blend in YUV."""
+    timeline = YUVTimeline([_solid(0), _solid(255)], [1.0, 1.0], 0.5, fps=24)
+    first = timeline.get_frame(0.1)
+    assert first is timeline.get_frame(0.9)
+    assert first.dtype == np.uint8 and first.ndim == 1
+
+    midway = timeline.get_frame(1.25)
+    assert 120 <= midway[0] <= 130  # Halfway between Y=16 and Y=235
+    assert midway[8] == 128  # Gray stays neutral
+    assert timeline.get_frame(1.6) is timeline.get_frame(1.9)
+
+
+def test_encode_piped_frames():
+    """Frames piped as rawvideo yuv420p produce a complete MP4."""
+    timeline = YUVTimeline([_solid(0, 64, 36), _solid(200, 64, 36)], [0.5, 0.5], 0.25, fps=24)
+    encoder = YUVPipeEncoder(FFmpegRenderer(fps=24, threads=1), (64, 36))
+    progress = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "video.mp4")
+        encoder.encode(timeline, 0, 24, path, lambda message, percent: progress.append(percent))
+        assert is_complete_mp4(path)
+    assert progress[-1] == 95
+
+
+if __name__ == "__main__":
+    try:
+        test_bt709_conversion()
+        test_still_frames_reuse_the_converted_slide()
+        test_encode_piped_frames()
+    except AssertionError as e:
+        print(f"❌ YUV pipe test failed: {e}")
+        sys.exit(1)
+    print("✅ YUV pipe tests passed!")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Slide Timeline
+Maps a timestamp to (slide index, transition alpha) in O(log n) via
+precomputed slide boundaries, and serves composited frames to any renderer
+(the moviepy writer, previews) while holding at most two decoded slides.
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+def vfr_frame_numbers(changes: List[int], total: int, transition_frames: int, hold_frames: int,
+                      start: int = 0, end: int = None) -> List[int]:
+    """Frames of start..end - 1 that a variable-frame-rate encode keeps.
+
+    changes are the frames where a slide change (crossfade) starts. Every
+    crossfade frame is kept, a held slide only every hold_frames frames, and
+    the first and last frame always, so the kept frames span the whole range.
+    """
+    end = total if end is None else end
+    total = max(total, end)
+    keep = []
+    hold_start = 0
+    for change in list(changes) + [total]:
+        keep.extend(range(hold_start, change, max(1, hold_frames)))
+        if change < total:
+            keep.extend(range(change, min(change + max(1, transition_frames), total)))
+            hold_start = max(hold_start, change + max(1, transition_frames))
+    return sorted({k for k in keep if start <= k < end} | {start, end - 1})
+
+
+class SlideTimeline:
+    """Timeline of still slides with crossfades at the slide boundaries.
+
+    Slide i is shown from starts[i] to starts[i] + durations[i]. During the
+    first transition_duration seconds of every slide but the first, it fades
+    in over the previous slide, so slide boundaries never move.
+    
+    Only frames inside a transition are composited, with 8-bit fixed-point
+    weights from a precomputed alpha table; all other frames are the cached
+    still slide returned untouched.
+    """
+
+    def __init__(self, frames: Sequence[np.ndarray], durations: List[float],
+                 transition_duration: float = 0.0, fps: float = 24):
+        if not durations:
+            raise ValueError("Timeline needs at least one slide")
+        if len(frames) != len(durations):
+            raise ValueError("Timeline needs exactly one duration per slide")
+        self.frames = frames
+        self.durations = list(durations)
+        self.transition_duration = max(0.0, min(transition_duration, min(self.durations)))
+        self.fps = fps
+
+        # One weight (out of 256) for the incoming slide per transition frame
+        self.transition_steps = max(1, int(round(self.transition_duration * fps)))
+        self.alpha_table = np.array([(256 * step) // self.transition_steps
+                                     for step in range(self.transition_steps)], dtype=np.uint16)
+        self._blend_buffers = None
+
+        # Precomputed slide start times for bisect lookups
+        self.starts = []
+        position = 0.0
+        for duration in self.durations:
+            self.starts.append(position)
+            position += duration
+        self.duration = position
+
+        # Decoded slides currently in use, at most the two active ones
+        self._active = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def frame_boundaries(self, fps: float = None) -> List[int]:
+        """Slide start frames snapped to the frame grid, plus the total frame count."""
+        fps = fps or self.fps
+        return [int(round(start * fps)) for start in self.starts] + [int(round(self.duration * fps))]
+
+    def keyframe_times(self, start: int = 0, end: int = None) -> List[float]:
+        """Slide change times (seconds) inside frames start..end - 1, relative to start."""
+        boundaries = self.frame_boundaries()
+        end = boundaries[-1] if end is None else end
+        return [(boundary - start) / self.fps for boundary in boundaries[1:-1] if start < boundary < end]
+
+    def vfr_frames(self, hold_frames: int, start: int = 0, end: int = None) -> List[int]:
+        """Frames a variable-frame-rate encode of start..end - 1 needs (see vfr_frame_numbers)."""
+        boundaries = self.frame_boundaries()
+        transition_frames = self.transition_steps if self.transition_duration > 0 else 1
+        return vfr_frame_numbers(boundaries[1:-1], boundaries[-1], transition_frames, hold_frames,
+                                 start, end)
+
+    def locate(self, t: float) -> Tuple[int, float]:
+        """Return (slide index, alpha) for time t.
+
+        alpha is the weight of the slide over its predecessor: 1.0 outside of
+        transitions, rising from 0.0 to 1.0 during a crossfade.
+        """
+        index = bisect_right(self.starts, t) - 1
+        index = max(0, min(index, len(self.starts) - 1))
+        local_time = t - self.starts[index]
+        if index > 0 and local_time < self.transition_duration:
+            return index, max(0.0, local_time / self.transition_duration)
+        return index, 1.0
+
+    def slide(self, index: int) -> np.ndarray:
+        """Return slide index decoded in memory, releasing slides no longer active."""
+        frame = self._active.get(index)
+        if frame is None:
+            frame = self.load_slide(index)
+            # A crossfade needs this slide and a neighbour; anything else is
+            # released (slides streamed from a SlidePipeline are only valid
+            # while they're inside its window)
+            for old in [i for i in self._active if abs(i - index) > 1]:
+                del self._active[old]
+            self._active[index] = frame
+            while len(self._active) > 2:
+                self._active.popitem(last=False)
+        else:
+            self._active.move_to_end(index)
+        return frame
+
+    def load_slide(self, index: int) -> np.ndarray:
+        """Decode slide index for the active set (subclasses may convert it)."""
+        frame = self.frames[index]
+        if isinstance(frame, np.memmap) or not isinstance(frame, np.ndarray):
+            return np.array(frame)  # Copy memory-mapped slides into RAM
+        return frame  # In-memory and shared-memory slides are read in place
+
+    def blend(self, previous: np.ndarray, current: np.ndarray, weight: int) -> np.ndarray:
+        """Crossfade two slides; weight (0-255) is the share of current out of 256.
+
+        Uses uint16 integer arithmetic in preallocated buffers:
+        (previous * (256 - weight) + current * weight + 128) >> 8
+        """
+        if self._blend_buffers is None or self._blend_buffers[0].shape != current.shape:
+            self._blend_buffers = (np.empty(current.shape, dtype=np.uint16),
+                                   np.empty(current.shape, dtype=np.uint16))
+        mixed, scratch = self._blend_buffers
+        np.multiply(previous, 256 - int(weight), out=mixed, dtype=np.uint16)
+        np.multiply(current, int(weight), out=scratch, dtype=np.uint16)
+        mixed += scratch
+        mixed += 128
+        mixed >>= 8
+        return mixed.astype(np.uint8)
+
+    def get_frame(self, t: float) -> np.ndarray:
+        """Return the frame shown at time t (RGB unless load_slide converts slides)."""
+        index, alpha = self.locate(t)
+        current = self.slide(index)
+        if alpha >= 1.0:
+            return current
+        # Frame number within the transition (epsilon absorbs float error in t)
+        step = min(int(alpha * self.transition_steps + 1e-6), self.transition_steps - 1)
+        return self.blend(self.slide(index - 1), current, self.alpha_table[step])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Output Variants
+The resolutions and fill modes an episode is published in (e.g. landscape
+1920x1080, vertical 1080x1920 and square 1080x1080) and the file each
+variant is written to.
+"""
+
+import os
+from typing import List, NamedTuple, Tuple
+
+# How images are fitted to the frame: letterboxed, cropped to fill, or over a blurred copy
+FILL_MODES = ("fit", "fill", "blur")
+
+
+class Variant(NamedTuple):
+    """One output of an episode: frame size and how the slides fill it."""
+    resolution: Tuple[int, int]
+    fill_mode: str = "fit"
+
+    @property
+    def name(self) -> str:
+        return f"{self.resolution[0]}x{self.resolution[1]}"
+
+
+# Named variants for the usual publishing formats
+VARIANT_PRESETS = {
+    "landscape": Variant((1920, 1080), "fit"),
+    "vertical": Variant((1080, 1920), "blur"),
+    "square": Variant((1080, 1080), "blur"),
+}
+
+
+def parse_variants(spec: str) -> List[Variant]:
+    """Parse a comma-separated list of WIDTHxHEIGHT[:fill mode] or preset names.
+
+    e.g. "landscape,vertical,square" or "1920x1080,1080x1920:blur,1080x1080:fill".
+    """
+    variants = []
+    for item in (part.strip() for part in spec.split(",")):
+        if not item:
+            continue
+        if item in VARIANT_PRESETS:
+            variant = VARIANT_PRESETS[item]
+        else:
+            size, _, fill_mode = item.partition(":")
+            try:
+                width, height = map(int, size.lower().split("x"))
+            except ValueError:
+                raise ValueError(f"Invalid variant '{item}': use WIDTHxHEIGHT[:{'|'.join(FILL_MODES)}] "
+                                 f"or one of: {', '.join(VARIANT_PRESETS)}") from None
+            if width <= 0 or height <= 0:
+                raise ValueError(f"Invalid variant '{item}': width and height must be positive")
+            fill_mode = fill_mode or "fit"
+            if fill_mode not in FILL_MODES:
+                raise ValueError(f"Invalid fill mode '{fill_mode}' in '{item}'; choose from: {', '.join(FILL_MODES)}")
+            variant = Variant((width, height), fill_mode)
+        if variant in variants:
+            raise ValueError(f"Variant {variant.name} ({variant.fill_mode}) is listed twice")
+        variants.append(variant)
+    if not variants:
+        raise ValueError("No variants given")
+    return variants
+
+
+def variant_output_path(output_path: str, variant: Variant, variants: List[Variant]) -> str:
+    """Output file of a variant: episode.mp4 -> episode_1080x1920.mp4.
+
+    The fill mode is added when another variant has the same resolution.
+    """
+    root, ext = os.path.splitext(output_path)
+    name = variant.name
+    if sum(1 for other in variants if other.resolution == variant.resolution) > 1:
+        name += f"_{variant.fill_mode}"
+    return f"{root}_{name}{ext or '.mp4'}"
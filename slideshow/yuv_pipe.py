@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+YUV Frame Pipe
+Feeds composited frames to ffmpeg as raw planar YUV420 (yuv420p) instead of
+RGB24. Every slide is converted to YUV once with BT.709 coefficients, still
+frames reuse those bytes as-is and crossfades are blended directly in YUV,
+so ffmpeg neither converts pixel formats nor reads twice as many bytes.
+"""
+
+import os
+import subprocess
+import tempfile
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from ffmpeg_renderer import FFmpegRenderer, ffmpeg_error
+from timeline import SlideTimeline
+
+# BT.709 luma coefficients
+KR, KB = 0.2126, 0.0722
+KG = 1.0 - KR - KB
+
+# RGB (0-255) to limited-range ("TV") Y'CbCr: Y in 16-235, Cb/Cr in 16-240
+LUMA_WEIGHTS = np.array([KR, KG, KB], dtype=np.float32) * (219 / 255)
+CHROMA_WEIGHTS = np.array([
+    [-KR / (2 * (1 - KB)), -KG / (2 * (1 - KB)), 0.5],  # Cb
+    [0.5, -KG / (2 * (1 - KR)), -KB / (2 * (1 - KR))],  # Cr
+], dtype=np.float32).T * (224 / 255)
+
+# Tags for the encoded stream so players decode with the same matrix
+COLOR_ARGS = ["-color_range", "tv", "-colorspace", "bt709",
+              "-color_primaries", "bt709", "-color_trc", "bt709"]
+
+
+def yuv420_frame_size(width: int, height: int) -> int:
+    """Bytes in one yuv420p frame: a full-size Y plane and quarter-size U and V planes."""
+    return width * height * 3 // 2
+
+
+def rgb_to_yuv420(frame: np.ndarray) -> np.ndarray:
+    """Convert an RGB frame to a flat yuv420p buffer (Y plane, then U, then V).
+
+    Chroma is taken from the average of each 2x2 block of pixels, so the
+    width and height must be even.
+    """
+    height, width = frame.shape[:2]
+    if width % 2 or height % 2:
+        raise ValueError(f"YUV420 frames need an even width and height, got {width}x{height}")
+    rgb = np.asarray(frame, dtype=np.float32)
+    out = np.empty(yuv420_frame_size(width, height), dtype=np.uint8)
+    luma_size = width * height
+
+    luma = rgb @ LUMA_WEIGHTS
+    luma += 16.5  # Offset plus 0.5 so truncation rounds
+    np.clip(luma, 0, 255, out=luma)
+    out[:luma_size] = luma.reshape(-1)
+
+    block_means = rgb.reshape(height // 2, 2, width // 2, 2, 3).mean(axis=(1, 3))
+    chroma = block_means @ CHROMA_WEIGHTS
+    chroma += 128.5
+    np.clip(chroma, 0, 255, out=chroma)
+    chroma_size = luma_size // 4
+    out[luma_size:luma_size + chroma_size] = chroma[..., 0].reshape(-1)
+    out[luma_size + chroma_size:] = chroma[..., 1].reshape(-1)
+    return out
+
+
+class YUVTimeline(SlideTimeline):
+    """SlideTimeline that serves flat yuv420p buffers instead of RGB frames.
+
+    Each slide is converted once when it becomes active; every still frame
+    of it is the same buffer. The crossfade blend is linear, so blending
+    the YUV bytes gives the YUV of the blended RGB frame (up to rounding).
+    """
+
+    def load_slide(self, index: int) -> np.ndarray:
+        return rgb_to_yuv420(self.frames[index])
+
+
+class YUVPipeEncoder:
+    """Encode frames of a YUVTimeline by piping them into ffmpeg as rawvideo."""
+
+    def __init__(self, renderer: FFmpegRenderer, resolution: Tuple[int, int]):
+        self.renderer = renderer
+        self.width, self.height = resolution
+        if self.width % 2 or self.height % 2:
+            raise ValueError(f"YUV420 output needs an even width and height, got {self.width}x{self.height}")
+
+    def build_command(self, output_path: str, filter_path: str = None,
+                      keyframe_times: List[float] = None, duration: float = None) -> list:
+        """ffmpeg command reading yuv420p frames from stdin and writing a video-only MP4.
+
+        filter_path names a video filter script (e.g. the VFR frame timing);
+        keyframe_times (seconds of a video duration long) get forced keyframes.
+        """
+        cmd = [self.renderer.ffmpeg, "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "yuv420p",
+               "-s", f"{self.width}x{self.height}", "-r", str(self.renderer.fps)] + \
+            COLOR_ARGS + ["-i", "pipe:0"]
+        if filter_path:
+            cmd += ["-filter_script:v", filter_path]
+        return cmd + self.renderer.video_codec_args() + \
+            self.renderer.keyframe_args(keyframe_times or [], duration) + COLOR_ARGS + \
+            ["-movflags", "+faststart", os.path.abspath(output_path)]
+
+    def encode(self, timeline: YUVTimeline, start_frame: int, end_frame: int, output_path: str,
+               progress_callback=None, progress_range: Tuple[float, float] = (85, 95),
+               message: str = "Rendering video", log_path: str = None):
+        """Encode frames start_frame..end_frame - 1 (frame k shows time k / fps).
+
+        With a VFR renderer only the frames that change the picture (and one
+        every hold interval) are composited and piped, each keeping its time.
+        If progress_callback raises (e.g. the GUI's Stop button), ffmpeg is
+        killed and the error re-raised. Slide changes get keyframes.
+        """
+        keyframe_times = timeline.keyframe_times(start_frame, end_frame)
+        duration = (end_frame - start_frame) / self.renderer.fps
+        if not self.renderer.vfr:
+            self.encode_frames(timeline, range(start_frame, end_frame), output_path, progress_callback,
+                               progress_range, message, log_path,
+                               keyframe_times=keyframe_times, duration=duration)
+            return
+        frame_numbers = timeline.vfr_frames(self.renderer.hold_frames, start_frame, end_frame)
+        fd, filter_path = tempfile.mkstemp(suffix=".txt", prefix="vfr_timing_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.renderer.vfr_setpts_filter([k - start_frame for k in frame_numbers]))
+            self.encode_frames(timeline, frame_numbers, output_path, progress_callback,
+                               progress_range, message, log_path, filter_path, keyframe_times, duration)
+        finally:
+            os.remove(filter_path)
+
+    def encode_frames(self, timeline: YUVTimeline, frame_numbers: Sequence[int], output_path: str,
+                      progress_callback=None, progress_range: Tuple[float, float] = (85, 95),
+                      message: str = "Rendering video", log_path: str = None,
+                      filter_path: str = None, keyframe_times: List[float] = None,
+                      duration: float = None):
+        """Encode the given timeline frames back to back (e.g. sampled windows).
+
+        filter_path, keyframe_times and duration are passed to build_command.
+        """
+        if not frame_numbers:
+            raise ValueError("No frames to encode")
+        fps = self.renderer.fps
+        total = len(frame_numbers)
+        # Produce the first frame before ffmpeg starts: worker processes forked
+        # later (e.g. by a SlidePipeline) would inherit its stdin and keep it open
+        first_frame = timeline.get_frame(frame_numbers[0] / fps)
+        log_file = open(log_path, "wb") if log_path else subprocess.DEVNULL
+        try:
+            process = subprocess.Popen(self.build_command(output_path, filter_path, keyframe_times, duration), stdin=subprocess.PIPE,
+                                       stdout=subprocess.DEVNULL, stderr=log_file)
+            last_percent = -1
+            try:
+                for n, k in enumerate(frame_numbers):
+                    # Still frames are the slide's cached buffer, written without copying
+                    frame = first_frame if n == 0 else timeline.get_frame(k / fps)
+                    process.stdin.write(frame)
+                    percent = (n + 1) * 100 // total
+                    if percent != last_percent and progress_callback:
+                        last_percent = percent
+                        start, end = progress_range
+                        progress_callback(f"{message}: {percent}%", start + (end - start) * percent / 100)
+                process.stdin.close()
+            except BrokenPipeError:
+                # ffmpeg exited early; its exit code and log say why
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            return_code = process.wait()
+        finally:
+            if log_path:
+                log_file.close()
+        if return_code != 0:
+            raise ffmpeg_error(return_code, log_path)